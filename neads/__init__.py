@@ -4,6 +4,6 @@ from neads.sequential_choices_model import SequentialChoicesModel, \
     ChoicesStep, DynamicStep, Choice, Separator, Extractor
 from neads.activation_model.plugin import Plugin, PluginID
 from neads.evaluation_manager import SingleThreadEvaluationManager, \
-    ComplexAlgorithm
+    ComplexAlgorithm, ProcessPoolEvaluationManager
 from neads.database import FileDatabase
 from neads.logging_autoconfig import configure_logging
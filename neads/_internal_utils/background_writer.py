@@ -0,0 +1,191 @@
+import queue
+import threading
+from typing import Callable, Optional
+
+import logging
+logger = logging.getLogger('neads.background_writer')
+
+
+class _PendingWrite:
+    """A write submitted to BackgroundWriter, which may not be done yet."""
+
+    def __init__(self, size):
+        self.size = size
+        self.done = threading.Event()
+        self.error: Optional[BaseException] = None
+
+
+class BackgroundWriter:
+    """Perform writes to files on a background thread.
+
+    The writes are submitted under a key (usually the path of the written
+    file) and are performed one by one in the order of submission. The queue
+    of the writes is bounded, so the submission blocks, if there are too
+    many writes pending (i.e. the caller cannot outrun the disk
+    indefinitely).
+
+    Until a write is done, the written object is kept alive by the writer.
+    Its size is counted in `in_flight_bytes`, so it can be accounted in the
+    used memory.
+
+    A reader of the file must call `wait` with the file's key first, so it
+    does not read an incomplete file. The `wait` also raises the exception
+    of a failed write.
+
+    The writer forgets a write (and so its key) as soon as it is done
+    successfully. Only the failed writes are kept until their exception is
+    raised by `wait` or `flush`. Thus, the keys are supposed to be small
+    (e.g. paths or ids), they need not be kept alive by the writer.
+    """
+
+    def __init__(self, max_pending: int = 4):
+        """Initialize the BackgroundWriter and start its thread.
+
+        Parameters
+        ----------
+        max_pending
+            The maximal number of writes waiting in the queue. If the queue
+            is full, the submission blocks until a write is done.
+        """
+
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        # The last write for each key, which is not done or which failed
+        self._pending: dict[object, _PendingWrite] = {}
+        self._in_flight_bytes = 0
+        self._is_closed = False
+        self._thread = threading.Thread(target=self._write_continuously,
+                                        name='neads_background_writer',
+                                        daemon=True)
+        self._thread.start()
+
+    @property
+    def in_flight_bytes(self) -> int:
+        """The total size of objects whose writes are not done yet."""
+        return self._in_flight_bytes
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the writer was closed."""
+        return self._is_closed
+
+    def submit(self, key, write: Callable[[], None], size: int = 0):
+        """Submit a write to be performed on the background thread.
+
+        Parameters
+        ----------
+        key
+            The key of the write, usually the path of the written file.
+            A later write under the same key overwrites the earlier one.
+        write
+            The function which performs the write. It holds the written
+            object.
+        size
+            The size of the written object in bytes.
+
+        Raises
+        ------
+        RuntimeError
+            If the writer was closed.
+        """
+
+        if self._is_closed:
+            raise RuntimeError('Cannot submit a write to closed writer.')
+
+        pending_write = _PendingWrite(size)
+        with self._lock:
+            self._pending[key] = pending_write
+            self._in_flight_bytes += size
+        self._queue.put((key, pending_write, write))
+
+    def wait(self, key):
+        """Wait until the last write under the key is done.
+
+        If there is no write under the key, return immediately.
+
+        Parameters
+        ----------
+        key
+            The key of the write.
+
+        Raises
+        ------
+        Exception
+            The exception raised by the write, if it failed.
+        """
+
+        with self._lock:
+            pending_write = self._pending.get(key)
+        if pending_write is not None:
+            pending_write.done.wait()
+            with self._lock:
+                # A newer write may have been submitted meanwhile
+                if self._pending.get(key) is pending_write:
+                    del self._pending[key]
+            if pending_write.error is not None:
+                raise pending_write.error
+
+    def flush(self):
+        """Wait until all submitted writes are done.
+
+        Raises
+        ------
+        Exception
+            The exception of the first failed write, which was not raised
+            yet.
+        """
+
+        self._queue.join()
+        with self._lock:
+            # Only the failed writes remain (and those submitted meanwhile)
+            failed_writes = [pending_write
+                             for pending_write in self._pending.values()
+                             if pending_write.done.is_set()]
+            self._pending = {key: pending_write
+                             for key, pending_write in self._pending.items()
+                             if not pending_write.done.is_set()}
+        for pending_write in failed_writes:
+            raise pending_write.error
+
+    def close(self):
+        """Flush the writes and stop the thread.
+
+        Raises
+        ------
+        Exception
+            The exception of the first failed write, which was not raised
+            yet.
+        """
+
+        if self._is_closed:
+            return
+        self._is_closed = True
+        try:
+            self.flush()
+        finally:
+            self._queue.put(None)
+            self._thread.join()
+
+    def _write_continuously(self):
+        """Perform the submitted writes until the writer is closed."""
+
+        while (item := self._queue.get()) is not None:
+            key, pending_write, write = item
+            try:
+                write()
+            except BaseException as e:
+                logger.warning(f'Background write failed: {e!r}.')
+                pending_write.error = e
+            finally:
+                # Release the written object
+                del item, write
+                with self._lock:
+                    self._in_flight_bytes -= pending_write.size
+                    # The successful write is forgotten right away (unless
+                    # a newer write was submitted under the key meanwhile)
+                    if pending_write.error is None \
+                            and self._pending.get(key) is pending_write:
+                        del self._pending[key]
+                pending_write.done.set()
+                self._queue.task_done()
+        self._queue.task_done()
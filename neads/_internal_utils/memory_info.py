@@ -5,6 +5,11 @@
 # provide more specific information than process usage). Thus, the interface
 # would make no difference.
 
+from typing import Any, Callable, Optional
+import itertools
+import os
+import sys
+
 import pympler.asizeof
 import psutil
 
@@ -53,18 +58,127 @@ def get_available_memory():
     return psutil.virtual_memory().available
 
 
+# Files with the memory limit and usage of the process's cgroup
+# The first existing pair is used (cgroup v2, then v1)
+CGROUP_MEMORY_FILES = [
+    ('/sys/fs/cgroup/memory.max', '/sys/fs/cgroup/memory.current'),
+    ('/sys/fs/cgroup/memory/memory.limit_in_bytes',
+     '/sys/fs/cgroup/memory/memory.usage_in_bytes'),
+]
+# Larger limits mean no limit in cgroup v1 (it reports a huge number)
+_CGROUP_UNLIMITED = 2**60
+
+
+def get_cgroup_memory_limit() -> Optional[int]:
+    """Return the memory limit of the process's cgroup (e.g. container).
+
+    Returns
+    -------
+        The limit in bytes or None, if the cgroup does not limit memory or
+        the limit cannot be read.
+    """
+
+    if (files := _get_cgroup_memory_files()) is None:
+        return None
+    limit = _read_cgroup_value(files[0])
+    if limit is None or limit >= _CGROUP_UNLIMITED:
+        return None
+    return limit
+
+
+def get_cgroup_memory_usage() -> Optional[int]:
+    """Return the memory used by the process's cgroup (e.g. container).
+
+    The usage covers all processes in the cgroup, including the page cache
+    charged to the cgroup.
+
+    Returns
+    -------
+        The usage in bytes or None, if it cannot be read.
+    """
+
+    if (files := _get_cgroup_memory_files()) is None:
+        return None
+    return _read_cgroup_value(files[1])
+
+
+def _get_cgroup_memory_files():
+    """Return the pair of limit and usage files of cgroup, if they exist."""
+
+    for limit_file, usage_file in CGROUP_MEMORY_FILES:
+        if os.path.exists(limit_file) and os.path.exists(usage_file):
+            return limit_file, usage_file
+    return None
+
+
+def _read_cgroup_value(filename) -> Optional[int]:
+    """Read a number from the cgroup file, None for 'max' or an error."""
+
+    try:
+        with open(filename) as f:
+            content = f.read().strip()
+    except OSError:
+        return None
+    return int(content) if content.isdigit() else None
+
+
+# Containers up to this length are sized element by element
+EXACT_SIZE_LIMIT = 1024
+# Number of elements whose size is measured in larger containers
+SAMPLE_SIZE = 64
+# Nesting of containers, from which the sizing is left to pympler
+# It also protects the sizing from cyclic references
+MAX_SIZING_DEPTH = 8
+
+# Sizers registered for types
+_sizers: dict[type, Callable[[Any], int]] = {}
+# Sizers registered for fully qualified names of types, so the modules of the
+# types need not be imported (e.g. pandas, whose import is slow)
+_lazy_sizers: dict[str, Callable[[Any], int]] = {}
+# Sizers found for the types of sized objects (None if there is no sizer)
+_sizer_cache: dict[type, Optional[Callable[[Any], int]]] = {}
+
+
+def register_sizer(cls, sizer: Callable[[Any], int]):
+    """Register a function which returns size of instances of the type.
+
+    The sizer is used also for the instances of subclasses of the type
+    (unless they have their own sizer).
+
+    Parameters
+    ----------
+    cls
+        The type whose instances the sizer measures. It may be also given by
+        its fully qualified name (e.g. 'numpy.ndarray'). Then, the module of
+        the type does not have to be imported.
+    sizer
+        Function which returns (an estimate of) the number of bytes used by
+        the given instance of the type.
+    """
+
+    if isinstance(cls, str):
+        _lazy_sizers[cls] = sizer
+    else:
+        _sizers[cls] = sizer
+    _sizer_cache.clear()
+
+
 def get_object_size(*objs):
     """Return number of bytes used by the given objects.
 
     The consumption is computed recursively (on subobjects, i.e. referents).
-    The size of repeatedly visited referents is counted only once.
+    For the objects of types with registered sizer (such as numpy arrays,
+    pandas objects or networkx graphs, see `register_sizer`), the sizer is
+    used. Large builtin containers are estimated from a sample of their
+    elements. The other objects are measured by `pympler.asizeof`.
 
     Single object is considered alone, not as being a member of a list in
     which the objects are ordinarily passed to the method.
 
     Note that some of the subobjects may not be referenced exclusively by
     the given objects. Thus, deletion of the objects may not result
-    in deletion of all their subobjects.
+    in deletion of all their subobjects. Also, a subobject referenced
+    repeatedly may be counted more than once.
 
     Parameters
     ----------
@@ -76,7 +190,186 @@ def get_object_size(*objs):
         Number of bytes used by the given objects.
     """
 
-    if len(objs) == 1:
-        return pympler.asizeof.asizeof(objs[0])
+    return sum(_get_size(obj, 0) for obj in objs)
+
+
+def _get_size(obj, depth):
+    """Return number of bytes used by the object.
+
+    Parameters
+    ----------
+    obj
+        The object whose size is returned.
+    depth
+        Nesting of the object in containers which are being sized.
+
+    Returns
+    -------
+        Number of bytes used by the object.
+    """
+
+    if (sizer := _find_sizer(type(obj))) is not None:
+        return sizer(obj)
+    elif depth < MAX_SIZING_DEPTH and isinstance(obj, (list, tuple)):
+        return _get_sequence_size(obj, depth)
+    elif depth < MAX_SIZING_DEPTH and isinstance(obj, (dict, set, frozenset)):
+        return _get_collection_size(obj, depth)
     else:
-        return pympler.asizeof.asizeof(objs)
+        return pympler.asizeof.asizeof(obj)
+
+
+def _find_sizer(cls):
+    """Find the registered sizer for the type.
+
+    Returns
+    -------
+        The sizer registered for the type or its closest base class. None, if
+        there is no such sizer.
+    """
+
+    try:
+        return _sizer_cache[cls]
+    except KeyError:
+        pass
+
+    sizer = None
+    for base in cls.__mro__:
+        name = f'{base.__module__}.{base.__qualname__}'
+        if (sizer := _sizers.get(base, _lazy_sizers.get(name))) is not None:
+            break
+    _sizer_cache[cls] = sizer
+    return sizer
+
+
+def _get_sample_indices(length):
+    """Return evenly spaced indices of at most `SAMPLE_SIZE` elements."""
+    step = max(length // SAMPLE_SIZE, 1)
+    return range(0, length, step)
+
+
+def _get_sequence_size(sequence, depth):
+    """Return size of a list or tuple, estimated for the long ones."""
+
+    if len(sequence) <= EXACT_SIZE_LIMIT:
+        elements_size = sum(_get_size(element, depth + 1)
+                            for element in sequence)
+    else:
+        indices = _get_sample_indices(len(sequence))
+        sample_size = sum(_get_size(sequence[idx], depth + 1)
+                          for idx in indices)
+        elements_size = sample_size * len(sequence) // len(indices)
+    return sys.getsizeof(sequence) + elements_size
+
+
+def _get_collection_size(collection, depth):
+    """Return size of a dict or set, estimated for the large ones."""
+
+    items = collection.items() if isinstance(collection, dict) \
+        else collection
+    if len(collection) <= EXACT_SIZE_LIMIT:
+        sample = items
+        sample_count = len(collection)
+    else:
+        step = len(collection) // SAMPLE_SIZE
+        sample = list(itertools.islice(items, 0, None, step))
+        sample_count = len(sample)
+
+    # The dict items are tuples, which do not exist in the collection
+    item_overhead = sys.getsizeof((None, None)) \
+        if isinstance(collection, dict) \
+        else 0
+    sample_size = sum(_get_size(item, depth + 1) - item_overhead
+                      for item in sample)
+    elements_size = sample_size * len(collection) // sample_count \
+        if sample_count else 0
+    return sys.getsizeof(collection) + elements_size
+
+
+def _get_elements_size(get_element, length):
+    """Estimate the size of elements of an array of Python objects.
+
+    Parameters
+    ----------
+    get_element
+        Function which returns the element of the array on the given index.
+    length
+        Number of elements of the array.
+
+    Returns
+    -------
+        Estimated size of the elements (without the array of pointers).
+    """
+
+    if not length:
+        return 0
+    indices = _get_sample_indices(length)
+    sample_size = sum(_get_size(get_element(idx), 1) for idx in indices)
+    return sample_size * length // len(indices)
+
+
+def _get_atomic_size(obj):
+    """Return size of an object without referents (e.g. int or str).
+
+    The size is aligned the same way as by `pympler.asizeof`.
+    """
+
+    return (sys.getsizeof(obj) + 7) & ~7
+
+
+def _get_ndarray_size(array):
+    """Return size of numpy array.
+
+    The size of the buffer is counted for views as well.
+    """
+
+    size = sys.getsizeof(array)
+    if array.base is not None:
+        size += array.nbytes
+    if array.dtype.hasobject:
+        size += _get_elements_size(array.flat.__getitem__, array.size)
+    return size
+
+
+def _get_pandas_object_size(pandas_object):
+    """Return size of pandas DataFrame or Series.
+
+    The memory usage reported by pandas is used. The size of Python objects
+    in object columns is estimated from a sample.
+    """
+
+    usage = pandas_object.memory_usage(index=True, deep=False)
+    size = int(usage.sum()) if pandas_object.ndim == 2 else int(usage)
+
+    if pandas_object.ndim == 2:
+        columns = [column for _, column in pandas_object.items()]
+    else:
+        columns = [pandas_object]
+    for column in columns:
+        if column.dtype.kind == 'O':
+            size += _get_elements_size(column.iat.__getitem__, len(column))
+    index = pandas_object.index
+    if index.dtype.kind == 'O':
+        size += _get_elements_size(index.__getitem__, len(index))
+    return size
+
+
+def _get_networkx_graph_size(graph):
+    """Return size of networkx graph.
+
+    The size of the adjacency structure is estimated from a sample of nodes.
+    """
+
+    # The graph's dicts are nested at most 4 times (MultiGraph's adjacency)
+    structures = [graph.graph, graph._node, graph._adj]
+    if graph.is_directed():
+        structures.append(graph._pred)
+    return sys.getsizeof(graph) \
+        + sum(_get_collection_size(structure, MAX_SIZING_DEPTH - 4)
+              for structure in structures)
+
+
+for atomic_type in [int, float, complex, str, bytes, type(None)]:
+    register_sizer(atomic_type, _get_atomic_size)
+register_sizer('numpy.ndarray', _get_ndarray_size)
+register_sizer('pandas.core.generic.NDFrame', _get_pandas_object_size)
+register_sizer('networkx.classes.graph.Graph', _get_networkx_graph_size)
@@ -1,10 +1,12 @@
 import os
 import tempfile
 import weakref
+from typing import Optional
 
 
 from neads._internal_utils.serializers.i_iserializer import ISerializer
 from neads._internal_utils.serializers.pickle_serializer import PickleSerializer
+from neads._internal_utils.background_writer import BackgroundWriter
 
 
 # TODO: Add IObjectTempFileProvider class which will create IObjectTempFile
@@ -39,6 +41,15 @@ def _remove_if_exists(path):
         os.remove(path)
 
 
+def _remove_after_write(path, writer):
+    # The pending write would create the file again
+    try:
+        writer.wait(path)
+    except Exception:
+        pass
+    _remove_if_exists(path)
+
+
 class ObjectTempFile:
     """Simple temp-file for loading and storing objects via custom serializer.
 
@@ -57,12 +68,17 @@ class ObjectTempFile:
     Thus, it is very reliable that the disk resources are released if no
     longer needed (unlike with __del__ statement in some Python
     implementations).
+
+    If a BackgroundWriter is given, the object is saved on the writer's
+    thread and `save` returns right away. The `load` then waits until the
+    save is done.
     """
 
     PATH_GENERATOR = _get_temp_path
 
     def __init__(self, *, path=None,
-                 serializer: ISerializer = PickleSerializer()):
+                 serializer: ISerializer = PickleSerializer(),
+                 writer: Optional[BackgroundWriter] = None):
         """Create new TempFile instance.
 
         Parameters
@@ -80,11 +96,21 @@ class ObjectTempFile:
             method.
 
             By default, PickleSerializer is used.
+
+        writer
+            BackgroundWriter which performs the saves. By default, the
+            saves are synchronous.
         """
 
         self._path = path if path is not None else type(self).PATH_GENERATOR()
         self._serializer = serializer
-        self._finalizer = weakref.finalize(self, _remove_if_exists, self._path)
+        self._writer = writer
+        if writer is None:
+            self._finalizer = weakref.finalize(self, _remove_if_exists,
+                                               self._path)
+        else:
+            self._finalizer = weakref.finalize(self, _remove_after_write,
+                                               self._path, writer)
         self._is_object_present = False
 
     def load(self):
@@ -105,19 +131,25 @@ class ObjectTempFile:
 
         if not self.is_disposed:
             if self._is_object_present:
+                if self._writer is not None:
+                    self._writer.wait(self._path)
                 return self._serializer.load(self._path)
             else:
                 raise RuntimeError(f'Cannot load from file without object.')
         else:
             raise RuntimeError(f'The file at {self._path} were disposed.')
 
-    def save(self, obj):
+    def save(self, obj, size: int = 0):
         """Save the object to the the file.
 
         Parameters
         ----------
         obj
             Object to save in the file.
+        size
+            Size of the object in bytes, which is accounted as in-flight
+            in the BackgroundWriter until the save is done. Relevant only
+            with a writer.
 
         Raises
         ------
@@ -126,7 +158,14 @@ class ObjectTempFile:
         """
 
         if not self.is_disposed:
-            self._serializer.save(obj, self._path)
+            if self._writer is not None:
+                self._writer.submit(
+                    self._path,
+                    lambda: self._serializer.save(obj, self._path),
+                    size
+                )
+            else:
+                self._serializer.save(obj, self._path)
             self._is_object_present = True
         else:
             raise RuntimeError(f'The file at {self._path} were disposed.')
@@ -0,0 +1,150 @@
+"""Provide read-only views of objects, so they can be shared without copy."""
+
+from typing import Any, Callable, Optional
+import copy as copy_module
+import types
+
+
+# Types whose instances cannot be modified, so they are shared as they are
+IMMUTABLE_TYPES = (int, float, complex, str, bytes, bool, range, frozenset,
+                   type(None), type(Ellipsis), types.FunctionType,
+                   types.BuiltinFunctionType)
+
+# Viewers registered for types
+_viewers: dict[type, Callable[[Any], Any]] = {}
+# Viewers registered for fully qualified names of types, so the modules of
+# the types need not be imported (e.g. pandas, whose import is slow)
+_lazy_viewers: dict[str, Callable[[Any], Any]] = {}
+# Viewers found for the types of viewed objects (None if there is no viewer)
+_viewer_cache: dict[type, Optional[Callable[[Any], Any]]] = {}
+
+
+def register_read_only_viewer(cls, viewer: Callable[[Any], Any]):
+    """Register a function which returns read-only view of the type.
+
+    The viewer is used also for the instances of subclasses of the type
+    (unless they have their own viewer).
+
+    Parameters
+    ----------
+    cls
+        The type whose instances the viewer handles. It may be also given by
+        its fully qualified name (e.g. 'numpy.ndarray'). Then, the module of
+        the type does not have to be imported.
+    viewer
+        Function which returns an object equal to the given instance of the
+        type, which shares its data, but does not allow their modification.
+        If it is not possible for the instance, the viewer may return its
+        deepcopy.
+    """
+
+    if isinstance(cls, str):
+        _lazy_viewers[cls] = viewer
+    else:
+        _viewers[cls] = viewer
+    _viewer_cache.clear()
+
+
+def get_read_only_view(obj):
+    """Return a read-only view of the object, or its deepcopy.
+
+    The immutable objects are returned as they are. Tuples are viewed
+    element by element. For the objects of types with registered viewer
+    (such as numpy arrays, pandas objects or networkx graphs, see
+    `register_read_only_viewer`), the viewer is used. The other objects
+    (e.g. lists or dicts, which cannot be made read-only) are deep-copied.
+
+    Thus, the modification of the returned object either raises an
+    exception or does not affect the given object.
+
+    Parameters
+    ----------
+    obj
+        The object whose view is returned.
+
+    Returns
+    -------
+        The read-only view of the object or its deepcopy.
+    """
+
+    if isinstance(obj, IMMUTABLE_TYPES):
+        return obj
+    elif (viewer := _find_viewer(type(obj))) is not None:
+        return viewer(obj)
+    elif type(obj) is tuple:
+        return tuple(get_read_only_view(element) for element in obj)
+    else:
+        return copy_module.deepcopy(obj)
+
+
+def _find_viewer(cls):
+    """Find the registered viewer for the type.
+
+    Returns
+    -------
+        The viewer registered for the type or its closest base class. None,
+        if there is no such viewer.
+    """
+
+    try:
+        return _viewer_cache[cls]
+    except KeyError:
+        pass
+
+    viewer = None
+    for base in cls.__mro__:
+        name = f'{base.__module__}.{base.__qualname__}'
+        if (viewer := _viewers.get(base, _lazy_viewers.get(name))) \
+                is not None:
+            break
+    _viewer_cache[cls] = viewer
+    return viewer
+
+
+def _view_ndarray(array):
+    """Return non-writeable view of numpy array.
+
+    The arrays of Python objects are copied, as their elements could be
+    modified anyway.
+    """
+
+    if array.dtype.hasobject:
+        return copy_module.deepcopy(array)
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+def _view_ndframe(frame):
+    """Return a shallow copy of pandas object, if it is copy-on-write.
+
+    With Copy-on-Write (always on since pandas 3.0), the modification of the
+    shallow copy copies the modified data first. Otherwise, the object is
+    deep-copied. That is also the case of pandas older than 1.5, which do
+    not have Copy-on-Write at all.
+    """
+
+    import pandas as pd
+
+    # The option is missing before pandas 1.5 (OptionError is AttributeError)
+    # and deprecated since pandas 3.0
+    if int(pd.__version__.split('.')[0]) >= 3 \
+            or getattr(pd.options.mode, 'copy_on_write', False) is True:
+        return frame.copy(deep=False)
+    else:
+        return copy_module.deepcopy(frame)
+
+
+def _view_graph(graph):
+    """Return frozen view of networkx graph.
+
+    The structure of the graph cannot be modified. Note that the attribute
+    dictionaries (of the graph, nodes and edges) are shared.
+    """
+
+    return graph.copy(as_view=True)
+
+
+register_read_only_viewer('numpy.ndarray', _view_ndarray)
+register_read_only_viewer('pandas.core.generic.NDFrame', _view_ndframe)
+register_read_only_viewer('networkx.classes.graph.Graph', _view_graph)
@@ -1,2 +1,6 @@
 from neads._internal_utils.serializers.i_iserializer import ISerializer
 from neads._internal_utils.serializers.pickle_serializer import PickleSerializer
+from neads._internal_utils.serializers.memory_map_serializer import \
+    MemoryMapSerializer
+from neads._internal_utils.serializers.compressing_serializer import \
+    CompressingSerializer
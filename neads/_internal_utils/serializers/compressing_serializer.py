@@ -0,0 +1,190 @@
+from typing import Any, Optional, Union
+import lzma
+import pickle as pkl
+import zlib
+
+from .i_iserializer import ISerializer, PathLike
+
+
+_COMPRESSORS = {
+    'none': lambda data, level: data,
+    'zlib': lambda data, level: zlib.compress(
+        data, level if level is not None else zlib.Z_DEFAULT_COMPRESSION
+    ),
+    'lzma': lambda data, level: lzma.compress(data, preset=level),
+}
+
+_DECOMPRESSORS = {
+    'none': lambda data: data,
+    'zlib': zlib.decompress,
+    'lzma': lzma.decompress,
+}
+
+# The codec is identified by a single byte in the file
+_CODEC_IDS = {'none': 0, 'zlib': 1, 'lzma': 2}
+_CODEC_NAMES = {codec_id: name for name, codec_id in _CODEC_IDS.items()}
+
+
+class CompressingSerializer(ISerializer):
+    """Serializer which writes compressed pickles.
+
+    The data are pickled and the pickle is compressed by a codec of the
+    standard library ('zlib' or 'lzma', or 'none' for no compression). The
+    codec may be chosen for each type of the data (e.g. lzma for large
+    text data), the default codec is used for the other types.
+
+    In the adaptive mode, the compressed pickle is written only if the
+    compression pays off (i.e. reaches the minimal ratio). Otherwise, the
+    plain pickle is written. After the compression of some type of data does
+    not pay off, the data of the type are not compressed for a few next
+    saves, so the time of useless compression is saved.
+
+    The codec is recorded in the file, so the files written with any
+    configuration can be loaded.
+    """
+
+    MAGIC = b'NDZ1'
+    # The number of saves of the type without trying to compress it, after
+    # the compression did not pay off
+    SKIP_COUNT = 8
+
+    def __init__(self, codec: str = 'zlib', *, level: Optional[int] = None,
+                 codecs_by_type: Optional[dict[Union[type, str], str]] = None,
+                 adaptive: bool = True, min_ratio: float = 1.2,
+                 min_size: int = 4096):
+        """Initialize the CompressingSerializer.
+
+        Parameters
+        ----------
+        codec
+            The default codec, one of 'zlib', 'lzma' and 'none'.
+        level
+            The level of compression passed to the codec (i.e. the preset
+            for lzma). By default, the codec's default level.
+        codecs_by_type
+            Maps types of the data to their codecs. The type may be given
+            also by its qualified name (e.g. 'pandas.core.frame.DataFrame'),
+            so the module need not be imported. Subclasses of the types
+            use the type's codec as well.
+        adaptive
+            Whether the plain pickle is written, if the compression does
+            not pay off.
+        min_ratio
+            The minimal ratio of the plain and compressed pickle size, for
+            which the compression pays off.
+        min_size
+            The pickles smaller than the size (in bytes) are not compressed.
+
+        Raises
+        ------
+        ValueError
+            If there is an unknown codec.
+        """
+
+        self._codec = self._check_codec(codec)
+        self._level = level
+        self._codecs_by_type = {
+            self._get_type_name(type_): self._check_codec(type_codec)
+            for type_, type_codec in (codecs_by_type or {}).items()
+        }
+        self._adaptive = adaptive
+        self._min_ratio = min_ratio
+        self._min_size = min_size
+        # The number of saves of the type left without compression
+        self._skips: dict[type, int] = {}
+
+    def save(self, data: Any, filename: PathLike):
+        """Save data into a file with the given name.
+
+        Parameters
+        ----------
+        data : Any
+            Data to save to the file.
+        filename : PathLike
+            Name of the file where the data will be saved.
+        """
+
+        stream = pkl.dumps(data, protocol=pkl.HIGHEST_PROTOCOL)
+        codec, payload = self._compress(type(data), stream)
+        with open(filename, 'wb') as f:
+            f.write(self.MAGIC)
+            f.write(bytes([_CODEC_IDS[codec]]))
+            f.write(payload)
+
+    def load(self, filename: PathLike) -> Any:
+        """Load and return data from a file with the given name.
+
+        Parameters
+        ----------
+        filename : PathLike
+            Name of the file from which the data will be loaded.
+
+        Returns
+        -------
+        Any
+            Loaded data, ie. content of the file.
+
+        Raises
+        ------
+        ValueError
+            If the file was not written by CompressingSerializer.
+        """
+
+        with open(filename, 'rb') as f:
+            header = f.read(len(self.MAGIC) + 1)
+            if len(header) != len(self.MAGIC) + 1 \
+                    or header[:len(self.MAGIC)] != self.MAGIC \
+                    or header[-1] not in _CODEC_NAMES:
+                raise ValueError(f'The file {filename} was not written by '
+                                 f'CompressingSerializer.')
+            payload = f.read()
+        stream = _DECOMPRESSORS[_CODEC_NAMES[header[-1]]](payload)
+        return pkl.loads(stream)
+
+    def _compress(self, data_type, stream):
+        """Compress the pickle of the data of the given type.
+
+        Returns
+        -------
+            The name of the used codec and the payload to write.
+        """
+
+        codec = self._get_codec(data_type)
+        if codec == 'none' or len(stream) < self._min_size:
+            return 'none', stream
+        if self._skips.get(data_type):
+            self._skips[data_type] -= 1
+            return 'none', stream
+
+        compressed = _COMPRESSORS[codec](stream, self._level)
+        if self._adaptive \
+                and len(stream) < self._min_ratio * len(compressed):
+            self._skips[data_type] = self.SKIP_COUNT
+            return 'none', stream
+        else:
+            self._skips.pop(data_type, None)
+            return codec, compressed
+
+    def _get_codec(self, data_type):
+        """Return the codec for the data of the given type."""
+
+        for cls in data_type.__mro__:
+            if (codec := self._codecs_by_type.get(self._get_type_name(cls))) \
+                    is not None:
+                return codec
+        return self._codec
+
+    @staticmethod
+    def _get_type_name(type_):
+        """Return the qualified name of the type (or the name itself)."""
+
+        if isinstance(type_, str):
+            return type_
+        return f'{type_.__module__}.{type_.__qualname__}'
+
+    @staticmethod
+    def _check_codec(codec):
+        if codec not in _CODEC_IDS:
+            raise ValueError(f'Unknown codec {codec!r}, use one of '
+                             f'{list(_CODEC_IDS)}.')
+        return codec
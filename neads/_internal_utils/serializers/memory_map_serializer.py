@@ -0,0 +1,138 @@
+from typing import Any
+import mmap
+import os
+import pickle as pkl
+import struct
+
+from .i_iserializer import ISerializer, PathLike
+
+
+class MemoryMapSerializer(ISerializer):
+    """Serializer which loads large buffers as read-only memory-mapped views.
+
+    The data are pickled by protocol 5 and the contiguous buffers (most
+    notably the data of NumPy arrays and thus also the blocks of pandas
+    DataFrames) are written out-of-band, as raw aligned blocks after the
+    pickle stream. The load maps the file to memory and passes views of
+    the blocks to pickle, so the arrays are not copied at all. The OS page
+    cache then holds their memory.
+
+    The loaded arrays are read-only, as they are views of the read-only
+    mapping. Use a copy of the data to modify them.
+
+    The file is written to a temporary name first and then replaced, so
+    the data loaded from the previous version of the file stay valid.
+
+    The format of the file is: magic bytes, the length of the pickle
+    stream and the number of buffers, offset and length of each buffer,
+    the pickle stream and the aligned buffers.
+    """
+
+    MAGIC = b'NEADSMM1'
+    ALIGNMENT = 64
+    # Smaller buffers are kept in the pickle stream (i.e. in-band)
+    MIN_OUT_OF_BAND_SIZE = 1024
+
+    _HEADER = struct.Struct('<QQ')
+    _BUFFER_ENTRY = struct.Struct('<QQ')
+
+    def save(self, data: Any, filename: PathLike):
+        """Save data into a file with the given name.
+
+        Parameters
+        ----------
+        data : Any
+            Data to save to the file.
+        filename : PathLike
+            Name of the file where the data will be saved.
+        """
+
+        buffers = []
+
+        def buffer_callback(buffer: pkl.PickleBuffer):
+            # Returning False means the buffer is out-of-band
+            try:
+                raw_buffer = buffer.raw()
+            except BufferError:
+                return True  # Not contiguous, stays in-band
+            if raw_buffer.nbytes < self.MIN_OUT_OF_BAND_SIZE:
+                return True
+            buffers.append(raw_buffer)
+            return False
+
+        stream = pkl.dumps(data, protocol=5, buffer_callback=buffer_callback)
+
+        offset = len(self.MAGIC) + self._HEADER.size \
+            + len(buffers) * self._BUFFER_ENTRY.size + len(stream)
+        entries = []
+        for raw_buffer in buffers:
+            offset = self._align(offset)
+            entries.append((offset, raw_buffer.nbytes))
+            offset += raw_buffer.nbytes
+
+        partial_filename = f'{os.fsdecode(filename)}.partial'
+        with open(partial_filename, 'wb') as f:
+            f.write(self.MAGIC)
+            f.write(self._HEADER.pack(len(stream), len(buffers)))
+            for entry in entries:
+                f.write(self._BUFFER_ENTRY.pack(*entry))
+            f.write(stream)
+            for (buffer_offset, _), raw_buffer in zip(entries, buffers):
+                f.write(b'\0' * (buffer_offset - f.tell()))
+                f.write(raw_buffer)
+        os.replace(partial_filename, filename)
+
+    def load(self, filename: PathLike) -> Any:
+        """Load and return data from a file with the given name.
+
+        The out-of-band buffers are memory-mapped views of the file.
+
+        Parameters
+        ----------
+        filename : PathLike
+            Name of the file from which the data will be loaded.
+
+        Returns
+        -------
+        Any
+            Loaded data, ie. content of the file.
+
+        Raises
+        ------
+        ValueError
+            If the file was not written by MemoryMapSerializer.
+        """
+
+        with open(filename, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+
+        if view[:len(self.MAGIC)] != self.MAGIC:
+            view.release()
+            mapped.close()
+            raise ValueError(f'The file {filename} was not written by '
+                             f'MemoryMapSerializer.')
+        position = len(self.MAGIC)
+        stream_length, buffer_count = \
+            self._HEADER.unpack_from(view, position)
+        position += self._HEADER.size
+
+        buffers = []
+        for _ in range(buffer_count):
+            buffer_offset, buffer_length = \
+                self._BUFFER_ENTRY.unpack_from(view, position)
+            position += self._BUFFER_ENTRY.size
+            buffers.append(view[buffer_offset:buffer_offset + buffer_length])
+
+        data = pkl.loads(view[position:position + stream_length],
+                         buffers=buffers)
+        if not buffers:
+            # Nothing refers to the mapping, it can be closed right away
+            view.release()
+            mapped.close()
+        # Otherwise, the mapping is closed when the last view is collected
+        return data
+
+    def _align(self, offset):
+        """Return the nearest larger or equal offset with proper alignment."""
+        return -(-offset // self.ALIGNMENT) * self.ALIGNMENT
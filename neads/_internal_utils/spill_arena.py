@@ -0,0 +1,352 @@
+import itertools
+import os
+import pickle as pkl
+import tempfile
+import threading
+import weakref
+from typing import Optional
+
+from neads._internal_utils.background_writer import BackgroundWriter
+
+
+def _close_and_remove(file, path):
+    file.close()
+    if os.path.exists(path):
+        os.remove(path)
+
+
+class SpillArena:
+    """Single append-only file holding pickled objects of many ArenaFiles.
+
+    Unlike ObjectTempFile, which creates a file for each stored object, the
+    arena appends all objects to one file and keeps the index of their
+    offsets. An ArenaFile (see `create_file`) then behaves as an
+    ObjectTempFile, but its object is a region of the arena. Rewriting the
+    object appends its new version, the old one becomes dead.
+
+    The space of dead regions (rewritten objects or disposed ArenaFiles) is
+    reclaimed by compaction. The live regions are copied to a new file,
+    when the dead regions make up a large enough part of the arena.
+
+    The arena is thread-safe, so the ArenaFiles may be written by
+    a BackgroundWriter. The arena file is removed when the arena is closed,
+    garbage collected or when the program exits.
+    """
+
+    def __init__(self, directory=None, *, compaction_threshold=0.5,
+                 min_compaction_size=64 * 2**20):
+        """Initialize the SpillArena and create its file.
+
+        Parameters
+        ----------
+        directory
+            Directory where the arena file is created, e.g. on a fast local
+            disk. By default, the system's temp directory.
+        compaction_threshold
+            Which proportion of the arena file may be occupied by dead
+            regions before the arena is compacted.
+        min_compaction_size
+            The arena file is not compacted if it is smaller (in bytes).
+        """
+
+        self._directory = directory
+        self._compaction_threshold = compaction_threshold
+        self._min_compaction_size = min_compaction_size
+
+        self._lock = threading.RLock()
+        # Maps ids of ArenaFiles to offset and length of their objects
+        self._index: dict[int, tuple[int, int]] = {}
+        self._end = 0
+        self._dead_bytes = 0
+        self._ids = itertools.count()
+
+        self._path, self._file = self._create_arena_file()
+        self._finalizer = weakref.finalize(self, _close_and_remove,
+                                           self._file, self._path)
+
+    @property
+    def path(self):
+        """Path to the current arena file."""
+        return self._path
+
+    @property
+    def size(self) -> int:
+        """The size of the arena file in bytes."""
+        return self._end
+
+    @property
+    def dead_bytes(self) -> int:
+        """The size of dead regions of the arena file in bytes."""
+        return self._dead_bytes
+
+    @property
+    def is_closed(self):
+        """Whether the arena was already closed."""
+        return not self._finalizer.alive
+
+    def create_file(self, *, writer: Optional[BackgroundWriter] = None) \
+            -> 'ArenaFile':
+        """Create a new ArenaFile in the arena.
+
+        Parameters
+        ----------
+        writer
+            BackgroundWriter which performs the saves of the ArenaFile. By
+            default, the saves are synchronous.
+
+        Returns
+        -------
+            The new ArenaFile without an object.
+        """
+
+        return ArenaFile(self, next(self._ids), writer=writer)
+
+    def close(self):
+        """Close the arena and remove its file.
+
+        The ArenaFiles of the arena cannot be used anymore.
+        """
+
+        with self._lock:
+            self._finalizer()
+            self._index = {}
+
+    def write(self, file_id: int, data: bytes):
+        """Write the data of the ArenaFile with the given id.
+
+        Parameters
+        ----------
+        file_id
+            Id of the ArenaFile.
+        data
+            The data to append to the arena.
+
+        Raises
+        ------
+        RuntimeError
+            If the arena was closed.
+        """
+
+        with self._lock:
+            self._assert_is_open()
+            self._file.seek(self._end)
+            self._file.write(data)
+            self._file.flush()
+            self._discard_region(file_id)
+            self._index[file_id] = (self._end, len(data))
+            self._end += len(data)
+            self._compact_if_worth_it()
+
+    def read(self, file_id: int) -> bytes:
+        """Read the data of the ArenaFile with the given id.
+
+        Parameters
+        ----------
+        file_id
+            Id of the ArenaFile.
+
+        Returns
+        -------
+            The data of the ArenaFile.
+
+        Raises
+        ------
+        RuntimeError
+            If the arena was closed.
+        KeyError
+            If there are no data of the ArenaFile.
+        """
+
+        with self._lock:
+            self._assert_is_open()
+            offset, length = self._index[file_id]
+            self._file.seek(offset)
+            return self._file.read(length)
+
+    def free(self, file_id: int):
+        """Free the region of the ArenaFile with the given id, if any.
+
+        Parameters
+        ----------
+        file_id
+            Id of the ArenaFile.
+        """
+
+        with self._lock:
+            if not self.is_closed:
+                self._discard_region(file_id)
+                self._compact_if_worth_it()
+
+    def compact(self):
+        """Copy the live regions to a new arena file and remove the old one.
+
+        Raises
+        ------
+        RuntimeError
+            If the arena was closed.
+        """
+
+        with self._lock:
+            self._assert_is_open()
+            new_path, new_file = self._create_arena_file()
+            new_index = {}
+            new_end = 0
+            for file_id, (offset, length) in self._index.items():
+                self._file.seek(offset)
+                new_file.write(self._file.read(length))
+                new_index[file_id] = (new_end, length)
+                new_end += length
+            new_file.flush()
+
+            self._finalizer()
+            self._path, self._file = new_path, new_file
+            self._finalizer = weakref.finalize(self, _close_and_remove,
+                                               self._file, self._path)
+            self._index = new_index
+            self._end = new_end
+            self._dead_bytes = 0
+
+    def _create_arena_file(self):
+        """Create a new arena file in the arena's directory.
+
+        Returns
+        -------
+            The path to the file and the file opened for reading and writing.
+        """
+
+        descriptor_num, path = tempfile.mkstemp(prefix='neads_arena_',
+                                                dir=self._directory)
+        return path, open(descriptor_num, 'w+b')
+
+    def _discard_region(self, file_id):
+        """Mark the region of the ArenaFile as dead, if there is any."""
+
+        if (region := self._index.pop(file_id, None)) is not None:
+            self._dead_bytes += region[1]
+
+    def _compact_if_worth_it(self):
+        """Compact the arena, if the dead regions are large enough."""
+
+        if self._end >= self._min_compaction_size \
+                and self._dead_bytes > self._compaction_threshold * self._end:
+            self.compact()
+
+    def _assert_is_open(self):
+        if self.is_closed:
+            raise RuntimeError(f'The arena at {self._path} was closed.')
+
+
+class ArenaFile:
+    """Region of SpillArena for loading and storing a single object.
+
+    The ArenaFile has the same interface as ObjectTempFile, so it may
+    replace it. The object is pickled to the arena. The region is freed when
+    the first of the following events occurs: the ArenaFile is garbage
+    collected, its dispose() method is called or the arena is closed.
+
+    If a BackgroundWriter is given, the object is pickled and written on the
+    writer's thread and `save` returns right away. The `load` then waits
+    until the save is done.
+    """
+
+    def __init__(self, arena: SpillArena, file_id: int, *,
+                 writer: Optional[BackgroundWriter] = None):
+        """Create new ArenaFile, use SpillArena's `create_file` instead.
+
+        Parameters
+        ----------
+        arena
+            The arena which holds the object.
+        file_id
+            The id of the ArenaFile unique in the arena.
+        writer
+            BackgroundWriter which performs the saves. By default, the
+            saves are synchronous.
+        """
+
+        self._arena = arena
+        self._id = file_id
+        self._writer = writer
+        # The key of the writes, which does not keep the ArenaFile alive
+        self._write_key = (id(arena), file_id)
+        self._finalizer = weakref.finalize(self, arena.free, file_id)
+        self._is_object_present = False
+
+    def load(self):
+        """Load the object from the arena.
+
+        The object is suppose to survive the load, so a repeated load is
+        possible.
+
+        Returns
+        -------
+            The deserialized object from the arena.
+
+        Raises
+        ------
+        RuntimeError
+            Attempt to load data before saving them.
+            Attempt to access disposed object.
+        """
+
+        if not self.is_disposed:
+            if self._is_object_present:
+                if self._writer is not None:
+                    self._writer.wait(self._write_key)
+                return pkl.loads(self._arena.read(self._id))
+            else:
+                raise RuntimeError(f'Cannot load from file without object.')
+        else:
+            raise RuntimeError(f'The arena file {self._id} were disposed.')
+
+    def save(self, obj, size: int = 0):
+        """Save the object to the arena.
+
+        Parameters
+        ----------
+        obj
+            Object to save in the arena.
+        size
+            Size of the object in bytes, which is accounted as in-flight
+            in the BackgroundWriter until the save is done. Relevant only
+            with a writer.
+
+        Raises
+        ------
+        RuntimeError
+            Attempt to access disposed object.
+        """
+
+        if not self.is_disposed:
+            if self._writer is not None:
+                self._writer.submit(self._write_key,
+                                    lambda: self._write(obj), size)
+            else:
+                self._write(obj)
+            self._is_object_present = True
+        else:
+            raise RuntimeError(f'The arena file {self._id} were disposed.')
+
+    def dispose(self):
+        """Dispose the ArenaFile object.
+
+        The region of the arena will be freed.
+        """
+
+        if self._writer is not None and self._finalizer.alive:
+            # The pending write would occupy the region again
+            try:
+                self._writer.wait(self._write_key)
+            except Exception:
+                pass
+        self._finalizer()
+
+    @property
+    def is_disposed(self):
+        """Whether the object was already disposed."""
+        return not self._finalizer.alive or self._arena.is_closed
+
+    def _write(self, obj):
+        """Pickle the object and write it to the arena."""
+        self._arena.write(self._id,
+                          pkl.dumps(obj, protocol=pkl.HIGHEST_PROTOCOL))
@@ -558,7 +558,8 @@ class ActivationGraph(collections.abc.Iterable):
         trigger_method
             Trigger-on-result method for the Activation. The method takes the
             Activation and its result as arguments. Returns a list of newly
-            created Activations.
+            created Activations. The result may be a read-only view of the
+            data (e.g. non-writeable numpy array), as it is not copied.
 
         Raises
         ------
@@ -1263,7 +1264,8 @@ class Activation:
         trigger_method
             Trigger-on-result method for the Activation. The method takes the
             Activation and its result as arguments. Returns a list of newly
-            created Activations.
+            created Activations. The result may be a read-only view of the
+            data (e.g. non-writeable numpy array), as it is not copied.
 
         Raises
         ------
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Sequence
+import copy as copy_module
+import inspect
+
+from .symbolic_objects import Value
+from .symbolic_objects.symbolic_object import Symbol, \
+    SubstitutionPairsParsingUtility
+from .symbolic_objects.symbolic_object_exception import \
+    SymbolicObjectException
+
+if TYPE_CHECKING:
+    from .symbolic_objects.symbolic_object import SymbolicObject
+
+
+# Kinds of steps of the plan
+_CONSTANT = 0  # Immutable object, used as it is
+_SLOT = 1  # Symbol, filled with the object substituted for it
+_NESTED = 2  # Other SymbolicObject, whose value is computed on each call
+_VAR_POSITIONAL = 3  # Tuple of steps for the variadic positional parameter
+_VAR_KEYWORD = 4  # Dict of steps for the variadic keyword parameter
+
+
+class ArgumentPlan:
+    """Compiled recipe for the actual arguments of a SymbolicArgumentSet.
+
+    The plan is built once from the symbolic arguments. It holds a step for
+    each parameter of the signature: the immutable constants are referenced
+    directly, the Symbols are slots filled with the substituted objects and
+    only the remaining SymbolicObjects (e.g. a ListObject with Symbols) are
+    walked recursively. The actual arguments are then created without
+    recursion over the whole argument set and without binding them to
+    the signature again.
+    """
+
+    def __init__(self, signature: inspect.Signature,
+                 args: Sequence[SymbolicObject],
+                 kwargs: dict[str, SymbolicObject]):
+        """Compile the plan for the symbolic arguments.
+
+        Parameters
+        ----------
+        signature
+            Signature of the function, which the arguments fit.
+        args
+            SymbolicObjects of the positional arguments (including those
+            with default values).
+        kwargs
+            SymbolicObjects of the keyword arguments (including those with
+            default values).
+        """
+
+        self._signature = signature
+        self._steps: list[tuple[str, tuple[int, Any]]] = []
+
+        position = 0
+        keyword_names = set()
+        for name, parameter in signature.parameters.items():
+            if parameter.kind is inspect.Parameter.VAR_POSITIONAL:
+                steps = tuple(self._compile(obj) for obj in args[position:])
+                position = len(args)
+                if steps:
+                    self._steps.append((name, (_VAR_POSITIONAL, steps)))
+            elif parameter.kind is inspect.Parameter.VAR_KEYWORD:
+                steps = {key: self._compile(obj)
+                         for key, obj in kwargs.items()
+                         if key not in keyword_names}
+                if steps:
+                    self._steps.append((name, (_VAR_KEYWORD, steps)))
+            elif parameter.kind is inspect.Parameter.KEYWORD_ONLY:
+                keyword_names.add(name)
+                self._steps.append((name, self._compile(kwargs[name])))
+            else:
+                self._steps.append((name, self._compile(args[position])))
+                position += 1
+
+    @staticmethod
+    def _compile(obj: SymbolicObject):
+        """Return the step which creates the value of the SymbolicObject."""
+
+        if isinstance(obj, Symbol):
+            return _SLOT, obj
+        elif isinstance(obj, Value) and obj.is_immutable:
+            return _CONSTANT, obj.get_value()
+        else:
+            return _NESTED, (obj, tuple(obj.get_symbols()))
+
+    def get_actual_arguments(self, *args, copy=True, share=True
+                             ) -> inspect.BoundArguments:
+        """Return the actual arguments described by the plan.
+
+        The method is equivalent to the `get_actual_arguments` method of
+        SymbolicArgumentSet. Only the objects substituted for the Symbols
+        which occur in the arguments are copied.
+
+        Parameters
+        ----------
+        args
+            The substitution for Symbols, see `SymbolicArgumentSet`.
+        copy
+            Whether a deep copy of given objects should appear in the
+            resulting arguments.
+        share
+            If the objects should be shared among all replacements for the
+            particular Symbol. Considered only if `copy` is True.
+
+        Returns
+        -------
+            The actual bound arguments which the plan describes.
+
+        Raises
+        ------
+        TypeError
+            If the arguments do not respect the required types.
+        ValueError
+            If more than 2 arguments are passed, or one `symbol_from`
+            occurs multiple times.
+        SymbolicObjectException
+            If there is a Symbol without substituted object.
+        """
+
+        substitution = dict(SubstitutionPairsParsingUtility.parse(*args))
+        copies = {}
+
+        def find(symbol):
+            try:
+                return substitution[symbol]
+            except KeyError:
+                raise SymbolicObjectException(
+                    f'No object was provided for the Symbol: {symbol}'
+                ) from None
+
+        def fill(symbol):
+            if not copy:
+                return find(symbol)
+            elif not share:
+                return copy_module.deepcopy(find(symbol))
+            elif symbol not in copies:
+                copies[symbol] = copy_module.deepcopy(find(symbol))
+            return copies[symbol]
+
+        def run(step):
+            kind, payload = step
+            if kind == _CONSTANT:
+                return payload
+            elif kind == _SLOT:
+                return fill(payload)
+            else:
+                obj, symbols = payload
+                if copy and not share:
+                    # Each occurrence of the Symbols gets its own copy
+                    pairs = [(symbol, find(symbol)) for symbol in symbols]
+                    return obj._get_value_clean(pairs, share=False)
+                else:
+                    # The Symbols of the object share the copies with slots
+                    pairs = [(symbol, fill(symbol)) for symbol in symbols]
+                    return obj._get_value_clean(pairs, share=True)
+
+        arguments = {}
+        for name, step in self._steps:
+            kind, payload = step
+            if kind == _VAR_POSITIONAL:
+                arguments[name] = tuple(run(sub_step) for sub_step in payload)
+            elif kind == _VAR_KEYWORD:
+                arguments[name] = {key: run(sub_step)
+                                   for key, sub_step in payload.items()}
+            else:
+                arguments[name] = run(step)
+        return inspect.BoundArguments(self._signature, arguments)
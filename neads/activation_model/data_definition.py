@@ -1,8 +1,18 @@
 from __future__ import annotations
 
-from typing import Optional, Dict, Hashable
-
-from .symbolic_objects import Value
+from typing import Optional, Dict, Hashable, Callable, Any
+import collections
+import datetime
+import hashlib
+import math
+import struct
+import threading
+import weakref
+
+import numpy as np
+
+from .plugin import PluginID
+from .symbolic_objects import Value, ListObject, DictObject
 from .symbolic_objects import Symbol
 from .symbolic_argument_set import SymbolicArgumentSet
 
@@ -18,6 +28,17 @@ class DataDefinition:
 
     The instances are also hashable and works well with pickle module.
 
+    Each instance has a `digest`, i.e. SHA-256 of a canonical encoding of its
+    function ID and arguments, which is the same in every process. Thus, it
+    may serve as a persistent key of the data (e.g. in FileDatabase).
+
+    The instances are registered weakly, so a DataDefinition (together with
+    its arguments) is freed once it is not used (e.g. after its graph was
+    dropped). As long as the instance lives, `get_instance` returns it for
+    the equal description. Additionally, a limited number of the most
+    recently used instances may be kept alive (see `set_cache_size`), so
+    they are reused when the same definitions are created repeatedly.
+
     Notes
     -----
         As a 'pure' function we consider those functions which comply with the
@@ -44,7 +65,69 @@ class DataDefinition:
         """
 
     _guard = _MyGuard()
-    _instances = {}
+    _instances: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+    # Strong references to the most recently used instances (the LRU order)
+    _recently_used: collections.OrderedDict = collections.OrderedDict()
+    _cache_size = 0
+    # The instances may be created also by the threads of the evaluation
+    # (e.g. when unpickling)
+    _lock = threading.Lock()
+    # The encoders of the types of arguments unknown to the digest
+    _encoders: Dict[type, Callable[[Any], bytes]] = {}
+
+    @staticmethod
+    def register_encoder(type_: type, encoder: Callable[[Any], bytes]):
+        """Register the canonical encoding of arguments of the given type.
+
+        The digest encodes only the arguments of the built-in types (numbers,
+        strings, bytes, None and their collections) by itself. The arguments
+        of other types need an encoder, which returns the same bytes for
+        the equal arguments in every process. The encoder is used also for
+        the subclasses of the type.
+
+        Parameters
+        ----------
+        type_
+            The type of the arguments.
+        encoder
+            Function which returns the canonical encoding of an argument of
+            the type.
+        """
+
+        DataDefinition._encoders[type_] = encoder
+
+    @staticmethod
+    def set_cache_size(size: int):
+        """Set the number of recently used instances which are kept alive.
+
+        By default, no instance is kept alive by DataDefinition itself.
+
+        Parameters
+        ----------
+        size
+            The maximal number of the most recently used instances of
+            DataDefinition, which are not freed even if they are not used
+            anywhere else.
+
+        Raises
+        ------
+        ValueError
+            If the size is negative.
+        """
+
+        if size < 0:
+            raise ValueError(f'The cache size must not be negative: {size}')
+        with DataDefinition._lock:
+            DataDefinition._cache_size = size
+            DataDefinition._trim_recently_used()
+
+    @staticmethod
+    def _trim_recently_used():
+        """Drop the least recently used instances over the cache size."""
+
+        recently_used = DataDefinition._recently_used
+        while len(recently_used) > DataDefinition._cache_size:
+            recently_used.popitem(last=False)
 
     @staticmethod
     def get_instance(
@@ -111,16 +194,19 @@ class DataDefinition:
         # Create look-up key for instance
         key = (function_id, norm_arguments)
         try:
-            # If already same instances already exists
-            if None is (inst := DataDefinition._instances.get(key)):
-                # New instance is initialized and stored in `_instances` dict
-                new_inst = DataDefinition(DataDefinition._guard,
+            with DataDefinition._lock:
+                # If already same instances already exists
+                if None is (inst := DataDefinition._instances.get(key)):
+                    # New instance is initialized and stored in `_instances`
+                    inst = DataDefinition(DataDefinition._guard,
                                           function_id,
                                           norm_arguments)
-                DataDefinition._instances[key] = new_inst
-                return new_inst
-            else:
-                # Instance was found - we can return it
+                    DataDefinition._instances[key] = inst
+                # Otherwise, instance was found - we can return it
+                if DataDefinition._cache_size:
+                    DataDefinition._recently_used[key] = inst
+                    DataDefinition._recently_used.move_to_end(key)
+                    DataDefinition._trim_recently_used()
                 return inst
         except TypeError as e:
             # The hash-ability is preserved while normalizing arguments
@@ -188,6 +274,29 @@ class DataDefinition:
 
         self._function_id = function_id
         self._arguments = arguments
+        self._digest: Optional[str] = None
+
+    @property
+    def digest(self) -> str:
+        """The stable content digest of the DataDefinition.
+
+        The digest is the hexadecimal SHA-256 of the canonical encoding of
+        the function ID and the arguments, where the DataDefinitions in the
+        arguments are represented by their digests. The equal arguments
+        (e.g. 1 and 1.0) have the same encoding, so the digest does not
+        depend on the process, in which the DataDefinition was created.
+
+        Raises
+        ------
+        TypeError
+            If an argument has no canonical encoding (see
+            `register_encoder`).
+        """
+
+        if self._digest is None:
+            encoding = _encode(self._function_id) + _encode(self._arguments)
+            self._digest = hashlib.sha256(encoding).hexdigest()
+        return self._digest
 
     def __reduce_ex__(self, protocol):
         """To support pickling."""
@@ -197,3 +306,122 @@ class DataDefinition:
 
 class DataDefinitionException(Exception):
     pass
+
+
+_LENGTH = struct.Struct('<Q')
+
+
+def _frame(tag: bytes, payload: bytes) -> bytes:
+    """Return the tagged payload prefixed by its length."""
+    return tag + _LENGTH.pack(len(payload)) + payload
+
+
+def _encode_items(tag, encodings, *, ordered=True):
+    """Return the encoding of a collection of already encoded items.
+
+    The items of unordered collections (e.g. dicts or sets) are sorted, so
+    their encoding does not depend on the order of insertion.
+    """
+
+    encodings = list(encodings)
+    if not ordered:
+        encodings.sort()
+    return _frame(tag, b''.join(encodings))
+
+
+def _encode(obj) -> bytes:
+    """Return the canonical encoding of the object for the digest.
+
+    The encoding respects the equality of the objects, which DataDefinition
+    relies on. That is, the numbers equal by value (e.g. True, 1, 1.0 and
+    NumPy's int64(1)) have the same encoding and so do the dicts and sets
+    with the same items. The dates, times and timedeltas are encoded by
+    their values as well.
+    The objects of other than the handled types are encoded by their type
+    and the encoder registered for the type (see
+    `DataDefinition.register_encoder`).
+
+    Raises
+    ------
+    TypeError
+        If there is no encoder for the type of the object.
+    """
+
+    if isinstance(obj, DataDefinition):
+        return _frame(b'D', bytes.fromhex(obj.digest))
+    elif isinstance(obj, SymbolicArgumentSet):
+        return _frame(b'A', _encode(obj._bound_args_object))
+    elif isinstance(obj, Value):
+        return _frame(b'V', _encode(obj._value))
+    elif isinstance(obj, ListObject):
+        return _encode_items(b'L', map(_encode, obj))
+    elif isinstance(obj, DictObject):
+        return _encode_items(b'M', (_encode(k) + _encode(v)
+                                    for k, v in obj.items()), ordered=False)
+    elif isinstance(obj, PluginID):
+        return _frame(b'P', _encode(obj._name) + _encode(obj._version))
+    elif obj is None:
+        return _frame(b'N', b'')
+    elif isinstance(obj, (bool, int)):
+        return _frame(b'i', str(int(obj)).encode())
+    elif isinstance(obj, float):
+        if math.isfinite(obj) and obj.is_integer():
+            return _encode(int(obj))
+        return _frame(b'f', obj.hex().encode())
+    elif isinstance(obj, complex):
+        if obj.imag == 0:
+            return _encode(obj.real)
+        return _frame(b'c', _encode(obj.real) + _encode(obj.imag))
+    elif isinstance(obj, (np.number, np.bool_)) \
+            and not isinstance(item := obj.item(), np.generic):
+        # The NumPy scalars are equal to the Python numbers of their value
+        # (except the extended precision ones, which have no such number)
+        return _encode(item)
+    elif isinstance(obj, datetime.datetime):
+        # The aware datetimes are equal, if they are the same instant
+        if obj.utcoffset() is not None:
+            obj = obj.astimezone(datetime.timezone.utc)
+        return _frame(b'T', obj.isoformat().encode())
+    elif isinstance(obj, datetime.date):
+        return _frame(b'y', obj.isoformat().encode())
+    elif isinstance(obj, datetime.time):
+        return _frame(b'h', obj.isoformat().encode())
+    elif isinstance(obj, datetime.timedelta):
+        # The nanoseconds of pandas' Timedelta
+        nanoseconds = getattr(obj, 'nanoseconds', 0)
+        return _frame(b'r', _encode((obj.days, obj.seconds, obj.microseconds,
+                                     nanoseconds)))
+    elif isinstance(obj, str):
+        return _frame(b's', obj.encode('utf-8', 'surrogatepass'))
+    elif isinstance(obj, bytes):
+        return _frame(b'b', obj)
+    elif isinstance(obj, tuple):
+        return _encode_items(b't', map(_encode, obj))
+    elif isinstance(obj, list):
+        return _encode_items(b'l', map(_encode, obj))
+    elif isinstance(obj, dict):
+        return _encode_items(b'd', (_encode(k) + _encode(v)
+                                    for k, v in obj.items()), ordered=False)
+    elif isinstance(obj, (set, frozenset)):
+        return _encode_items(b'e', map(_encode, obj), ordered=False)
+    else:
+        encoder = _get_encoder(type(obj))
+        type_name = f'{type(obj).__module__}.{type(obj).__qualname__}'
+        return _frame(b'o', _encode(type_name) + _frame(b'x', encoder(obj)))
+
+
+def _get_encoder(type_):
+    """Return the encoder registered for the type or its nearest base.
+
+    Raises
+    ------
+    TypeError
+        If there is no encoder for the type.
+    """
+
+    for base in type_.__mro__:
+        if (encoder := DataDefinition._encoders.get(base)) is not None:
+            return encoder
+    raise TypeError(f'Arguments of type {type_.__qualname__} have no '
+                    f'canonical encoding for the digest, register an encoder '
+                    f'by DataDefinition.register_encoder.')
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import inspect
-from typing import Callable
+from typing import Callable, Optional
 
 
 class Plugin:
@@ -9,9 +9,18 @@ class Plugin:
 
     Plugin is a uniquely identified method which processes data and produces
     new one.
+
+    By default, the plugin gets a deepcopy of the data of other Activations,
+    so it may modify them freely. A plugin which does not modify its
+    arguments may declare `read_only_arguments`. Then, it gets the data
+    without the copy, as read-only views where possible (see
+    `neads._internal_utils.read_only`). An attempt to modify such an argument
+    raises an exception or (e.g. for pandas objects with Copy-on-Write)
+    makes a copy of the modified data.
     """
 
-    def __init__(self, plugin_id: PluginID, method: Callable):
+    def __init__(self, plugin_id: PluginID, method: Callable, *,
+                 read_only_arguments: bool = False):
         """Initialize a new Plugin with its ID and method.
 
         Parameters
@@ -21,6 +30,10 @@ class Plugin:
             different runs of Neads.
         method
             The actual method of the plugin.
+        read_only_arguments
+            Whether the method does not modify its arguments, so it may get
+            read-only views of the data of other Activations instead of
+            their copies.
 
         Raises
         ------
@@ -37,11 +50,20 @@ class Plugin:
 
         self._plugin_id = plugin_id
         self._method = method
+        self._read_only_arguments = read_only_arguments
+        self._signature: Optional[inspect.Signature] = None
 
     @property
     def signature(self):
         """The signature of the Plugin."""
-        return inspect.signature(self._method)
+        if self._signature is None:
+            self._signature = inspect.signature(self._method)
+        return self._signature
+
+    @property
+    def read_only_arguments(self) -> bool:
+        """Whether the plugin gets read-only views of data of Activations."""
+        return self._read_only_arguments
 
     @property
     def id(self):
@@ -70,12 +92,14 @@ class Plugin:
             If the plugin method raises exception.
         """
 
-        # Throws TypeException if, the arguments does not fit
-        self.signature.bind(*args, **kwargs)
-        # If the bind passed, we call the method expecting arbitrary exception
         try:
             return self._method(*args, **kwargs)
         except Exception as e:
+            # The arguments are checked against the signature only after
+            # a failure, so the successful calls do not pay for the bind
+            if isinstance(e, TypeError):
+                # Throws TypeError if the arguments do not fit
+                self.signature.bind(*args, **kwargs)
             raise PluginException('Plugin raised an exception.') from e
 
     def __str__(self):
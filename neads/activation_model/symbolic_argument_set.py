@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterable, Union, Callable, Sequence
+from typing import TYPE_CHECKING, Iterable, Union, Callable, Sequence, \
+    Optional
 import inspect
 
+from .argument_plan import ArgumentPlan
 from .symbolic_objects import Value, ListObject, DictObject
 from .symbolic_objects.symbolic_object import SymbolicObject
 
@@ -21,8 +23,14 @@ class SymbolicArgumentSet:
     The SymbolicArgumentSet is immutable, therefore any substitution produces
     a new instance of SymbolicArgumentSet, instead of modifying the original
     one.
+
+    The actual arguments are created by an ArgumentPlan, which is compiled
+    once for the SymbolicArgumentSet.
     """
 
+    # The plan, compiled on the first call of `get_actual_arguments`
+    _plan: Optional[ArgumentPlan] = None
+
     def __init__(self, signature_bearer: Union[inspect.Signature, Callable],
                  /, *args, **kwargs):
         """Initialize SymbolicArgumentSet instance.
@@ -254,9 +262,9 @@ class SymbolicArgumentSet:
             SymbolicArgumentSet.
         """
 
-        args, kwargs = self._bound_args_object.get_value(*args, copy=copy,
-                                                         share=share)
-        return self._signature.bind(*args, **kwargs)
+        if self._plan is None:
+            self._plan = ArgumentPlan(self._signature, self.args, self.kwargs)
+        return self._plan.get_actual_arguments(*args, copy=copy, share=share)
 
     def __eq__(self, other: SymbolicArgumentSet) -> bool:
         """Compare the SymbolicArgumentSet with another.
@@ -272,11 +280,21 @@ class SymbolicArgumentSet:
             correspond to each other.
         """
 
+        if self is other:
+            return True
         return self._bound_args_object == other._bound_args_object
 
     def __hash__(self):
+        # The hash is cached by the ListObject
         return hash(self._bound_args_object)
 
+    def __getstate__(self):
+        """Return the state for pickling without the compiled plan."""
+
+        state = self.__dict__.copy()
+        state.pop('_plan', None)
+        return state
+
     def __str__(self):
         positional = f'*{self._bound_args_object[0]}'
         keyword = f'**{self._bound_args_object[1]}'
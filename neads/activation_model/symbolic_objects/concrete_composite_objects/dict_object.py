@@ -110,7 +110,13 @@ class DictObject(collections.abc.Mapping, CompositeObject):
             used). Otherwise False.
         """
 
-        if isinstance(other, DictObject):
+        if self is other:
+            return True
+        elif isinstance(other, DictObject):
+            if self._hash is not None and other._hash is not None \
+                    and self._hash != other._hash:
+                # Both hashes are known, so the deep comparison is needless
+                return False
             return self._dict_subobjects == other._dict_subobjects
         else:
             return False
@@ -127,7 +133,9 @@ class DictObject(collections.abc.Mapping, CompositeObject):
         return (item for item in itertools.chain(*items_pairs))
 
     def __hash__(self):
-        return hash(self._dict_subobjects)
+        if self._hash is None:
+            self._hash = hash(self._dict_subobjects)
+        return self._hash
 
     def __iter__(self):
         return iter(self._dict_subobjects)
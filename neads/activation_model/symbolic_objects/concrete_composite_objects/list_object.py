@@ -98,7 +98,13 @@ class ListObject(collections.abc.Sequence, CompositeObject):
             used). Otherwise False.
         """
 
-        if isinstance(other, ListObject):
+        if self is other:
+            return True
+        elif isinstance(other, ListObject):
+            if self._hash is not None and other._hash is not None \
+                    and self._hash != other._hash:
+                # Both hashes are known, so the deep comparison is needless
+                return False
             return self._subobjects == other._subobjects
         else:
             return False
@@ -114,7 +120,9 @@ class ListObject(collections.abc.Sequence, CompositeObject):
         return self._subobjects
 
     def __hash__(self):
-        return hash(self._subobjects)
+        if self._hash is None:
+            self._hash = hash(self._subobjects)
+        return self._hash
 
     def __getitem__(self, i: int):
         return self._subobjects[i]
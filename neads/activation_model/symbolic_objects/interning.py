@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import weakref
+
+from neads.activation_model.symbolic_objects.symbolic_object import \
+    SymbolicObject
+from neads.activation_model.symbolic_objects.value import Value
+from neads.activation_model.symbolic_objects.concrete_composite_objects \
+    import ListObject, DictObject
+
+
+# Maps structural keys to the canonical instances of SymbolicObjects
+_interned: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+# Types whose equal instances are interchangeable (unlike e.g. floats, where
+# 0.0 == -0.0, or tuples, where (1,) == (1.0,))
+_EXACT_TYPES = (int, str, bytes, bool, type(None))
+
+
+def intern_symbolic_object(obj: SymbolicObject) -> SymbolicObject:
+    """Return the canonical instance of SymbolicObject equal to the given one.
+
+    The interning (i.e. hash-consing) is applied bottom-up, so the equal
+    sub-objects of interned SymbolicObjects are identical objects. Then,
+    the comparison of interned objects is reduced to identity check.
+
+    Only the objects which can be safely replaced by an equal one are
+    interned. That is, the Values of ints, strings, bytes, bools and None
+    and the ListObjects and DictObjects made of interned sub-objects. Other
+    objects (e.g. Symbols) are returned as they are. Note that the Values of
+    objects compared by identity are not interned, as each Value holds its
+    own copy of the object.
+
+    The canonical instances are held weakly, so they are freed when they
+    are not used anymore.
+
+    Parameters
+    ----------
+    obj
+        The SymbolicObject to intern.
+
+    Returns
+    -------
+        The canonical instance equal to `obj` (possibly `obj` itself).
+    """
+
+    if isinstance(obj, Value):
+        content = obj._value
+        if type(content) not in _EXACT_TYPES:
+            return obj
+        key = (Value, type(content), content)
+        return _get_canonical(key, lambda: obj)
+    elif isinstance(obj, ListObject):
+        subobjects = [intern_symbolic_object(sub_obj) for sub_obj in obj]
+        key = (ListObject, tuple(id(sub_obj) for sub_obj in subobjects))
+        return _get_canonical(
+            key,
+            lambda: obj if all(a is b for a, b in zip(subobjects, obj))
+            else ListObject(*subobjects)
+        )
+    elif isinstance(obj, DictObject):
+        items = [(intern_symbolic_object(k), intern_symbolic_object(v))
+                 for k, v in obj.items()]
+        key = (DictObject, frozenset((id(k), id(v)) for k, v in items))
+        return _get_canonical(
+            key,
+            lambda: obj if all(k is o_k and v is o_v for (k, v), (o_k, o_v)
+                               in zip(items, obj.items()))
+            else DictObject(dict(items))
+        )
+    else:
+        return obj
+
+
+def _get_canonical(key, create):
+    """Return the canonical instance for the key, create it if there is none.
+
+    The ids in the key are the ids of the sub-objects of the canonical
+    instance, which keeps them alive. Once the instance is collected,
+    its entry is removed.
+    """
+
+    if (canonical := _interned.get(key)) is None:
+        canonical = create()
+        _interned[key] = canonical
+    return canonical
+
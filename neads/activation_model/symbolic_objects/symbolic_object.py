@@ -17,8 +17,25 @@ class SymbolicObject(abc.ABC):
     object, which the SymbolicObject described.
 
     SymbolicObject is immutable, so any substitution
+
+    As the SymbolicObjects are immutable, their hash is computed only once
+    and cached (see `_hash`).
     """
 
+    # The cached hash, set on the first call of __hash__
+    _hash: Optional[int] = None
+
+    def __getstate__(self):
+        """Return the state for pickling without the cached hash.
+
+        The hash may depend on ids of objects (e.g. of Symbols), so it is not
+        valid in another process.
+        """
+
+        state = self.__dict__.copy()
+        state.pop('_hash', None)
+        return state
+
     def substitute(self, *args) -> SymbolicObject:
         """Substitute SymbolicObjects for Symbols in `self`.
 
@@ -3,6 +3,7 @@ import collections
 
 from copy import deepcopy
 
+from neads._internal_utils.read_only import IMMUTABLE_TYPES
 from neads.activation_model.symbolic_objects.symbolic_object import \
     SymbolicObject, Symbol
 
@@ -23,6 +24,21 @@ class Value(SymbolicObject):
         """
 
         self._value = deepcopy(value)
+        self._is_immutable = _is_immutable(self._value)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if '_is_immutable' not in state:
+            # Pickled before the attribute was introduced
+            self._is_immutable = _is_immutable(self._value)
+
+    @property
+    def is_immutable(self) -> bool:
+        """Whether the contained object cannot be modified.
+
+        The value of such Value is returned without a copy.
+        """
+        return self._is_immutable
 
     def _substitute_clean(self, substitution_pairs):
         """Apply substitution on Value.
@@ -60,12 +76,15 @@ class Value(SymbolicObject):
         The value is copied in order to maintain immutability of Value as
         SymbolicObject in general. Thus, changes in the returned object do
         not affect the Value or any SymbolicObject in which is contained.
+        Immutable objects (such as numbers or strings) are not copied.
 
         Returns
         -------
             The actual value, which the Value contains.
         """
 
+        if self._is_immutable:
+            return self._value
         return deepcopy(self._value)
 
     def __eq__(self, other: SymbolicObject) -> bool:
@@ -82,7 +101,9 @@ class Value(SymbolicObject):
             `other` are value-equal (i.e. operator == is used). Otherwise False.
         """
 
-        if isinstance(other, Value):
+        if self is other:
+            return True
+        elif isinstance(other, Value):
             return self._value == other._value
         else:
             return False
@@ -100,11 +121,24 @@ class Value(SymbolicObject):
             If the content of Value is of an un-hashable type.
         """
 
-        try:
-            return hash(self._value)
-        except Exception as e:
-            raise TypeError(f'Content of Value is not hashable:'
-                            f' {type(self._value)}') from e
+        if self._hash is None:
+            try:
+                self._hash = hash(self._value)
+            except Exception as e:
+                raise TypeError(f'Content of Value is not hashable:'
+                                f' {type(self._value)}') from e
+        return self._hash
 
     def __str__(self):
         return f'Value({self._value})'
+
+
+def _is_immutable(obj):
+    """Return whether the object (including its items) cannot be modified."""
+
+    if isinstance(obj, IMMUTABLE_TYPES):
+        return True
+    elif type(obj) is tuple:
+        return all(_is_immutable(item) for item in obj)
+    else:
+        return False
@@ -3,8 +3,11 @@ import os
 import pathlib
 import pickle as pkl
 
+from neads.activation_model.data_definition import DataDefinition
 from neads.database import IDatabase, DataNotFound
 from neads._internal_utils.serializers import PickleSerializer
+from neads._internal_utils.background_writer import BackgroundWriter
+import neads._internal_utils.memory_info as memory_info
 
 if TYPE_CHECKING:
     from neads._internal_utils.serializers import ISerializer
@@ -17,7 +20,16 @@ class FileDatabase(IDatabase):
 
     In addition, the database manages an index dictionary which maps the keys
     to the files containing their data. The dictionary is serializer using
-    pickle.
+    pickle. The DataDefinitions are indexed by their digests, so the index is
+    loaded without re-creating the definitions. The indexes written by older
+    versions (with whole DataDefinitions as keys) are converted on open. The
+    DataDefinitions without digest (i.e. with an argument which has no
+    canonical encoding) remain in the index as they are.
+
+    With write-behind, the data files are written by a BackgroundWriter,
+    so `save` returns before the data are on disk. The index is updated
+    right away and a load of the data waits until their write is done. All
+    writes are flushed when the database is closed.
     """
 
     INDEX_FILENAME = 'index'
@@ -42,7 +54,8 @@ class FileDatabase(IDatabase):
         # Creating dir for data
         os.mkdir(db_path / FileDatabase.DATA_DIR)
 
-    def __init__(self, dir_name, *, serializer=None):
+    def __init__(self, dir_name, *, serializer=None, write_behind=False,
+                 max_pending_writes=4):
         """Initializes a FileDatabase.
 
         The directory must exist and contain all necessary. Use `create`
@@ -52,6 +65,13 @@ class FileDatabase(IDatabase):
         ----------
         dir_name
             Directory with a FileDatabase.
+        serializer
+            Serializer for the data. By default, PickleSerializer is used.
+        write_behind
+            Whether the data files are written in the background.
+        max_pending_writes
+            The maximal number of writes waiting for the background writer.
+            When exceeded, `save` blocks until a write is done.
         """
 
         db_path = pathlib.Path(dir_name)
@@ -65,21 +85,41 @@ class FileDatabase(IDatabase):
         self._serializer: ISerializer = serializer \
             if serializer is not None \
             else PickleSerializer()
+        self._write_behind = write_behind
+        self._max_pending_writes = max_pending_writes
+        self._writer: Optional[BackgroundWriter] = None
 
     @property
     def is_open(self):
         """Whether the database is open."""
         return self._is_open
 
+    @property
+    def pending_write_size(self) -> int:
+        """The size of saved data whose write is not done yet, in bytes."""
+        return self._writer.in_flight_bytes if self._writer is not None else 0
+
     def _do_open(self):
         """Do open the database."""
         with open(self._index_path, 'rb') as f:
-            self._index = pkl.load(f)
+            index = pkl.load(f)
+        # The order of the index must be kept (see `_add_new_file_name`)
+        self._index = {self._get_index_key(key): file_number
+                       for key, file_number in index.items()}
+        if self._write_behind:
+            self._writer = BackgroundWriter(self._max_pending_writes)
         self._is_open = True
 
     def _do_close(self):
         """Do close the database."""
         self._is_open = False
+        try:
+            if self._writer is not None:
+                self._writer.close()
+        finally:
+            self._writer = None
+        # The index is written only if all the data were written, so it
+        # does not refer to missing (or incomplete) data files
         with open(self._index_path, 'wb') as f:
             pkl.dump(self._index, f)
 
@@ -94,13 +134,38 @@ class FileDatabase(IDatabase):
             The key for the data.
         """
 
+        self._do_save_sized(data, key, None)
+
+    def _do_save_sized(self, data, key, size):
+        """Do save the given data of the known size under the given key.
+
+        Parameters
+        ----------
+        data
+            The data to save to the database.
+        key
+            The key for the data.
+        size
+            The size of the data in bytes, or None if it is not known. The
+            size is needed only for the background write, it is measured
+            if not known.
+        """
+
         # Try if the key already exists
         try:
             data_path = self._get_path_for_key(key)
         except DataNotFound:
             # We need to generate new file
-            data_path = self._add_new_file_name(key)
-        self._serializer.save(data, data_path)
+            data_path = self._add_new_file_name(self._get_index_key(key))
+        if self._writer is not None:
+            self._writer.submit(
+                data_path,
+                lambda: self._serializer.save(data, data_path),
+                size if size is not None
+                else memory_info.get_object_size(data)
+            )
+        else:
+            self._serializer.save(data, data_path)
 
     def _do_load(self, key):
         """Do load data under the given key from the database.
@@ -121,8 +186,69 @@ class FileDatabase(IDatabase):
         """
 
         data_path = self._get_path_for_key(key)
+        self._wait_for_write(data_path)
         return self._serializer.load(data_path)
 
+    def _do_contains(self, key) -> bool:
+        """Do check whether there are data under the given key.
+
+        Only the index is examined, the data file is not accessed.
+
+        Parameters
+        ----------
+        key
+            The key for the data.
+
+        Returns
+        -------
+            True, if there are data for the given key in the database.
+        """
+
+        return self._get_index_key(key) in self._index
+
+    def _do_contains_many(self, keys) -> set:
+        """Do find out which of the given keys have data in the database.
+
+        Only the index is examined, the data files are not accessed.
+
+        Parameters
+        ----------
+        keys
+            Iterable of the keys for the data.
+
+        Returns
+        -------
+            Set of the given keys which have data in the database.
+        """
+
+        return {key for key in keys
+                if self._get_index_key(key) in self._index}
+
+    def _do_load_many(self, keys) -> dict:
+        """Do load data under the given keys from the database.
+
+        The files are opened only for the keys present in the index.
+
+        Parameters
+        ----------
+        keys
+            Iterable of the keys for the data.
+
+        Returns
+        -------
+            Dictionary which maps the given keys present in the database to
+            their data.
+        """
+
+        data_by_key = {}
+        for key in keys:
+            file_number = self._index.get(self._get_index_key(key), None)
+            if file_number is not None:
+                data_path = self._data_dir_path / str(file_number)
+                self._wait_for_write(data_path)
+                data_by_key[key] = self._serializer.load(data_path)
+        return data_by_key
+
     def _do_delete(self, key):
         """Do delete data under the given key from the database.
 
@@ -138,8 +264,45 @@ class FileDatabase(IDatabase):
         """
 
         data_path = self._get_path_for_key(key)
+        self._wait_for_write(data_path)
         os.remove(data_path)
-        del self._index[key]
+        del self._index[self._get_index_key(key)]
+
+    def _wait_for_write(self, data_path):
+        """Wait until the pending write of the data file is done, if any.
+
+        Parameters
+        ----------
+        data_path
+            Path to the data file.
+        """
+
+        if self._writer is not None:
+            self._writer.wait(data_path)
+
+    @staticmethod
+    def _get_index_key(key):
+        """Return the key of the index for the given key.
+
+        Parameters
+        ----------
+        key
+            The key for the data.
+
+        Returns
+        -------
+            The digest of the key, if it is a DataDefinition with a digest.
+            Otherwise, the key itself (i.e. the DataDefinitions whose
+            arguments have no canonical encoding are pickled in the index).
+        """
+
+        if isinstance(key, DataDefinition):
+            try:
+                return key.digest
+            except TypeError:
+                return key
+        else:
+            return key
 
     def _get_path_for_key(self, key):
         """Return path to file with data corresponding to the given key.
@@ -159,7 +322,8 @@ class FileDatabase(IDatabase):
             If there are no data for the given key in the database.
         """
 
-        if (file_number := self._index.get(key, None)) is not None:
+        file_number = self._index.get(self._get_index_key(key), None)
+        if file_number is not None:
             data_path = self._data_dir_path / str(file_number)
             return data_path
         else:
@@ -171,7 +335,7 @@ class FileDatabase(IDatabase):
         Parameters
         ----------
         key
-            Key for the new filename.
+            Key of the index for the new filename.
 
         Returns
         -------
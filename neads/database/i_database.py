@@ -1,3 +1,4 @@
+from typing import Optional
 import abc
 
 
@@ -18,6 +19,16 @@ class IDatabase(abc.ABC):
         """Whether the database is open."""
         pass
 
+    @property
+    def pending_write_size(self) -> int:
+        """The size of saved data whose write is not done yet, in bytes.
+
+        Only the databases which save data in the background may have
+        pending writes. The data are held in memory until the write is done.
+        """
+
+        return 0
+
     def __enter__(self):
         self.open()
 
@@ -52,7 +63,7 @@ class IDatabase(abc.ABC):
         self._assert_database_is_open('The database must be open when closing.')
         self._do_close()
 
-    def save(self, data, key):
+    def save(self, data, key, *, size: Optional[int] = None):
         """Save the given data under the given key.
 
         Parameters
@@ -61,6 +72,10 @@ class IDatabase(abc.ABC):
             The data to save to the database.
         key
             The key for the data.
+        size
+            The size of the data in bytes, if the caller knows it. The
+            databases which hold the data until they are written (see
+            `pending_write_size`) need not measure the data then.
 
         Raises
         ------
@@ -70,7 +85,7 @@ class IDatabase(abc.ABC):
 
         self._assert_database_is_open('The database must be open when saving '
                                       'data.')
-        self._do_save(data, key)
+        self._do_save_sized(data, key, size)
 
     def load(self, key):
         """Load data under the given key from the database.
@@ -96,6 +111,76 @@ class IDatabase(abc.ABC):
                                       'data.')
         return self._do_load(key)
 
+    def contains(self, key) -> bool:
+        """Whether there are data under the given key in the database.
+
+        Parameters
+        ----------
+        key
+            The key for the data.
+
+        Returns
+        -------
+            True, if there are data for the given key in the database.
+
+        Raises
+        ------
+        DatabaseAccessError
+            If the database is not open.
+        """
+
+        self._assert_database_is_open('The database must be open when '
+                                      'checking presence of data.')
+        return self._do_contains(key)
+
+    def contains_many(self, keys) -> set:
+        """Find out which of the given keys have data in the database.
+
+        Parameters
+        ----------
+        keys
+            Iterable of the keys for the data.
+
+        Returns
+        -------
+            Set of the given keys which have data in the database.
+
+        Raises
+        ------
+        DatabaseAccessError
+            If the database is not open.
+        """
+
+        self._assert_database_is_open('The database must be open when '
+                                      'checking presence of data.')
+        return self._do_contains_many(keys)
+
+    def load_many(self, keys) -> dict:
+        """Load data under the given keys from the database.
+
+        Unlike `load`, the method does not raise DataNotFound for missing
+        keys, they are just left out from the result.
+
+        Parameters
+        ----------
+        keys
+            Iterable of the keys for the data.
+
+        Returns
+        -------
+            Dictionary which maps the given keys present in the database to
+            their data.
+
+        Raises
+        ------
+        DatabaseAccessError
+            If the database is not open.
+        """
+
+        self._assert_database_is_open('The database must be open when loading '
+                                      'data.')
+        return self._do_load_many(keys)
+
     def delete(self, key):
         """Delete data under the given key from the database.
 
@@ -140,6 +225,23 @@ class IDatabase(abc.ABC):
 
         pass
 
+    def _do_save_sized(self, data, key, size: Optional[int]):
+        """Do save the given data of the known size under the given key.
+
+        The default implementation ignores the size and calls `_do_save`.
+
+        Parameters
+        ----------
+        data
+            The data to save to the database.
+        key
+            The key for the data.
+        size
+            The size of the data in bytes, or None if it is not known.
+        """
+
+        self._do_save(data, key)
+
     @abc.abstractmethod
     def _do_load(self, key):
         """Do load data under the given key from the database.
@@ -159,6 +261,90 @@ class IDatabase(abc.ABC):
             If there are no data for the given key in the database.
         """
 
+    def _do_contains(self, key) -> bool:
+        """Do check whether there are data under the given key.
+
+        The default implementation loads the data (see
+        `_contains_by_loading`), as it is the only way available to every
+        database. Subclasses are supposed to override the method with a
+        cheap check, which does not load the data.
+
+        Parameters
+        ----------
+        key
+            The key for the data.
+
+        Returns
+        -------
+            True, if there are data for the given key in the database.
+        """
+
+        return self._contains_by_loading(key)
+
+    def _contains_by_loading(self, key) -> bool:
+        """Check whether there are data under the given key by loading them.
+
+        The fallback implementation of `_do_contains`. Note that it costs as
+        much as the load itself.
+
+        Parameters
+        ----------
+        key
+            The key for the data.
+
+        Returns
+        -------
+            True, if there are data for the given key in the database.
+        """
+
+        try:
+            self._do_load(key)
+            return True
+        except DataNotFound:
+            return False
+
+    def _do_contains_many(self, keys) -> set:
+        """Do find out which of the given keys have data in the database.
+
+        The default implementation checks the keys one by one via
+        `_do_contains`.
+
+        Parameters
+        ----------
+        keys
+            Iterable of the keys for the data.
+
+        Returns
+        -------
+            Set of the given keys which have data in the database.
+        """
+
+        return {key for key in keys if self._do_contains(key)}
+
+    def _do_load_many(self, keys) -> dict:
+        """Do load data under the given keys from the database.
+
+        The default implementation loads the keys one by one via `_do_load`.
+
+        Parameters
+        ----------
+        keys
+            Iterable of the keys for the data.
+
+        Returns
+        -------
+            Dictionary which maps the given keys present in the database to
+            their data.
+        """
+
+        data_by_key = {}
+        for key in keys:
+            try:
+                data_by_key[key] = self._do_load(key)
+            except DataNotFound:
+                pass
+        return data_by_key
+
     @abc.abstractmethod
     def _do_delete(self, key):
         """Do delete data under the given key from the database.
@@ -1,2 +1,10 @@
+from neads.evaluation_manager.i_evaluation_manager import IEvaluationManager
 from neads.evaluation_manager.single_thread_evaluation_manager import \
     SingleThreadEvaluationManager, ComplexAlgorithm
+from neads.evaluation_manager.pool_evaluation_manager import \
+    ProcessPoolEvaluationManager
+from neads.evaluation_manager.base_evaluation_manager import \
+    BaseEvaluationManager
+from neads.evaluation_manager.cost_model import CostModel
+from neads.evaluation_manager.evaluation_planner import \
+    EvaluationPlanner, EvaluationPlan
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+import abc
+
+import psutil
+
+from neads.evaluation_manager.i_evaluation_manager import IEvaluationManager
+from neads.evaluation_manager.cost_model import CostModel
+from neads._internal_utils.background_writer import BackgroundWriter
+from neads._internal_utils.spill_arena import SpillArena
+from neads.evaluation_manager.evaluation_planner import EvaluationPlanner
+from neads.evaluation_manager.single_thread_evaluation_manager \
+    .evaluation_state import EvaluationState
+
+if TYPE_CHECKING:
+    from neads.activation_model import SealedActivationGraph, SealedActivation
+    from neads.database import IDatabase
+    from neads._internal_utils.serializers import ISerializer
+    from neads.evaluation_manager.single_thread_evaluation_manager \
+        .evaluation_algorithms.i_evaluation_algorithm import \
+        IEvaluationAlgorithm
+    from neads.evaluation_manager.evaluation_planner import EvaluationPlan
+
+
+class BaseEvaluationManager(IEvaluationManager, abc.ABC):
+    """EvaluationManager which evaluates the graph by an EvaluationAlgorithm.
+
+    The manager creates an EvaluationState of the graph over its database
+    and lets an EvaluationAlgorithm evaluate it. The subclasses only choose
+    the default algorithm.
+    """
+
+    def __init__(self, database: IDatabase, *, record_costs=True,
+                 cost_model_path=None, spill_to_database=False,
+                 write_behind=False,
+                 spill_serializer: Optional[ISerializer] = None,
+                 spill_arena=False, spill_directory=None,
+                 batch_triggers=False):
+        """Initialize a BaseEvaluationManager instance.
+
+        Parameters
+        ----------
+        database
+            Database for Activations' data. The database is supposed to be
+            closed.
+        record_costs
+            Whether the costs of plugins' evaluation are recorded to a
+            CostModel. The costs help the default algorithm to schedule
+            the evaluation.
+        cost_model_path
+            File where the CostModel is persisted between evaluations (e.g.
+            next to the database). The recorded costs are loaded from there
+            before the evaluation and saved there afterwards, they are also
+            used by `plan`. By default, the costs are not persisted.
+        spill_to_database
+            Whether the data stored to disk under memory pressure are
+            reloaded from the database instead of a tmp file. It saves the
+            writes, if the database is fast enough to read from.
+        write_behind
+            Whether the data stored to disk under memory pressure are
+            written to tmp files in the background, so the evaluation does
+            not wait for the writes.
+        spill_serializer
+            Serializer of the tmp files, e.g. MemoryMapSerializer, which
+            loads the stored arrays as memory-mapped views without copying.
+            By default, pickle is used.
+        spill_arena
+            Whether the data stored to disk are appended to a single arena
+            file (see SpillArena) instead of a tmp file for each node. It
+            saves creation of many files in large evaluations.
+        spill_directory
+            Directory of the arena file, e.g. on a fast local disk. By
+            default, the system's temp directory. Used only with
+            `spill_arena`.
+        batch_triggers
+            Whether the eligible trigger-on-descendants methods are invoked
+            in batches, whose new Activations are incorporated at once (see
+            EvaluationState). It pays off for graphs with many triggers.
+        """
+
+        self._database = database
+        self._record_costs = record_costs
+        self._cost_model_path = cost_model_path
+        self._spill_to_database = spill_to_database
+        self._write_behind = write_behind
+        self._spill_serializer = spill_serializer
+        self._spill_arena = spill_arena
+        self._spill_directory = spill_directory
+        self._batch_triggers = batch_triggers
+
+    def evaluate(self, activation_graph: SealedActivationGraph,
+                 evaluation_algorithm: IEvaluationAlgorithm = None) \
+            -> dict[SealedActivation, Any]:
+        """Evaluate the given graph.
+
+        Evaluation means that all the trigger methods in the graph will be
+        evaluated (even of the subsequently created Activations) and data of
+        childless Activations will be returned.
+
+        Parameters
+        ----------
+        activation_graph
+            The graph to be evaluated. Note that it may be changed
+            (mostly expanded) during the evaluation (as a consequence of
+            trigger's evaluation).
+        evaluation_algorithm
+            The algorithm which will execute the evaluation. By default,
+            the manager's default algorithm (see the subclasses).
+
+        Returns
+        -------
+            Dictionary which maps childless Activations of the graph to their
+            results.
+        """
+
+        algorithm = evaluation_algorithm \
+            if evaluation_algorithm is not None \
+            else self._get_default_algorithm()
+        with self._database:
+            cost_model = self._get_cost_model()
+            writer = BackgroundWriter() if self._write_behind else None
+            arena = SpillArena(self._spill_directory) \
+                if self._spill_arena \
+                else None
+            evaluation_state = EvaluationState(
+                activation_graph, self._database, cost_model,
+                spill_to_database=self._spill_to_database,
+                writer=writer,
+                spill_serializer=self._spill_serializer,
+                spill_arena=arena,
+                batch_triggers=self._batch_triggers
+            )
+            try:
+                results = algorithm.evaluate(evaluation_state)
+            finally:
+                # The costs of a failed evaluation are worth keeping as well
+                if cost_model is not None \
+                        and self._cost_model_path is not None:
+                    cost_model.save_to(self._cost_model_path)
+                try:
+                    if writer is not None:
+                        writer.close()
+                finally:
+                    if arena is not None:
+                        arena.close()
+        return results
+
+    def plan(self, activation_graph: SealedActivationGraph) \
+            -> EvaluationPlan:
+        """Plan the evaluation of the given graph without running any plugin.
+
+        The database is checked for data of the graph's Activations to find
+        out which Activations would be loaded and which recomputed. The run
+        time and memory of the evaluation are predicted from the costs
+        recorded in previous evaluations (if they are persisted, see
+        `cost_model_path`).
+
+        Parameters
+        ----------
+        activation_graph
+            The graph whose evaluation is planned. It is not changed, i.e.
+            the plan reaches only as far as the present triggers allow.
+
+        Returns
+        -------
+            The plan of the evaluation.
+        """
+
+        cost_model = CostModel.load_from(self._cost_model_path) \
+            if self._cost_model_path is not None \
+            else None
+        with self._database:
+            planner = EvaluationPlanner(self._database, cost_model)
+            return planner.plan(activation_graph)
+
+    def _get_cost_model(self):
+        """Return the CostModel for the evaluation, if costs are recorded.
+
+        Returns
+        -------
+            The persisted CostModel (or a new one) if the costs are
+            recorded. Otherwise None.
+        """
+
+        if not self._record_costs:
+            return None
+        elif self._cost_model_path is not None:
+            return CostModel.load_from(self._cost_model_path)
+        else:
+            return CostModel()
+
+    @abc.abstractmethod
+    def _get_default_algorithm(self) -> IEvaluationAlgorithm:
+        """Create the default EvaluationAlgorithm.
+
+        Returns
+        -------
+            New instance of the algorithm used, if `evaluate` is not given
+            any.
+        """
+
+        raise NotImplementedError()
+
+    @staticmethod
+    def _get_default_memory_limit():
+        """Return the memory limit of the default algorithms.
+
+        Returns
+        -------
+            1/2 of total physical memory (provided by psutil).
+        """
+
+        coefficient = 1/2
+        # Surprisingly, this is actually the total physical memory, see the doc
+        total_physical_memory = psutil.virtual_memory().total
+        return total_physical_memory * coefficient
@@ -0,0 +1,258 @@
+"""Record and predict costs of plugins' evaluation."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Optional, Any, Union
+import os
+import pickle
+import tempfile
+import time
+
+import neads._internal_utils.memory_info as memory_info
+
+if TYPE_CHECKING:
+    from neads.activation_model.plugin import PluginID
+    from neads.evaluation_manager.single_thread_evaluation_manager.data_node \
+        import DataNode
+
+
+def measure_call(function: Callable, *args, **kwargs) \
+        -> tuple[Any, float, int]:
+    """Call the function and measure its wall time and memory consumption.
+
+    The memory consumption is measured as the increase of the resident
+    memory of the process during the call. Note that if more functions run
+    concurrently in the process, the increase is shared among them.
+
+    Parameters
+    ----------
+    function
+        The function to call.
+    args
+        Positional arguments for the function.
+    kwargs
+        Keyword arguments for the function.
+
+    Returns
+    -------
+        A 3-tuple with the result of the function, the wall time of the call
+        in seconds and the memory delta in bytes (at least 0).
+    """
+
+    memory_before = memory_info.get_process_ram_memory()
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    wall_time = time.perf_counter() - start
+    memory_delta = memory_info.get_process_ram_memory() - memory_before
+    return result, wall_time, max(memory_delta, 0)
+
+
+class PluginCosts:
+    """Statistics of the evaluations of a single plugin."""
+
+    def __init__(self):
+        """Initialize the PluginCosts without any evaluation."""
+
+        self.count = 0
+        self.total_time = 0.
+        self.max_time = 0.
+        self.total_memory_delta = 0
+        self.max_memory_delta = 0
+        self.total_result_size = 0
+        self.max_result_size = 0
+
+    def record(self, wall_time: float, memory_delta: int, result_size: int):
+        """Record an evaluation of the plugin.
+
+        Parameters
+        ----------
+        wall_time
+            Wall time of the evaluation in seconds.
+        memory_delta
+            Increase of the memory during the evaluation in bytes.
+        result_size
+            Size of the result of the evaluation in bytes.
+        """
+
+        self.count += 1
+        self.total_time += wall_time
+        self.max_time = max(self.max_time, wall_time)
+        self.total_memory_delta += memory_delta
+        self.max_memory_delta = max(self.max_memory_delta, memory_delta)
+        self.total_result_size += result_size
+        self.max_result_size = max(self.max_result_size, result_size)
+
+    @property
+    def mean_time(self) -> float:
+        """Mean wall time of the evaluations in seconds."""
+        return self.total_time / self.count if self.count else 0.
+
+    @property
+    def mean_memory_delta(self) -> float:
+        """Mean increase of memory during the evaluations in bytes."""
+        return self.total_memory_delta / self.count if self.count else 0.
+
+    @property
+    def mean_result_size(self) -> float:
+        """Mean size of the results in bytes."""
+        return self.total_result_size / self.count if self.count else 0.
+
+
+class CostModel:
+    """Costs of the evaluations of plugins, keyed by PluginID.
+
+    The CostModel is filled by DataNodes after each evaluation of a plugin.
+    It may be persisted in a file (e.g. next to the database of the evaluated
+    graph), so the costs recorded in previous runs can be used to predict
+    the costs of the evaluation of a new graph.
+    """
+
+    @staticmethod
+    def load_from(path: Union[str, os.PathLike]) -> CostModel:
+        """Load the CostModel from the file.
+
+        Parameters
+        ----------
+        path
+            The file with the CostModel.
+
+        Returns
+        -------
+            The CostModel saved in the file or a new empty CostModel, if the
+            file does not exist.
+        """
+
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return CostModel()
+
+    def __init__(self):
+        """Initialize an empty CostModel."""
+
+        self._costs: dict[PluginID, PluginCosts] = {}
+        # Aggregates of all plugins, so the mean time is not recomputed
+        self._total_count = 0
+        self._total_time = 0.
+
+    def save_to(self, path: Union[str, os.PathLike]):
+        """Save the CostModel to the file.
+
+        The file is replaced at once, so a failure during the write does not
+        damage the previously saved CostModel.
+
+        Parameters
+        ----------
+        path
+            The file where the CostModel will be saved.
+        """
+
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def __getstate__(self):
+        return {'_costs': self._costs}
+
+    def __setstate__(self, state):
+        self._costs = state['_costs']
+        self._total_count = sum(c.count for c in self._costs.values())
+        self._total_time = sum(c.total_time for c in self._costs.values())
+
+    def record(self, plugin_id: PluginID, wall_time: float,
+               memory_delta: int, result_size: int):
+        """Record an evaluation of the plugin.
+
+        Parameters
+        ----------
+        plugin_id
+            ID of the evaluated plugin.
+        wall_time
+            Wall time of the evaluation in seconds.
+        memory_delta
+            Increase of the memory during the evaluation in bytes.
+        result_size
+            Size of the result of the evaluation in bytes.
+        """
+
+        if (costs := self._costs.get(plugin_id)) is None:
+            costs = self._costs[plugin_id] = PluginCosts()
+        costs.record(wall_time, memory_delta, result_size)
+        self._total_count += 1
+        self._total_time += wall_time
+
+    def get_costs(self, plugin_id: PluginID) -> Optional[PluginCosts]:
+        """Return recorded costs of the plugin.
+
+        Returns
+        -------
+            The costs of the plugin or None, if there is no record of the
+            plugin.
+        """
+
+        return self._costs.get(plugin_id)
+
+    @property
+    def mean_time(self) -> Optional[float]:
+        """Mean wall time of all recorded evaluations (of all plugins).
+
+        None is returned, if there is no record.
+        """
+
+        if self._total_count:
+            return self._total_time / self._total_count
+        else:
+            return None
+
+    def estimate_time(self, plugin_id: PluginID,
+                      default: Optional[float] = None) -> Optional[float]:
+        """Estimate wall time of the plugin's evaluation.
+
+        Parameters
+        ----------
+        plugin_id
+            ID of the plugin.
+        default
+            The value returned for plugins without a record.
+
+        Returns
+        -------
+            Mean wall time of the recorded evaluations of the plugin or the
+            default value, if there is no record.
+        """
+
+        if (costs := self._costs.get(plugin_id)) is not None:
+            return costs.mean_time
+        else:
+            return default
+
+    def estimate_node_cost(self, node: DataNode) -> float:
+        """Estimate wall time of the node's evaluation.
+
+        The method is suitable as a cost estimator of CriticalPathScheduler.
+
+        Parameters
+        ----------
+        node
+            The node whose cost is estimated.
+
+        Returns
+        -------
+            Estimated wall time of the node's plugin. For plugins without
+            record, the mean time of all plugins (or 1, if there is no record
+            at all).
+        """
+
+        mean_time = self.mean_time
+        default = mean_time if mean_time is not None else 1.
+        return self.estimate_time(node.activation.plugin.id, default)
+
+    def __contains__(self, plugin_id: PluginID):
+        return plugin_id in self._costs
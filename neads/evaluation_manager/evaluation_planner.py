@@ -0,0 +1,187 @@
+"""Plan evaluation of a graph without running any plugin."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from neads.activation_model import SealedActivationGraph, SealedActivation
+    from neads.database import IDatabase
+    from neads.evaluation_manager.cost_model import CostModel
+
+
+class EvaluationPlan:
+    """Prediction of the evaluation of a graph made by EvaluationPlanner.
+
+    The plan covers only the Activations which are present in the graph at
+    the time of planning. If the graph contains triggers, their invocation
+    will create new Activations, whose evaluation cannot be predicted
+    (`is_complete` is False in that case).
+
+    The predicted run time and memory are based on the costs recorded in the
+    CostModel. They are the sum of the mean run times of plugins of the
+    recomputed Activations and an upper estimate of the memory needed for
+    their data (i.e. sizes of the data of all loaded and recomputed
+    Activations plus the largest memory delta of a recomputed Activation),
+    respectively. That is, the memory estimate does not count on storing data
+    to disk.
+    """
+
+    def __init__(self):
+        """Initialize an empty EvaluationPlan."""
+
+        self.loaded: list[SealedActivation] = []
+        self.recomputed: list[SealedActivation] = []
+        self.skipped: list[SealedActivation] = []
+        self.pending_triggers = 0
+        self.predicted_runtime = 0.
+        self.predicted_peak_memory = 0
+        # Recomputed Activations whose plugins have no record in CostModel
+        self.unknown_cost_count = 0
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether the plan covers the whole evaluation.
+
+        That is, whether the graph contained no trigger at the time of
+        planning.
+        """
+
+        return not self.pending_triggers
+
+    @property
+    def hit_rate(self) -> float:
+        """Proportion of the loaded Activations among the processed ones.
+
+        The processed Activations are the loaded and recomputed ones. If
+        there are none, the hit rate is 1.
+        """
+
+        processed_count = len(self.loaded) + len(self.recomputed)
+        return len(self.loaded) / processed_count if processed_count else 1.
+
+    def __str__(self):
+        return f'EvaluationPlan(loaded={len(self.loaded)}, ' \
+               f'recomputed={len(self.recomputed)}, ' \
+               f'skipped={len(self.skipped)}, ' \
+               f'pending_triggers={self.pending_triggers}, ' \
+               f'predicted_runtime={self.predicted_runtime:.3f} s, ' \
+               f'predicted_peak_memory={self.predicted_peak_memory} B)'
+
+
+class EvaluationPlanner:
+    """Walk a graph and predict its evaluation without running any plugin.
+
+    The planner follows the logic of the evaluation. The data of the
+    childless Activations and of Activations with trigger-on-result must be
+    obtained. For each such Activation, the database is checked first. If
+    the Activation's data are present, they would be loaded. Otherwise, the
+    Activation would be recomputed and its parents are examined in the same
+    way. The Activations whose data would not be needed are skipped.
+    """
+
+    def __init__(self, database: IDatabase,
+                 cost_model: Optional[CostModel] = None):
+        """Initialize the EvaluationPlanner.
+
+        Parameters
+        ----------
+        database
+            The database which would be used for the evaluation. It must be
+            open when calling the `plan` method.
+        cost_model
+            CostModel for prediction of run time and memory. If None,
+            nothing is predicted (i.e. zeros are reported).
+        """
+
+        self._database = database
+        self._cost_model = cost_model
+
+    def plan(self, activation_graph: SealedActivationGraph) -> EvaluationPlan:
+        """Plan the evaluation of the graph.
+
+        The graph is not changed, i.e. no trigger is invoked.
+
+        Parameters
+        ----------
+        activation_graph
+            The graph whose evaluation is planned.
+
+        Returns
+        -------
+            The plan of the evaluation.
+        """
+
+        plan = EvaluationPlan()
+        plan.pending_triggers = self._count_triggers(activation_graph)
+
+        targets = [act for act in activation_graph
+                   if not act.children or act.trigger_on_result]
+        visited = set(targets)
+        frontier = targets
+        # The database is asked once per frontier
+        while frontier:
+            present_definitions = self._database.contains_many(
+                act.definition for act in frontier
+            )
+            next_frontier = []
+            for act in frontier:
+                if act.definition in present_definitions:
+                    plan.loaded.append(act)
+                else:
+                    plan.recomputed.append(act)
+                    for parent in act.parents:
+                        if parent not in visited:
+                            visited.add(parent)
+                            next_frontier.append(parent)
+            frontier = next_frontier
+
+        plan.skipped = [act for act in activation_graph
+                        if act not in visited]
+        self._predict_costs(plan)
+        return plan
+
+    @staticmethod
+    def _count_triggers(activation_graph):
+        """Count the triggers present in the graph.
+
+        Returns
+        -------
+            The number of trigger methods of the graph and its Activations.
+        """
+
+        count = 1 if activation_graph.trigger_method else 0
+        for act in activation_graph:
+            count += act.trigger_on_result is not None
+            count += act.trigger_on_descendants is not None
+        return count
+
+    def _predict_costs(self, plan: EvaluationPlan):
+        """Fill in the prediction of run time and memory to the plan.
+
+        Parameters
+        ----------
+        plan
+            The plan with loaded and recomputed Activations.
+        """
+
+        if self._cost_model is None:
+            plan.unknown_cost_count = len(plan.recomputed)
+            return
+
+        mean_time = self._cost_model.mean_time
+        default_time = mean_time if mean_time is not None else 0.
+        data_size = 0
+        largest_delta = 0
+        for act in plan.loaded:
+            if costs := self._cost_model.get_costs(act.plugin.id):
+                data_size += costs.mean_result_size
+        for act in plan.recomputed:
+            if costs := self._cost_model.get_costs(act.plugin.id):
+                plan.predicted_runtime += costs.mean_time
+                data_size += costs.mean_result_size
+                largest_delta = max(largest_delta, costs.max_memory_delta)
+            else:
+                plan.predicted_runtime += default_time
+                plan.unknown_cost_count += 1
+        plan.predicted_peak_memory = int(data_size + largest_delta)
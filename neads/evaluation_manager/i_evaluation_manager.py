@@ -8,6 +8,7 @@ if TYPE_CHECKING:
     from neads.evaluation_manager.single_thread_evaluation_manager \
         .evaluation_algorithms.i_evaluation_algorithm import \
         IEvaluationAlgorithm
+    from neads.evaluation_manager.evaluation_planner import EvaluationPlan
 
 
 class IEvaluationManager(abc.ABC):
@@ -47,3 +48,35 @@ class IEvaluationManager(abc.ABC):
         """
 
         raise NotImplementedError()
+
+    def plan(self, activation_graph: SealedActivationGraph) \
+            -> EvaluationPlan:
+        """Plan the evaluation of the given graph without running any plugin.
+
+        The database is checked for data of the graph's Activations to find
+        out which Activations would be loaded and which recomputed. The run
+        time and memory of the evaluation are predicted from the costs
+        recorded in previous evaluations.
+
+        Planning is optional for EvaluationManagers. By default, it is not
+        supported.
+
+        Parameters
+        ----------
+        activation_graph
+            The graph whose evaluation is planned. It is not changed, i.e.
+            the plan reaches only as far as the present triggers allow.
+
+        Returns
+        -------
+            The plan of the evaluation.
+
+        Raises
+        ------
+        NotImplementedError
+            If the manager does not support planning.
+        """
+
+        raise NotImplementedError(
+            f'{type(self).__name__} does not support planning.'
+        )
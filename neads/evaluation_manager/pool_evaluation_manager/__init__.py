@@ -0,0 +1,4 @@
+from neads.evaluation_manager.pool_evaluation_manager.evaluation_manager \
+    import ProcessPoolEvaluationManager
+from neads.evaluation_manager.pool_evaluation_manager.pool_algorithm import \
+    PoolAlgorithm, ProcessPoolAlgorithm, ThreadPoolAlgorithm
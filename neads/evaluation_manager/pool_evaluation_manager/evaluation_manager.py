@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from neads.evaluation_manager.base_evaluation_manager import \
+    BaseEvaluationManager
+from neads.evaluation_manager.pool_evaluation_manager.pool_algorithm import \
+    ProcessPoolAlgorithm, ThreadPoolAlgorithm
+
+if TYPE_CHECKING:
+    from neads.database import IDatabase
+    from neads._internal_utils.serializers import ISerializer
+    from neads.evaluation_manager.single_thread_evaluation_manager \
+        .evaluation_algorithms.i_evaluation_algorithm import \
+        IEvaluationAlgorithm
+
+
+class ProcessPoolEvaluationManager(BaseEvaluationManager):
+    """The kind of EvaluationManager that evaluates plugins in more processes.
+
+    The EvaluationState of the graph is held by the calling process (the
+    coordinator), so all the trigger methods are invoked there. Only the
+    plugins of independent nodes are evaluated in parallel by a pool of
+    worker processes (or threads, see the `pool` parameter).
+    """
+
+    # The PoolAlgorithms used by default for the kinds of pool
+    _POOL_ALGORITHMS = {
+        'process': ProcessPoolAlgorithm,
+        'thread': ThreadPoolAlgorithm,
+    }
+
+    def __init__(self, database: IDatabase, *,
+                 max_workers: Optional[int] = None, pool: str = 'process',
+                 record_costs=True, cost_model_path=None,
+                 spill_to_database=False, write_behind=False,
+                 spill_serializer: Optional[ISerializer] = None,
+                 spill_arena=False, spill_directory=None,
+                 batch_triggers=False):
+        """Initialize a ProcessPoolEvaluationManager instance.
+
+        Parameters
+        ----------
+        database
+            Database for Activations' data. The database is supposed to be
+            closed.
+        max_workers
+            The number of worker processes. By default, the number of
+            CPUs of the machine.
+        pool
+            The kind of pool of the default algorithm, either 'process'
+            (ProcessPoolAlgorithm) or 'thread' (ThreadPoolAlgorithm). The
+            threads suit the plugins which release the GIL (e.g. NumPy).
+            Ignored, if the algorithm is passed to `evaluate`.
+        record_costs
+            Whether the costs of plugins' evaluation are recorded to a
+            CostModel. The costs help the default algorithm to schedule
+            the evaluation.
+        cost_model_path
+            File where the CostModel is persisted between evaluations (e.g.
+            next to the database). The recorded costs are loaded from there
+            before the evaluation and saved there afterwards, they are also
+            used by `plan`. By default, the costs are not persisted.
+        spill_to_database
+            Whether the data stored to disk under memory pressure are
+            reloaded from the database instead of a tmp file. It saves the
+            writes, if the database is fast enough to read from.
+        write_behind
+            Whether the data stored to disk under memory pressure are
+            written to tmp files in the background, so the evaluation does
+            not wait for the writes.
+        spill_serializer
+            Serializer of the tmp files, e.g. MemoryMapSerializer, which
+            loads the stored arrays as memory-mapped views without copying.
+            By default, pickle is used.
+        spill_arena
+            Whether the data stored to disk are appended to a single arena
+            file (see SpillArena) instead of a tmp file for each node. It
+            saves creation of many files in large evaluations.
+        spill_directory
+            Directory of the arena file, e.g. on a fast local disk. By
+            default, the system's temp directory. Used only with
+            `spill_arena`.
+        batch_triggers
+            Whether the eligible trigger-on-descendants methods are invoked
+            in batches, whose new Activations are incorporated at once (see
+            EvaluationState). It pays off for graphs with many triggers.
+
+        Raises
+        ------
+        ValueError
+            If the kind of pool is unknown.
+        """
+
+        if pool not in self._POOL_ALGORITHMS:
+            raise ValueError(f'Unknown pool {pool!r}, use one of '
+                             f'{list(self._POOL_ALGORITHMS)}.')
+
+        super().__init__(
+            database, record_costs=record_costs,
+            cost_model_path=cost_model_path,
+            spill_to_database=spill_to_database, write_behind=write_behind,
+            spill_serializer=spill_serializer, spill_arena=spill_arena,
+            spill_directory=spill_directory, batch_triggers=batch_triggers
+        )
+        self._max_workers = max_workers
+        self._pool = pool
+
+    def _get_default_algorithm(self) -> IEvaluationAlgorithm:
+        """Create the default EvaluationAlgorithm.
+
+        Returns
+        -------
+            PoolAlgorithm of the manager's kind of pool with the manager's
+            number of workers and memory limit set to 1/2 of total physical
+            memory (provided by psutil).
+        """
+
+        algorithm_type = self._POOL_ALGORITHMS[self._pool]
+        return algorithm_type(max_workers=self._max_workers,
+                              memory_limit=self._get_default_memory_limit())
@@ -0,0 +1,695 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+import abc
+import concurrent.futures
+import math
+import os
+import pickle
+
+from neads.evaluation_manager.single_thread_evaluation_manager \
+    .evaluation_algorithms.i_evaluation_algorithm import IEvaluationAlgorithm
+from neads.evaluation_manager.single_thread_evaluation_manager.data_node \
+    import DataNodeState
+from neads.evaluation_manager.single_thread_evaluation_manager \
+    .evaluation_algorithms.critical_path_scheduler import \
+    CriticalPathScheduler
+from neads.evaluation_manager.single_thread_evaluation_manager \
+    .evaluation_algorithms.memory_accountant import IMemoryAccountant, \
+    VirtualMemoryAccountant
+from neads.evaluation_manager.single_thread_evaluation_manager \
+    .evaluation_algorithms.eviction_policy import IEvictionPolicy, \
+    LRUEvictionPolicy
+from neads.evaluation_manager.cost_model import measure_call
+
+if TYPE_CHECKING:
+    from neads.activation_model import SealedActivation
+    from neads.activation_model.plugin import Plugin
+    from neads.evaluation_manager.single_thread_evaluation_manager \
+        .evaluation_state import EvaluationState
+    from neads.evaluation_manager.single_thread_evaluation_manager.data_node \
+        import DataNode
+
+import logging
+
+logger = logging.getLogger('neads.pool_algorithm')
+
+
+def _call_plugin(plugin: Plugin, args, kwargs):
+    """Call the plugin with the given arguments and measure its costs.
+
+    The function is executed by the workers of the pool. It is defined on
+    the module level, so it can be pickled.
+
+    Returns
+    -------
+        A 3-tuple with the result of the plugin, the wall time of the call
+        and the memory delta, see `measure_call`.
+    """
+
+    return measure_call(plugin, *args, **kwargs)
+
+
+class PoolAlgorithm(IEvaluationAlgorithm, abc.ABC):
+    """The algorithm which evaluates independent nodes in a pool of workers.
+
+    The algorithm runs a coordinator in the calling thread. The coordinator
+    owns the EvaluationState, i.e. it changes states of the DataNodes and
+    thus all the trigger methods are invoked in the calling thread (with the
+    usual semantics of EvaluationState). Only the plugins are called by the
+    workers.
+
+    The coordinator keeps the set of ready nodes, i.e. nodes in NO_DATA
+    state whose parents are processed. After a change of the graph, the new
+    ancestors of the significant nodes (objectives or unprocessed results)
+    are searched for ready nodes and the remaining nodes wait for their
+    parents. Unknown nodes are loaded from database on the way. Then, the
+    ready set is updated from the children of each processed node, so the
+    search visits each node only once. The ready nodes are dispatched to
+    the workers, until all the workers are busy. Then, the coordinator
+    waits for the first evaluation to finish and incorporates its result to
+    the EvaluationState (which may invoke triggers and change the
+    significant nodes). The ready nodes are dispatched in the order given
+    by the scheduler, by default the nodes on the critical path go first.
+    The scheduler ranks the new nodes after a change of the graph, its
+    ranks are updated as the nodes get processed.
+
+    The memory limit is enforced in the same way as in ComplexAlgorithm,
+    i.e. by storing data of some nodes to disk (the memory is measured by
+    a memory accountant as well). The nodes whose data are needed by the
+    running evaluations are never stored. If the memory consumption stays
+    above the limit, no new evaluation is dispatched until the running ones
+    finish (at least one evaluation is always allowed to run). As well, the
+    data of nodes which will not be read again are released right away.
+    """
+
+    def __init__(self, *, max_workers: Optional[int] = None,
+                 memory_limit=None, proportion_to_store=0.3,
+                 scheduler: Optional[CriticalPathScheduler] = None,
+                 memory_accountant: Optional[IMemoryAccountant] = None,
+                 eviction_policy: Optional[IEvictionPolicy] = None):
+        """Initialize the PoolAlgorithm.
+
+        Parameters
+        ----------
+        max_workers
+            The number of workers in the pool. By default, the number of
+            CPUs of the machine.
+        memory_limit
+            Soft limit of memory for the coordinator process (as measured
+            by the memory accountant). The consumption of memory should not
+            greatly exceed the limit.
+        proportion_to_store
+            Which proportion of nodes' data is supposed to be stored,
+            when memory saving is requested. Must lie between 0 and 1.
+        scheduler
+            Scheduler which ranks the ready nodes. By default,
+            CriticalPathScheduler with costs estimated by the CostModel of
+            the EvaluationState (or unit cost of nodes, if there is none).
+        memory_accountant
+            Accountant which measures the memory subject to the memory
+            limit. By default, VirtualMemoryAccountant, i.e. the virtual
+            memory of the coordinator process.
+        eviction_policy
+            Policy which chooses the nodes to store to disk. By default,
+            LRUEvictionPolicy.
+        """
+
+        self._max_workers = max_workers \
+            if max_workers is not None \
+            else os.cpu_count() or 1
+
+        # Soft limit of memory for the process
+        self._memory_limit = memory_limit \
+            if memory_limit is not None \
+            else math.inf
+
+        # Proportion of memory to swap from total memory occupied by node's data
+        self._proportion_to_store = proportion_to_store
+
+        self._given_scheduler = scheduler
+        self._scheduler = scheduler
+
+        self._memory_accountant = memory_accountant \
+            if memory_accountant is not None \
+            else VirtualMemoryAccountant()
+
+        self._eviction_policy = eviction_policy \
+            if eviction_policy is not None \
+            else LRUEvictionPolicy()
+
+        self._evaluation_state: Optional[EvaluationState] = None
+        # The version of the graph analyzed by the scheduler
+        self._analyzed_version: Optional[int] = None
+        self._executor: Optional[concurrent.futures.Executor] = None
+
+        # Evaluations in progress
+        self._running: dict[concurrent.futures.Future, DataNode] = {}
+
+        # The version of the graph searched for ready nodes
+        self._searched_version: Optional[int] = None
+        # Nodes visited by the search for ready nodes
+        self._visited: set[DataNode] = set()
+        # Unprocessed significant nodes found by the search
+        self._significant: dict[DataNode, None] = {}
+        # Nodes with some unprocessed parents and the number of such parents
+        self._waiting: dict[DataNode, int] = {}
+        # Nodes whose parents are processed and which are not dispatched
+        self._ready: dict[DataNode, None] = {}
+
+    @property
+    def max_workers(self):
+        """The number of workers in the pool."""
+        return self._max_workers
+
+    @abc.abstractmethod
+    def _create_executor(self) -> concurrent.futures.Executor:
+        """Create the executor with the pool of workers.
+
+        Returns
+        -------
+            New executor with `max_workers` workers.
+        """
+
+        raise NotImplementedError()
+
+    @property
+    @abc.abstractmethod
+    def _copy_arguments(self) -> bool:
+        """Whether the arguments for the workers must be copied.
+
+        The copy is not necessary, if the arguments are copied anyway when
+        passed to the workers.
+        """
+
+        raise NotImplementedError()
+
+    def _can_be_dispatched(self, node: DataNode) -> bool:
+        """Whether the node's plugin may be evaluated by the workers.
+
+        The nodes which cannot be dispatched are evaluated by the coordinator.
+
+        Parameters
+        ----------
+        node
+            The node which is about to be evaluated.
+
+        Returns
+        -------
+            True, if the plugin of the node may be evaluated by the workers.
+        """
+
+        return True
+
+    def evaluate(self, evaluation_state: EvaluationState) \
+            -> dict[SealedActivation, Any]:
+        """Alter the evaluation state to evaluate the underlying graph.
+
+        Parameters
+        ----------
+        evaluation_state
+            Instance of evaluation state, whose graph is evaluated.
+
+        Returns
+        -------
+            Dictionary which maps childless Activations of the graph to their
+            results.
+        """
+
+        self._evaluation_state = evaluation_state
+        self._scheduler = self._given_scheduler \
+            if self._given_scheduler is not None \
+            else self._get_default_scheduler()
+        self._analyzed_version = None
+        self._running = {}
+        self._searched_version = None
+        self._visited = set()
+        self._significant = {}
+        self._waiting = {}
+        self._ready = {}
+        self._memory_accountant.start(evaluation_state)
+        self._eviction_policy.start(evaluation_state)
+        self._memory_limit = \
+            self._memory_accountant.get_memory_limit(self._memory_limit)
+        try:
+            with self._create_executor() as executor:
+                self._executor = executor
+                try:
+                    while self._update_ready_nodes() or self._running:
+                        self._dispatch_ready_nodes()
+                        if self._running:
+                            self._finish_evaluations()
+                finally:
+                    # Do not wait for the results, which would be thrown away
+                    for future in self._running:
+                        future.cancel()
+                    self._running = {}
+                    self._executor = None
+                    self._visited = set()
+                    self._waiting = {}
+                    self._ready = {}
+
+            results = self._get_algorithm_result()
+        finally:
+            self._memory_accountant.stop()
+
+        return results
+
+    def _get_default_scheduler(self):
+        """Create the default scheduler for the evaluated EvaluationState.
+
+        Returns
+        -------
+            CriticalPathScheduler with costs estimated by the ES's CostModel
+            or with unit costs, if the ES does not have any.
+        """
+
+        if (cost_model := self._evaluation_state.cost_model) is not None:
+            return CriticalPathScheduler(cost_model.estimate_node_cost)
+        else:
+            return CriticalPathScheduler()
+
+    def _get_significant_nodes(self):
+        """Get the significant nodes.
+
+        The significant nodes are the ES's objectives and unprocessed ES's
+        results. These nodes needs to be processed eventually.
+
+        Returns
+        -------
+            List of significant nodes.
+        """
+
+        if self._evaluation_state.objectives:
+            return list(self._evaluation_state.objectives)
+        else:
+            return [node
+                    for node in self._evaluation_state.results
+                    if not self._is_processed(node)]
+
+    @staticmethod
+    def _is_processed(node):
+        """Whether the node is processed.
+
+        Processed nodes are the ones either in MEMORY or DISK state.
+
+        Parameters
+        ----------
+        node
+            The examined node.
+
+        Returns
+        -------
+            True, if the node is processed, i.e. either in MEMORY or DISK
+            state. Otherwise False.
+        """
+
+        return node.state is DataNodeState.MEMORY \
+            or node.state is DataNodeState.DISK
+
+    def _dispatch_ready_nodes(self):
+        """Dispatch ready nodes to the workers, while some worker is idle.
+
+        The ready nodes are dispatched in the order given by the scheduler,
+        i.e. the longest path from the node to a significant node first.
+        """
+
+        for node in self._scheduler.order_by_path_from(self._ready):
+            if len(self._running) >= self._max_workers:
+                break
+            # Some of the previous nodes may have been evaluated by the
+            # coordinator and their triggers invoked (if not dispatched)
+            if node.state is not DataNodeState.NO_DATA:
+                continue
+            if not self._has_memory_for_evaluation(node) and self._running:
+                # Wait for running evaluations to release memory
+                break
+            del self._ready[node]
+            self._dispatch(node)
+
+    def _update_ready_nodes(self) -> bool:
+        """Search the graph for ready nodes, if it has changed.
+
+        The presence of data of all UNKNOWN nodes is checked in the database
+        at once first. Then, the new ancestors of the significant nodes are
+        searched (see `_search_ready_nodes`) and the scheduler ranks the
+        new nodes. Nothing is searched, if the graph has not changed since the
+        last search.
+
+        Returns
+        -------
+            True, if some of the significant nodes is still unprocessed.
+        """
+
+        # Loading the nodes in the search may invoke triggers, thus repeat
+        while self._searched_version != self._evaluation_state.graph_version:
+            self._searched_version = self._evaluation_state.graph_version
+            self._evaluation_state.check_presence()
+            self._search_ready_nodes()
+
+        if self._analyzed_version is None:
+            self._scheduler.analyze(self._significant)
+        elif self._analyzed_version != self._evaluation_state.graph_version:
+            self._scheduler.update(self._significant)
+        self._analyzed_version = self._evaluation_state.graph_version
+        return bool(self._significant)
+
+    def _search_ready_nodes(self):
+        """Search the unvisited ancestors of the significant nodes.
+
+        The unprocessed nodes are sorted to the ready ones and the ones
+        waiting for their parents. The nodes with data present in the
+        database are loaded on the way (which may invoke triggers).
+
+        The nodes visited by the previous searches are skipped. As the graph
+        only grows by descendants of the existing nodes, the new ancestors of
+        a significant node are reachable only via new nodes.
+        """
+
+        significant_nodes = [node for node in self._get_significant_nodes()
+                             if not self._is_processed(node)]
+        self._significant.update((node, None) for node in significant_nodes)
+
+        # Reversed, so the first significant node is popped first
+        nodes_to_process = list(reversed(significant_nodes))
+        while nodes_to_process:
+            node = nodes_to_process.pop()
+            if node in self._visited:
+                continue
+            self._visited.add(node)
+
+            if self._is_processed(node):
+                continue
+            if node.state is DataNodeState.UNKNOWN and node.try_load():
+                self._mark_processed(node)
+                continue
+
+            # Now node.state == NO_DATA
+            unprocessed_parents = [parent for parent in node.parents
+                                   if not self._is_processed(parent)]
+            if unprocessed_parents:
+                # The count is decreased as the parents get processed
+                self._waiting[node] = len(unprocessed_parents)
+                nodes_to_process.extend(reversed(unprocessed_parents))
+            else:
+                self._ready[node] = None
+
+    def _mark_processed(self, node: DataNode):
+        """Update the ready nodes and the scheduler after processing the node.
+
+        The children of the node which waited only for the node become
+        ready.
+
+        Parameters
+        ----------
+        node
+            The node which got to MEMORY or DISK state.
+        """
+
+        self._scheduler.mark_processed(node)
+        self._significant.pop(node, None)
+        for child in node.children:
+            if child in self._waiting:
+                self._waiting[child] -= 1
+                if not self._waiting[child]:
+                    del self._waiting[child]
+                    self._ready[child] = None
+
+    def _dispatch(self, node: DataNode):
+        """Dispatch the node to a worker.
+
+        If the node cannot be dispatched, it is evaluated right away by the
+        coordinator.
+
+        Parameters
+        ----------
+        node
+            Ready node to evaluate.
+        """
+
+        self._load_nodes(node.parents)
+        self._mark_used(node.parents)
+        if self._can_be_dispatched(node):
+            logger.debug(f'Dispatching: {node}.')
+            arguments = node.get_actual_arguments(copy=self._copy_arguments)
+            future = self._executor.submit(_call_plugin,
+                                           node.activation.plugin,
+                                           arguments.args,
+                                           arguments.kwargs)
+            self._running[future] = node
+        else:
+            logger.debug(f'Evaluating in coordinator: {node}.')
+            node.evaluate()
+            self._mark_processed(node)
+            self._mark_used([node])
+            self._evaluation_state.release_dead_parents(node)
+
+    def _finish_evaluations(self):
+        """Wait for at least one evaluation to finish and process results.
+
+        The exceptions raised in a worker (by `_call_plugin`, i.e. by
+        `measure_call` and the plugin called by it) are re-raised by the
+        future's result.
+
+        Raises
+        ------
+        PluginException
+            When a plugin raises an exception.
+        Exception
+            Any other exception of the worker, e.g. when the result cannot
+            be pickled or the pool is broken.
+        """
+
+        done, _ = concurrent.futures.wait(
+            self._running,
+            return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        for future in done:
+            node = self._running.pop(future)
+            # Re-raises the exception raised in the worker by measure_call
+            data, wall_time, memory_delta = future.result()
+            node.set_evaluated_data(data, wall_time=wall_time,
+                                    memory_delta=memory_delta)
+            self._mark_processed(node)
+            self._mark_used([node])
+            # The data of parents are released without writing to disk
+            self._evaluation_state.release_dead_parents(node)
+
+    def _mark_used(self, nodes):
+        """Record the use of the given nodes' data.
+
+        Parameters
+        ----------
+        nodes
+            The nodes whose data were just used (or created).
+        """
+
+        self._eviction_policy.record_use(nodes)
+
+    def _get_nodes_in_use(self) -> set[DataNode]:
+        """Return nodes whose data are needed by the running evaluations."""
+
+        return {parent
+                for node in self._running.values()
+                for parent in node.parents}
+
+    def _has_memory_for_evaluation(self, node: DataNode) -> bool:
+        """Whether the evaluation of the node may start w.r.t. memory limit.
+
+        If the memory consumption exceeds the limit, the method tries to
+        store some nodes to disk first.
+
+        Parameters
+        ----------
+        node
+            The node which is about to be evaluated.
+
+        Returns
+        -------
+            True, if the memory consumption is below the limit (possibly after
+            storing some nodes). False, otherwise.
+        """
+
+        if not self._too_much_allocated():
+            return True
+        nodes_to_keep = self._get_nodes_in_use().union(node.parents)
+        self._save_memory(nodes_to_keep=nodes_to_keep)
+        return not self._too_much_allocated()
+
+    def _load_nodes(self, nodes):
+        """Ensure that the given nodes are in MEMORY state.
+
+        Parameters
+        ----------
+        nodes
+            The nodes to get to the MEMORY state. They must be processed,
+            see `_is_processed` method.
+        """
+
+        for node in nodes:
+            if node.state is DataNodeState.DISK:
+                node.load()
+            elif node.state is not DataNodeState.MEMORY:
+                raise ValueError(f'The node {node} must be either in MEMORY '
+                                 f'or DISK state.')
+
+    def _save_memory(self, *, nodes_to_keep=()):
+        """Move some nodes from MEMORY state to DISK state.
+
+        The order of nodes to store is given by the eviction policy. The
+        method guarantees preserving the state of nodes from the given
+        collection.
+
+        Parameters
+        ----------
+        nodes_to_keep
+            The nodes, whose state will be preserved, including the case when
+            they are in the MEMORY state.
+        """
+
+        logger.debug('Saving memory.')
+
+        memory_nodes = list(self._evaluation_state.memory_nodes)
+        total_used_memory_estimate = sum(node.data_size
+                                         for node in memory_nodes)
+        memory_to_store = int(total_used_memory_estimate
+                              * self._proportion_to_store)
+
+        swap_order = self._eviction_policy.get_eviction_order(
+            node for node in memory_nodes if node not in nodes_to_keep
+        )
+        current_saved_amount = 0
+        for node_to_store in swap_order:
+            if current_saved_amount >= memory_to_store:
+                break
+            node_to_store.store()
+            current_saved_amount += node_to_store.data_size
+
+        if current_saved_amount < memory_to_store:
+            logger.warning(
+                f'Not able to get below the memory limit. Saved '
+                f'{current_saved_amount} instead {memory_to_store}.'
+            )
+        self._memory_accountant.update()
+
+    def _too_much_allocated(self):
+        """True, if the accounted memory exceeds the memory limit."""
+        if self._memory_limit == math.inf:
+            return False
+        else:
+            return self._memory_accountant.used_memory > self._memory_limit
+
+    def _get_algorithm_result(self):
+        """Return the expected result of EvaluationAlgorithm's evaluate method.
+
+        Returns
+        -------
+            Dictionary which maps childless Activations of the graph to their
+            results.
+        """
+
+        self._load_nodes(self._evaluation_state.results)
+        # The evaluation is over, so the data are handed over without copy
+        result = {node.activation: node.get_data(copy=False)
+                  for node in self._evaluation_state.results}
+        return result
+
+
+class ProcessPoolAlgorithm(PoolAlgorithm):
+    """The PoolAlgorithm whose workers are separate processes.
+
+    The plugins are evaluated in parallel on all the cores of the machine.
+    The plugins and their arguments are pickled to be passed to the workers,
+    as well as their results on the way back. The plugins which cannot be
+    pickled (e.g. with a lambda as their method) are evaluated by the
+    coordinator.
+    """
+
+    def __init__(self, *, max_workers: Optional[int] = None,
+                 memory_limit=None, proportion_to_store=0.3,
+                 scheduler: Optional[CriticalPathScheduler] = None,
+                 memory_accountant: Optional[IMemoryAccountant] = None,
+                 eviction_policy: Optional[IEvictionPolicy] = None):
+        """Initialize the ProcessPoolAlgorithm.
+
+        Parameters
+        ----------
+        max_workers
+            The number of worker processes. By default, the number of
+            CPUs of the machine.
+        memory_limit
+            Soft limit of memory for the coordinator process (as measured
+            by the memory accountant). The consumption of memory should not
+            greatly exceed the limit.
+        proportion_to_store
+            Which proportion of nodes' data is supposed to be stored,
+            when memory saving is requested. Must lie between 0 and 1.
+        scheduler
+            Scheduler which ranks the ready nodes. By default,
+            CriticalPathScheduler with costs estimated by the CostModel of
+            the EvaluationState (or unit cost of nodes, if there is none).
+        memory_accountant
+            Accountant which measures the memory subject to the memory
+            limit. By default, VirtualMemoryAccountant, i.e. the virtual
+            memory of the coordinator process.
+        eviction_policy
+            Policy which chooses the nodes to store to disk. By default,
+            LRUEvictionPolicy.
+        """
+
+        super().__init__(max_workers=max_workers,
+                         memory_limit=memory_limit,
+                         proportion_to_store=proportion_to_store,
+                         scheduler=scheduler,
+                         memory_accountant=memory_accountant,
+                         eviction_policy=eviction_policy)
+        # Cache of plugins' pickle-ability (by PluginID)
+        self._is_picklable: dict[Any, bool] = {}
+
+    def _create_executor(self) -> concurrent.futures.Executor:
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=self._max_workers
+        )
+
+    @property
+    def _copy_arguments(self) -> bool:
+        # Pickling creates a copy
+        return False
+
+    def _can_be_dispatched(self, node: DataNode) -> bool:
+        """Whether the node's plugin can be pickled."""
+
+        plugin = node.activation.plugin
+        if (is_picklable := self._is_picklable.get(plugin.id)) is None:
+            try:
+                pickle.dumps(plugin)
+                is_picklable = True
+            except Exception:  # noqa: pickle may raise arbitrary exception
+                is_picklable = False
+            self._is_picklable[plugin.id] = is_picklable
+        return is_picklable
+
+
+class ThreadPoolAlgorithm(PoolAlgorithm):
+    """The PoolAlgorithm whose workers are threads of the process.
+
+    The algorithm is suitable for plugins which spend most of their time in
+    code releasing the GIL (e.g. NumPy, pandas). Unlike ProcessPoolAlgorithm,
+    the data of the nodes are shared by the workers and no pickling is
+    involved. The memory limit thus covers the data of all the concurrent
+    evaluations.
+
+    The plugins receive a deepcopy of the parents' data, as in the single
+    thread evaluation.
+    """
+
+    def _create_executor(self) -> concurrent.futures.Executor:
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix='neads_worker'
+        )
+
+    @property
+    def _copy_arguments(self) -> bool:
+        # The workers share memory with the coordinator
+        return True
@@ -4,14 +4,21 @@ from typing import TYPE_CHECKING, Callable, Iterable, Any, Optional
 from enum import Enum, auto
 from collections import defaultdict
 import copy as copy_module
+import inspect
 
 from neads._internal_utils.object_temp_file import ObjectTempFile
 import neads._internal_utils.memory_info as memory_info
+import neads._internal_utils.read_only as read_only
 from neads.database import DataNotFound
+from neads.evaluation_manager.cost_model import measure_call
 
 if TYPE_CHECKING:
     from neads.activation_model import SealedActivation
     from neads.database import IDatabase
+    from neads.evaluation_manager.cost_model import CostModel
+    from neads._internal_utils.background_writer import BackgroundWriter
+    from neads._internal_utils.serializers import ISerializer
+    from neads._internal_utils.spill_arena import SpillArena, ArenaFile
 
 import logging
 logger = logging.getLogger('neads.data_node')
@@ -48,7 +55,9 @@ class DataNode:
     them, they must be computed via evaluate() method.
 
     In MEMORY state, the node data are in memory. If it is necessary to release
-    some memory, the data may be moved to disk via store() method.
+    some memory, the data may be moved to disk via store() method. If the
+    data are not needed anymore, they may be released via release() method
+    (they remain in the database).
 
     In DISK state, the data are on disk. If they need to become active
     (usually because a child of the node is meant to be evaluated), the data
@@ -62,7 +71,13 @@ class DataNode:
     def __init__(self,
                  activation: SealedActivation,
                  parents: Iterable[DataNode],
-                 database: IDatabase):
+                 database: IDatabase,
+                 cost_model: Optional[CostModel] = None,
+                 *,
+                 spill_to_database: bool = False,
+                 writer: Optional[BackgroundWriter] = None,
+                 spill_serializer: Optional[ISerializer] = None,
+                 spill_arena: Optional[SpillArena] = None):
         """Initialize a DataNode instance.
 
         The initial state is UNKNOWN.
@@ -79,18 +94,45 @@ class DataNode:
             data from the database or save it there after evaluation
             (in case the data was not found). The database is expected to be
             open when calling the `try_load` method.
+        cost_model
+            CostModel where the costs of the evaluation of the node are
+            recorded. If None, the costs are not recorded.
+        spill_to_database
+            Whether the `store` method only releases the data, which are
+            loaded from the database again by `load`. Otherwise, the data
+            are written to a tmp file. The database always contains the
+            data of the node in MEMORY state (they were either loaded from
+            there or saved there after evaluation).
+        writer
+            BackgroundWriter which writes the tmp file, so the `store`
+            method does not wait for the write. If None, the tmp file is
+            written synchronously.
+        spill_serializer
+            Serializer of the tmp file. If None, the default serializer of
+            the tmp file is used (i.e. pickle).
+        spill_arena
+            SpillArena where the data are stored instead of a tmp file of
+            their own. The data are pickled to the arena, i.e. the
+            `spill_serializer` is not used.
         """
 
         self._activation: SealedActivation = activation
         self._parents: Iterable[DataNode] = parents
         self._children: list[DataNode] = []
+        # Number of children which are neither in MEMORY nor DISK state
+        self._pending_children_count = 0
         self._state: DataNodeState = DataNodeState.UNKNOWN
 
         self._data: Optional[Any] = None
         self._data_size: Optional[int] = None
 
         self._database: IDatabase = database
-        self._temp_file: Optional[ObjectTempFile] = None
+        self._cost_model: Optional[CostModel] = cost_model
+        self._temp_file: Optional[ObjectTempFile | ArenaFile] = None
+        self._spill_to_database = spill_to_database
+        self._writer = writer
+        self._spill_serializer = spill_serializer
+        self._spill_arena = spill_arena
 
         self._callbacks: \
             dict[tuple[DataNodeState, DataNodeState],
@@ -99,6 +141,7 @@ class DataNode:
 
         for parent in self._parents:
             parent._children.append(self)
+            parent._pending_children_count += 1
 
         logger.info(f'Created node: {self}.')
 
@@ -146,6 +189,17 @@ class DataNode:
 
         return self._children
 
+    @property
+    def pending_children_count(self):
+        """Number of children which are neither in MEMORY nor DISK state.
+
+        That is, the number of children which may still need the data of
+        the node. If there is none, the data will not be read again (unless
+        a new child is created).
+        """
+
+        return self._pending_children_count
+
     @property
     def has_trigger_on_result(self):
         """Whether the corresponding Activation has trigger-on_result."""
@@ -196,6 +250,23 @@ class DataNode:
         else:
             return self._data
 
+    def get_read_only_data(self):
+        """The read-only view of the data of the node.
+
+        Unlike `get_data`, the data are not copied, if they can be viewed as
+        read-only (e.g. numpy arrays, see `read_only.get_read_only_view`).
+        Thus, their modification either raises an exception or does not
+        affect the node's data.
+
+        Returns
+        -------
+            The read-only view of the node's data (or their deepcopy), if
+            the node is in MEMORY state. Otherwise None.
+        """
+
+        # If the state is not MEMORY, value is self._data is None
+        return read_only.get_read_only_view(self._data)
+
     def try_load(self) -> bool:
         """Try load the data from database.
 
@@ -221,15 +292,54 @@ class DataNode:
 
         self._check_appropriate_state(DataNodeState.UNKNOWN)
         try:
-            self._data = self._database.load(self._activation.definition)
-            self._data_size = memory_info.get_object_size(self._data)
-            self._change_state(DataNodeState.MEMORY)
-            logger.debug(f'Data found: {self}.')
-            return True
+            data = self._database.load(self._activation.definition)
         except DataNotFound:
-            self._change_state(DataNodeState.NO_DATA)
-            logger.debug(f'Data not found: {self}.')
+            self.set_not_found()
             return False
+        else:
+            self.set_loaded_data(data)
+            return True
+
+    def set_loaded_data(self, data):
+        """Set the data which were found in the database.
+
+        Allowed only in UNKNOWN state and the resulting state is MEMORY. The
+        method is the successful branch of `try_load` for callers which
+        loaded the data from the database themselves (e.g. in a batch).
+
+        Parameters
+        ----------
+        data
+            The data of the node loaded from the database.
+
+        Raises
+        ------
+        DataNodeStateException
+            If the DataNode is in different state than UNKNOWN.
+        """
+
+        self._check_appropriate_state(DataNodeState.UNKNOWN)
+        self._data = data
+        self._data_size = memory_info.get_object_size(self._data)
+        self._change_state(DataNodeState.MEMORY)
+        logger.debug(f'Data found: {self}.')
+
+    def set_not_found(self):
+        """Record that the data are not in the database.
+
+        Allowed only in UNKNOWN state and the resulting state is NO_DATA. The
+        method is the unsuccessful branch of `try_load` for callers which
+        checked the database themselves (e.g. in a batch).
+
+        Raises
+        ------
+        DataNodeStateException
+            If the DataNode is in different state than UNKNOWN.
+        """
+
+        self._check_appropriate_state(DataNodeState.UNKNOWN)
+        self._change_state(DataNodeState.NO_DATA)
+        logger.debug(f'Data not found: {self}.')
 
     def evaluate(self):
         """Evaluate the data.
@@ -250,6 +360,50 @@ class DataNode:
 
         logger.debug(f'Evaluating: {self}.')
 
+        argument_set = self.get_actual_arguments()
+
+        # Getting plugin and computing its result
+        plugin = self._activation.plugin
+        data, wall_time, memory_delta = measure_call(
+            plugin, *argument_set.args, **argument_set.kwargs
+        )
+
+        self.set_evaluated_data(data, wall_time=wall_time,
+                                memory_delta=memory_delta)
+        # Two log (start and end) are there due to possible low speed of eval
+
+    def get_actual_arguments(self, *, copy=True) -> inspect.BoundArguments:
+        """Return the actual arguments for the plugin of the node.
+
+        Allowed only in NO_DATA state, the state does not change. The parent
+        nodes MUST be in MEMORY state when calling the method.
+
+        Together with `set_evaluated_data`, the method allows evaluating the
+        plugin outside the DataNode (e.g. in a different process). The method
+        `evaluate` is equivalent to calling the plugin with the returned
+        arguments and passing its result to `set_evaluated_data`.
+
+        Parameters
+        ----------
+        copy
+            Whether the arguments contain a deepcopy of parents' data. It is
+            safe to leave out the copy, if the arguments are copied anyway
+            (e.g. by pickling them). If the plugin declares read-only
+            arguments, the read-only views of the data are used instead of
+            the deepcopy.
+
+        Returns
+        -------
+            The actual arguments for the plugin of the node.
+
+        Raises
+        ------
+        DataNodeStateException
+            If the DataNode is in different state than NO_DATA.
+        RuntimeError
+            A parent node was not in MEMORY state.
+        """
+
         # Initial state checks
         self._check_appropriate_state(DataNodeState.NO_DATA)
         for parent in self._parents:
@@ -263,27 +417,88 @@ class DataNode:
             parent._activation.symbol: parent._data
             for parent in self._parents
         }
-        argument_set = self._activation.argument_set.get_actual_arguments(
-            symbol_to_data_map
+        if copy and self._activation.plugin.read_only_arguments:
+            symbol_to_data_map = {
+                symbol: read_only.get_read_only_view(data)
+                for symbol, data in symbol_to_data_map.items()
+            }
+            copy = False
+        return self._activation.argument_set.get_actual_arguments(
+            symbol_to_data_map, copy=copy
         )
 
-        # Getting plugin and computing its result
-        plugin = self._activation.plugin
-        self._data = plugin(*argument_set.args, **argument_set.kwargs)
+    def set_evaluated_data(self, data, *,
+                           wall_time: Optional[float] = None,
+                           memory_delta: Optional[int] = None):
+        """Set the data computed by the plugin of the node.
+
+        Allowed only in NO_DATA state and the resulting state is MEMORY.
+        The data are saved to the database, as in the `evaluate` method.
+
+        Parameters
+        ----------
+        data
+            Result of the node's plugin called with the node's actual
+            arguments (see `get_actual_arguments`).
+        wall_time
+            Wall time of the plugin's evaluation in seconds, if measured.
+        memory_delta
+            Increase of memory during the plugin's evaluation in bytes,
+            if measured.
+
+        Raises
+        ------
+        DataNodeStateException
+            If the DataNode is in different state than NO_DATA.
+        """
+
+        self._check_appropriate_state(DataNodeState.NO_DATA)
+        self._data = data
 
         # Finishing the state-transition
-        self._database.save(self._data, self._activation.definition)
         self._data_size = memory_info.get_object_size(self._data)
+        self._database.save(self._data, self._activation.definition,
+                            size=self._data_size)
+        self._record_costs(wall_time, memory_delta)
         self._change_state(DataNodeState.MEMORY)
 
-        logger.debug(f'Evaluation finished: {self}.')
-        # Two log (start and end) are there due to possible low speed of eval 
+        if wall_time is not None:
+            logger.debug(f'Evaluation finished in {wall_time:.3f} s: {self}.')
+        else:
+            logger.debug(f'Evaluation finished: {self}.')
+
+    def _record_costs(self, wall_time, memory_delta):
+        """Record the costs of the evaluation to the cost model, if any.
+
+        The costs are recorded only if the wall time was measured.
+
+        Parameters
+        ----------
+        wall_time
+            Wall time of the plugin's evaluation in seconds or None.
+        memory_delta
+            Increase of memory during the plugin's evaluation in bytes or None.
+        """
+
+        if self._cost_model is not None and wall_time is not None:
+            self._cost_model.record(
+                self._activation.plugin.id,
+                wall_time,
+                memory_delta if memory_delta is not None else 0,
+                self._data_size
+            )
 
     def store(self):
         """Store data on disk.
 
         Allowed only in MEMORY state and the resulting state is DISK. It stores
         the data to tmp file and releases the pointer to the data instance.
+        If the node spills to database, nothing is written, as the data are
+        in the database already.
+
+        With a BackgroundWriter, the tmp file is written in the background
+        and the data are held by the writer until the write is done. The
+        `load` method waits for the write.
 
         Raises
         ------
@@ -294,9 +509,47 @@ class DataNode:
         logger.debug(f'Storing data to disk: {self}.')
 
         self._check_appropriate_state(DataNodeState.MEMORY)
-        if self._temp_file is None:
-            self._temp_file = self._OBJECT_TEMP_FILE_PROVIDER()
-        self._temp_file.save(self._data)
+        if not self._spill_to_database:
+            if self._temp_file is None:
+                self._temp_file = self._create_temp_file()
+            if self._writer is not None:
+                self._temp_file.save(self._data, self._data_size or 0)
+            else:
+                self._temp_file.save(self._data)
+        self._data = None  # Releasing reference, so GC can collect
+
+        self._change_state(DataNodeState.DISK)
+
+    def _create_temp_file(self) -> ObjectTempFile | ArenaFile:
+        """Create the tmp file for storing the data of the node."""
+
+        if self._spill_arena is not None:
+            return self._spill_arena.create_file(writer=self._writer)
+
+        kwargs = {}
+        if self._writer is not None:
+            kwargs['writer'] = self._writer
+        if self._spill_serializer is not None:
+            kwargs['serializer'] = self._spill_serializer
+        return self._OBJECT_TEMP_FILE_PROVIDER(**kwargs)
+
+    def release(self):
+        """Release the data from memory without storing them.
+
+        Allowed only in MEMORY state and the resulting state is DISK. Unlike
+        `store`, nothing is written to disk. The data remain in the database
+        (they were either loaded from there or saved there after
+        evaluation), so they can be loaded again by `load`.
+
+        Raises
+        ------
+        DataNodeStateException
+            If the DataNode is in different state than MEMORY.
+        """
+
+        logger.debug(f'Releasing data: {self}.')
+
+        self._check_appropriate_state(DataNodeState.MEMORY)
         self._data = None  # Releasing reference, so GC can collect
 
         self._change_state(DataNodeState.DISK)
@@ -305,7 +558,8 @@ class DataNode:
         """Load data to memory.
 
         Allowed only in DISK state and the resulting state is MEMORY. Data
-        are loaded from tmp file to memory.
+        are loaded from tmp file to memory or from the database, if the data
+        were released or spilled to database (i.e. never stored to tmp file).
 
         Raises
         ------
@@ -316,7 +570,68 @@ class DataNode:
         logger.debug(f'Loading data to memory: {self}.')
 
         self._check_appropriate_state(DataNodeState.DISK)
-        self._data = self._temp_file.load()
+        self._data = self.read_stored_data()
+
+        self._change_state(DataNodeState.MEMORY)
+
+    def read_stored_data(self):
+        """Read the data from where they are stored without changing state.
+
+        Allowed only in UNKNOWN and DISK state. In DISK state, the data are
+        read from tmp file or from the database (see `load`). In UNKNOWN
+        state, they are read from the database.
+
+        The method does not modify the node, so it may be called from
+        another thread (e.g. to prefetch the data), as long as the node does
+        not change its state meanwhile. The read data are then passed to
+        `set_reloaded_data` or `set_loaded_data`, respectively.
+
+        Returns
+        -------
+            The stored data of the node.
+
+        Raises
+        ------
+        DataNodeStateException
+            If the DataNode is in different state than UNKNOWN or DISK.
+        DataNotFound
+            If the node is in UNKNOWN state and its data are not in the
+            database.
+        """
+
+        if self._state is DataNodeState.DISK and self._temp_file is not None:
+            return self._temp_file.load()
+        elif self._state is DataNodeState.DISK \
+                or self._state is DataNodeState.UNKNOWN:
+            return self._database.load(self._activation.definition)
+        else:
+            raise DataNodeStateException(
+                f'The node must be in UNKNOWN or DISK state to read its '
+                f'stored data, but it is in {self._state}.'
+            )
+
+    def set_reloaded_data(self, data):
+        """Set the data which were read by `read_stored_data` in DISK state.
+
+        Allowed only in DISK state and the resulting state is MEMORY. The
+        method is the counterpart of `load` for callers which read the data
+        themselves (e.g. in the background).
+
+        Parameters
+        ----------
+        data
+            The data of the node read by `read_stored_data`.
+
+        Raises
+        ------
+        DataNodeStateException
+            If the DataNode is in different state than DISK.
+        """
+
+        logger.debug(f'Setting reloaded data: {self}.')
+
+        self._check_appropriate_state(DataNodeState.DISK)
+        self._data = data
 
         self._change_state(DataNodeState.MEMORY)
 
@@ -468,6 +783,11 @@ class DataNode:
 
         state_from = self._state
         self._state = state_to
+        # The node got its data for the first time
+        if state_to is DataNodeState.MEMORY \
+                and state_from is not DataNodeState.DISK:
+            for parent in self._parents:
+                parent._pending_children_count -= 1
         callback_list = self._callbacks[(state_from, state_to)]
         self._call_callbacks(callback_list)
 
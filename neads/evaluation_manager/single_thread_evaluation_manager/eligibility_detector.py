@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Iterable, Deque, Sequence, Union
 import collections
+import itertools
 
 from neads.activation_model import SealedActivation
 
@@ -82,7 +83,7 @@ class ActivationEligibilityDetector:
         # We start searching from Activation's children to avoid addition of
         # the Activation to `desc_with_trigger` list
         acts_to_process.extend(self._activation.children)
-        visited = set()
+        visited = set(self._activation.children)
         desc_with_trigger = []
 
         def does_have_trigger(activation):
@@ -98,6 +99,7 @@ class ActivationEligibilityDetector:
 
             for child in processed_act.children:
                 if child not in visited:
+                    visited.add(child)
                     acts_to_process.append(child)
 
         return desc_with_trigger
@@ -115,6 +117,12 @@ class EligibilityDetector:
 
     Then, the detector must be informed about such changes via `update`
     method.
+
+    The detector keeps the number of descendants with a trigger (i.e.
+    blockers) for each tracked Activation. After a trigger invocation, only
+    the counts of ancestors of the Activations which gained or lost
+    a trigger are updated, instead of searching the descendants of all
+    tracked Activations.
     """
 
     def __init__(self, graph: SealedActivationGraph):
@@ -128,11 +136,25 @@ class EligibilityDetector:
         """
 
         self._graph = graph
-        self._activations_detectors = {
-            act: ActivationEligibilityDetector(act)
-            for act in self._graph
-            if act.trigger_on_descendants
-        }
+        # Maps tracked Activations to the numbers of their blockers
+        self._blocker_counts: dict[SealedActivation, int] = {}
+        # Maps tracked Activations to the order in which the tracking began
+        self._tracking_order: dict[SealedActivation, int] = {}
+        self._tracking_counter = itertools.count()
+        # Maps tracking order of eligible Activations to the Activations
+        # The dict is ordered by the keys, unless `_is_eligible_sorted` is
+        # False (i.e. an Activation tracked earlier became eligible again)
+        self._eligible: dict[int, SealedActivation] = {}
+        self._is_eligible_sorted = True
+        # Activations with a trigger, i.e. the blockers of their ancestors
+        self._activations_with_trigger: set[SealedActivation] = set()
+
+        for act in self._graph:
+            if act.trigger_on_descendants:
+                self._start_tracking(act, 0)
+        for act in self._graph:
+            if _has_trigger(act):
+                self._add_activation_with_trigger(act)
 
     @property
     def graph(self):
@@ -146,14 +168,13 @@ class EligibilityDetector:
         Returns
         -------
             Return Activations whose trigger-on-descendants methods are
-            eligible for invocation.
+            eligible for invocation (in the order of their tracking).
         """
 
-        return tuple(
-            act
-            for act, detector in self._activations_detectors.items()
-            if detector.is_eligible
-        )
+        if not self._is_eligible_sorted:
+            self._eligible = dict(sorted(self._eligible.items()))
+            self._is_eligible_sorted = True
+        return tuple(self._eligible.values())
 
     @property
     def tracked_activations(self) -> Sequence:
@@ -165,7 +186,7 @@ class EligibilityDetector:
             trigger-on-descendants.
         """
 
-        return tuple(self._activations_detectors.keys())
+        return tuple(self._blocker_counts.keys())
 
     def update(self,
                invoked_object: Union[SealedActivation, SealedActivationGraph],
@@ -186,47 +207,174 @@ class EligibilityDetector:
             New Activations created by the invoked trigger method.
         """
 
-        # Trigger methods cannot modify trigger methods of existing Activations
-        # Thus, the Activation tracking can quit only after its invocation,
-        # unless the trigger-on-descendants is (re-)set.
+        self.update_many([invoked_object], new_activations)
+
+    def update_many(
+            self,
+            invoked_objects: Iterable[Union[SealedActivation,
+                                            SealedActivationGraph]],
+            new_activations: Iterable[SealedActivation]
+    ):
+        """Update the detector after invocation of several trigger methods.
+
+        The effect is the same as calling `update` for each of the invoked
+        objects with the Activations created by its trigger, but the changes
+        are processed at once.
+
+        Parameters
+        ----------
+        invoked_objects
+            The objects whose trigger methods were invoked.
+        new_activations
+            New Activations created by the invoked trigger methods.
+        """
 
-        # If the invoked trigger belongs to Activation
-        if isinstance(invoked_object, SealedActivation):
+        # Trigger methods cannot modify trigger methods of existing Activations
+        # Thus, only the invoked Activations and the new Activations may
+        # change their triggers (and so the counts of their ancestors)
+        invoked_activations = [obj for obj in invoked_objects
+                               if isinstance(obj, SealedActivation)]
+        new_activations = list(new_activations)
+        gained_trigger = []
+        lost_trigger = []
+
+        for invoked_act in invoked_activations:
             # The Activation has trigger-on-descendants but it is not tracked
             # It can happen, when trigger-on-result assigns
             # trigger-on-descendants
-            if invoked_object.trigger_on_descendants \
-                    and invoked_object not in self._activations_detectors:
-                self._start_tracking(invoked_object)
-            # The Activation does not have trigger-on-descendants but it is
-            # tracked
-            # That is the usual case after trigger-on-descendants invocation
-            elif not invoked_object.trigger_on_descendants \
-                    and invoked_object in self._activations_detectors:
-                self._end_tracking(invoked_object)
-
-        # Some of the new Activation may have assigned a trigger-on-descendants
-        # Thus, if new Activation have this trigger, we start its tracking
-        for new_act in new_activations:
-            if new_act.trigger_on_descendants:
-                self._activations_detectors[new_act] = \
-                    ActivationEligibilityDetector(new_act)
-
-        # Now update the whole pack
-        for detector in self._activations_detectors.values():
-            detector.update(invoked_object, new_activations)
-
-    def _start_tracking(self, activation):
+            # Or the Activation does not have trigger-on-descendants but it
+            # is tracked, that is the usual case after trigger-on-descendants
+            # invocation
+            if not invoked_act.trigger_on_descendants \
+                    and invoked_act in self._blocker_counts:
+                self._end_tracking(invoked_act)
+
+            has_trigger = _has_trigger(invoked_act)
+            had_trigger = invoked_act in self._activations_with_trigger
+            if has_trigger and not had_trigger:
+                gained_trigger.append(invoked_act)
+            elif had_trigger and not has_trigger:
+                lost_trigger.append(invoked_act)
+
+        gained_trigger.extend(
+            act for act in new_activations
+            if _has_trigger(act) and act not in self._activations_with_trigger
+        )
+        self._activations_with_trigger.update(gained_trigger)
+        self._activations_with_trigger.difference_update(lost_trigger)
+
+        # The newly tracked Activations count their blockers from scratch,
+        # so they already respect the changes above
+        newly_tracked = set()
+        for act in itertools.chain(invoked_activations, new_activations):
+            if act.trigger_on_descendants and act not in self._blocker_counts:
+                self._start_tracking(act, self._count_blockers(act))
+                newly_tracked.add(act)
+
+        for act in gained_trigger:
+            self._change_ancestors_counts(act, 1, newly_tracked)
+        for act in lost_trigger:
+            self._change_ancestors_counts(act, -1, newly_tracked)
+
+    @staticmethod
+    def get_blocked_activations(
+            activations: Iterable[SealedActivation],
+            new_activations: Iterable[SealedActivation]
+    ) -> set[SealedActivation]:
+        """Return the Activations blocked by the new Activations.
+
+        The detector need not be updated with the new Activations. Thus,
+        the method tells which of the eligible Activations remain eligible,
+        when more triggers are invoked before the detector is updated.
+
+        Parameters
+        ----------
+        activations
+            The Activations which are checked.
+        new_activations
+            New Activations created by trigger methods.
+
+        Returns
+        -------
+            Those of the given Activations which have a new Activation with
+            a trigger among their descendants.
+        """
+
+        activations = set(activations)
+        blocked = set()
+        for act in new_activations:
+            if _has_trigger(act):
+                blocked.update(_get_ancestors(act) & activations)
+        return blocked
+
+    def _add_activation_with_trigger(self, activation):
+        """Register the Activation with a trigger as a blocker.
+
+        Parameters
+        ----------
+        activation
+            Activation with a trigger.
+        """
+
+        self._activations_with_trigger.add(activation)
+        self._change_ancestors_counts(activation, 1)
+
+    def _change_ancestors_counts(self, activation, delta, excluded=()):
+        """Change the blocker counts of tracked ancestors of the Activation.
+
+        Parameters
+        ----------
+        activation
+            Activation which gained or lost a trigger.
+        delta
+            The change of the counts.
+        excluded
+            The ancestors whose counts are not changed.
+        """
+
+        for ancestor in _get_ancestors(activation):
+            if ancestor in self._blocker_counts and ancestor not in excluded:
+                count = self._blocker_counts[ancestor] + delta
+                self._blocker_counts[ancestor] = count
+                self._update_eligibility(ancestor, count)
+
+    def _count_blockers(self, activation):
+        """Return the number of descendants of the Activation with trigger.
+
+        Parameters
+        ----------
+        activation
+            Activation whose blockers are counted.
+        """
+
+        return sum(1 for descendant in _get_descendants(activation)
+                   if descendant in self._activations_with_trigger)
+
+    def _update_eligibility(self, activation, count):
+        order = self._tracking_order[activation]
+        if count:
+            self._eligible.pop(order, None)
+        elif order not in self._eligible:
+            # The Activations mostly become eligible in the order of their
+            # tracking, so the dict remains sorted
+            if self._eligible and order < next(reversed(self._eligible)):
+                self._is_eligible_sorted = False
+            self._eligible[order] = activation
+
+    def _start_tracking(self, activation, blocker_count):
         """Start tracking of the given Activation.
 
         Parameters
         ----------
         activation
             Activation to be tracked.
+        blocker_count
+            The number of descendants of the Activation with trigger.
         """
 
-        self._activations_detectors[activation] = \
-            ActivationEligibilityDetector(activation)
+        self._blocker_counts[activation] = blocker_count
+        self._tracking_order[activation] = next(self._tracking_counter)
+        self._update_eligibility(activation, blocker_count)
 
     def _end_tracking(self, activation):
         """End tracking of the given Activation.
@@ -237,4 +385,45 @@ class EligibilityDetector:
             Activation whose tracking ends.
         """
 
-        del self._activations_detectors[activation]
+        del self._blocker_counts[activation]
+        order = self._tracking_order.pop(activation)
+        self._eligible.pop(order, None)
+
+
+def _has_trigger(activation):
+    """Return whether the Activation has a trigger (of any kind)."""
+    return bool(activation.trigger_on_result
+                or activation.trigger_on_descendants)
+
+
+def _get_ancestors(activation):
+    """Return the set of all (proper) ancestors of the Activation."""
+    return _search(activation, lambda act: act.parents)
+
+
+def _get_descendants(activation):
+    """Return the set of all (proper) descendants of the Activation."""
+    return _search(activation, lambda act: act.children)
+
+
+def _search(activation, get_neighbours):
+    """Return the Activations reachable from the given one (excluding it).
+
+    Parameters
+    ----------
+    activation
+        The Activation where the search begins.
+    get_neighbours
+        Function which returns the neighbours of an Activation.
+    """
+
+    visited = set()
+    acts_to_process: Deque[SealedActivation] = collections.deque(
+        [activation]
+    )
+    while acts_to_process:
+        for neighbour in get_neighbours(acts_to_process.popleft()):
+            if neighbour not in visited:
+                visited.add(neighbour)
+                acts_to_process.append(neighbour)
+    return visited
@@ -5,3 +5,15 @@ from neads.evaluation_manager.single_thread_evaluation_manager \
     TopologicalOrderAlgorithm
 from neads.evaluation_manager.single_thread_evaluation_manager \
     .evaluation_algorithms.complex_algorithm import ComplexAlgorithm
+from neads.evaluation_manager.single_thread_evaluation_manager \
+    .evaluation_algorithms.critical_path_scheduler import \
+    CriticalPathScheduler
+from neads.evaluation_manager.single_thread_evaluation_manager \
+    .evaluation_algorithms.memory_accountant import IMemoryAccountant, \
+    VirtualMemoryAccountant, DataSizeAccountant, ResidentMemoryAccountant
+from neads.evaluation_manager.single_thread_evaluation_manager \
+    .evaluation_algorithms.eviction_policy import IEvictionPolicy, \
+    DFSEvictionPolicy, LRUEvictionPolicy, SizeWeightedEvictionPolicy, \
+    FutureUseEvictionPolicy, RecomputeCostEvictionPolicy
+from neads.evaluation_manager.single_thread_evaluation_manager \
+    .evaluation_algorithms.prefetcher import Prefetcher
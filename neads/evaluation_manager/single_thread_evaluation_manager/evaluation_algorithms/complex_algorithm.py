@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, Iterable, Optional
 import collections
 import math
 
@@ -8,8 +8,19 @@ from neads.evaluation_manager.single_thread_evaluation_manager \
     .evaluation_algorithms.i_evaluation_algorithm import IEvaluationAlgorithm
 from neads.evaluation_manager.single_thread_evaluation_manager.data_node \
     import DataNodeState
+from neads.evaluation_manager.single_thread_evaluation_manager \
+    .evaluation_algorithms.critical_path_scheduler import \
+    CriticalPathScheduler
+from neads.evaluation_manager.single_thread_evaluation_manager \
+    .evaluation_algorithms.memory_accountant import IMemoryAccountant, \
+    VirtualMemoryAccountant
+from neads.evaluation_manager.single_thread_evaluation_manager \
+    .evaluation_algorithms.eviction_policy import IEvictionPolicy, \
+    DFSEvictionPolicy
 
 if TYPE_CHECKING:
+    from neads.evaluation_manager.single_thread_evaluation_manager \
+        .evaluation_algorithms.prefetcher import Prefetcher
     from neads.activation_model import SealedActivation
     from neads.evaluation_manager.single_thread_evaluation_manager \
         .evaluation_state import EvaluationState
@@ -21,10 +32,6 @@ import logging
 logger = logging.getLogger('neads.complex_algorithm')
 
 
-# IDEA: Encapsulate 'new_order' so it is better protected from changes
-#  it will make the code much less confusing
-
-
 class ComplexAlgorithm(IEvaluationAlgorithm):
     """The algorithm which uses all EvaluationState capabilities.
 
@@ -34,24 +41,57 @@ class ComplexAlgorithm(IEvaluationAlgorithm):
     The algorithm process the significant (objectives and results) nodes one
     by one. By DFS from the node to evaluate, its descendants are subsequently
     loaded or evaluated. Throughout the evaluation, the amount of consumed
-    virtual memory is checked and kept around or below the memory limit by
-    storing data of some nodes to disk.
+    memory (by default virtual memory, see memory accountants) is checked
+    and kept around or below the memory limit by storing data of some nodes
+    to disk. The nodes to store are chosen by the eviction policy. The data
+    of nodes which will not be read again (all their children are processed)
+    are released right away without any write to disk.
+
+    The order of the significant nodes and the order in which the DFS visits
+    parents is given by the scheduler. By default, the nodes with the
+    longest remaining critical path go first.
+
+    With a prefetcher, the stored data of parents of the node to evaluate
+    are read in the background, while the DFS processes the other parents.
+    As well, the data of the next node of the DFS (or of its parents) are
+    read, while the plugin of the current node runs.
     """
 
-    def __init__(self, *, memory_limit=None, proportion_to_store=0.3):
+    def __init__(self, *, memory_limit=None, proportion_to_store=0.3,
+                 scheduler: Optional[CriticalPathScheduler] = None,
+                 memory_accountant: Optional[IMemoryAccountant] = None,
+                 eviction_policy: Optional[IEvictionPolicy] = None,
+                 prefetcher: Optional[Prefetcher] = None):
         """Initialize the ComplexAlgorithm.
 
         Parameters
         ----------
         memory_limit
-            Soft limit of virtual memory for the process. The consumption of
-            virtual memory should not greatly exceed the limit.
+            Soft limit of memory for the process (as measured by the memory
+            accountant). The consumption of memory should not greatly exceed
+            the limit.
         proportion_to_store
             Which proportion of nodes' data is supposed to be stored,
             when memory saving is requested. Must lie between 0 and 1.
+        scheduler
+            Scheduler which ranks the significant nodes and parents of nodes.
+            By default, CriticalPathScheduler with costs estimated by the
+            CostModel of the EvaluationState (or unit cost of nodes, if there
+            is none).
+        memory_accountant
+            Accountant which measures the memory subject to the memory
+            limit. By default, VirtualMemoryAccountant, i.e. the virtual
+            memory of the process.
+        eviction_policy
+            Policy which chooses the nodes to store to disk. By default,
+            DFSEvictionPolicy, which derives the order from the algorithm's
+            DFS.
+        prefetcher
+            Prefetcher which reads the stored data of parents ahead of their
+            use. By default, the data are read when needed.
         """
 
-        # Soft limit of virtual memory for the process
+        # Soft limit of memory for the process
         self._memory_limit = memory_limit \
             if memory_limit is not None \
             else math.inf
@@ -59,14 +99,28 @@ class ComplexAlgorithm(IEvaluationAlgorithm):
         # Proportion of memory to swap from total memory occupied by node's data
         self._proportion_to_store = proportion_to_store
 
-        self._evaluation_state: Optional[EvaluationState] = None
+        self._given_scheduler = scheduler
+        self._scheduler = scheduler
+
+        self._memory_accountant = memory_accountant \
+            if memory_accountant is not None \
+            else VirtualMemoryAccountant()
 
-        # Order in which the nodes are stored to disk (from start)
-        self._swap_order = collections.deque()
+        self._eviction_policy = eviction_policy \
+            if eviction_policy is not None \
+            else DFSEvictionPolicy()
+
+        self._prefetcher = prefetcher
+
+        self._evaluation_state: Optional[EvaluationState] = None
+        # The version of the graph analyzed by the scheduler
+        self._analyzed_version: Optional[int] = None
 
         # State of processing the current significant node
         self._necessary = []  # Nodes whose data are guaranteed to be used
         self._visited = []  # Visited and processed nodes
+        # Parents still to be processed by the DFS, one deque per level
+        self._upcoming: list[collections.deque[DataNode]] = []
 
     def evaluate(self, evaluation_state: EvaluationState) \
             -> dict[SealedActivation, Any]:
@@ -84,21 +138,60 @@ class ComplexAlgorithm(IEvaluationAlgorithm):
         """
 
         self._evaluation_state = evaluation_state
-        while node_to_process := self._get_significant_node():
-            self._necessary = []
-            self._visited = []
-            self._process(node_to_process)
-            self._update_swap_order()
+        self._scheduler = self._given_scheduler \
+            if self._given_scheduler is not None \
+            else self._get_default_scheduler()
+        self._analyzed_version = None
+        self._memory_accountant.start(evaluation_state)
+        self._eviction_policy.start(evaluation_state)
+        self._memory_limit = \
+            self._memory_accountant.get_memory_limit(self._memory_limit)
+        if self._prefetcher is not None:
+            self._prefetcher.start(evaluation_state, self._get_free_memory,
+                                   self._memory_accountant)
+        try:
+            while node_to_process := self._get_significant_node():
+                # Nodes without data in database are found in one pass
+                self._evaluation_state.check_presence()
+                self._necessary = []
+                self._visited = []
+                self._upcoming = []
+                self._process(node_to_process)
+                self._record_processing()
+            results = self._get_algorithm_result()
+        finally:
+            if self._prefetcher is not None:
+                self._prefetcher.stop()
+            self._memory_accountant.stop()
 
-        results = self._get_algorithm_result()
         return results
 
+    def _get_default_scheduler(self):
+        """Create the default scheduler for the evaluated EvaluationState.
+
+        Returns
+        -------
+            CriticalPathScheduler with costs estimated by the ES's CostModel
+            or with unit costs, if the ES does not have any.
+        """
+
+        if (cost_model := self._evaluation_state.cost_model) is not None:
+            return CriticalPathScheduler(cost_model.estimate_node_cost)
+        else:
+            return CriticalPathScheduler()
+
     def _get_significant_node(self):
         """Get next significant node.
 
         The significant nodes are the ES's objectives and unprocessed ES's
         results. These nodes needs to be processed eventually.
 
+        The node with the highest rank by the scheduler is chosen. The
+        scheduler then also holds ranks of the node's ancestors. After a
+        change of the graph, the scheduler ranks only the new nodes (see its
+        `update` method), otherwise the ranks are kept up to date by the
+        scheduler itself.
+
         Returns
         -------
             Next significant node or None, if there are no such nodes.
@@ -111,11 +204,12 @@ class ComplexAlgorithm(IEvaluationAlgorithm):
                                  for node in self._evaluation_state.results
                                  if not self._is_processed(node)]
 
-        try:
-            next_node = next(iter(significant_nodes))
-            return next_node
-        except StopIteration:
-            return None
+        if self._analyzed_version is None:
+            self._scheduler.analyze(significant_nodes)
+        elif self._analyzed_version != self._evaluation_state.graph_version:
+            self._scheduler.update(significant_nodes)
+        self._analyzed_version = self._evaluation_state.graph_version
+        return self._scheduler.select_by_path_to(significant_nodes)
 
     @staticmethod
     def _is_processed(node):
@@ -159,25 +253,36 @@ class ComplexAlgorithm(IEvaluationAlgorithm):
         if not self._is_processed(node):
             logger.info(f'Start processing: {node}.')
             # If node has data in database (i.e. load was successful)
-            if node.state is DataNodeState.UNKNOWN and node.try_load():
+            if node.state is DataNodeState.UNKNOWN and self._try_load(node):
                 pass  # Now node.state == MEMORY
             else:
                 # Now node.state == NO_DATA and needs to be evaluated
-                # Get parents data
-                for parent in node.parents:
-                    self._process(parent)  # DFS recursion
+                # Get parents data, the longest critical path first
+                ordered_parents = \
+                    self._scheduler.order_by_path_to(node.parents)
+                # Their stored data are read while the DFS goes on
+                if self._prefetcher is not None:
+                    self._prefetcher.prefetch(ordered_parents)
+                upcoming = collections.deque(ordered_parents)
+                self._upcoming.append(upcoming)
+                while upcoming:
+                    self._process(upcoming.popleft())  # DFS recursion
+                self._upcoming.pop()
                 # Load the nodes in case they were swapped to disk
                 self._load_nodes(node.parents)
+                # The next node's data are read while the plugin runs
+                if self._prefetcher is not None:
+                    self._prefetcher.prefetch(self._get_next_needed_nodes())
                 node.evaluate()
-                for parent in reversed(node.parents):
+                for parent in reversed(ordered_parents):
                     assert parent is self._necessary.pop()  # Parents were used
             new_data_in_memory = True
 
             logger.info(f'End processing: {node}.')
-            # Calculation of unprocessed nodes purely for logging purposes
-            unprocessed_nodes = [node for node in self._evaluation_state
-                                 if not self._is_processed(node)]
-            logger.info(f'Unprocessed nodes: {len(unprocessed_nodes)}.')
+            unprocessed_count = self._evaluation_state.get_node_count(
+                DataNodeState.UNKNOWN, DataNodeState.NO_DATA
+            )
+            logger.info(f'Unprocessed nodes: {unprocessed_count}.')
         else:
             # Processed nodes
             new_data_in_memory = False
@@ -186,11 +291,56 @@ class ComplexAlgorithm(IEvaluationAlgorithm):
         # The update is here to maintain the DFS post-order
         self._necessary.append(node)
         self._visited.append(node)
+        if new_data_in_memory:
+            self._scheduler.mark_processed(node)
+            self._eviction_policy.record_use([node])
+            # The data of parents are released without writing to disk
+            self._evaluation_state.release_dead_parents(node)
 
         # Check the limit, if new data arrived to memory
         if new_data_in_memory and self._too_much_allocated():
             self._save_memory()
 
+    def _get_next_needed_nodes(self) -> Iterable[DataNode]:
+        """Return the nodes whose data the DFS reads next.
+
+        That is, the next node to be processed by the DFS, if it has data
+        stored, or its parents, if it needs to be evaluated.
+
+        Returns
+        -------
+            The nodes whose data will be needed soon, the most urgent first.
+        """
+
+        next_node = next((upcoming[0] for upcoming in reversed(self._upcoming)
+                          if upcoming),
+                         None)
+        if next_node is None:
+            return []
+        elif next_node.state is DataNodeState.NO_DATA:
+            return self._scheduler.order_by_path_to(next_node.parents)
+        else:
+            return [next_node]
+
+    def _try_load(self, node):
+        """Try load the data of the UNKNOWN node, prefetched if possible.
+
+        Parameters
+        ----------
+        node
+            The node in UNKNOWN state.
+
+        Returns
+        -------
+            True, if the data were loaded (the node is in MEMORY state).
+            False otherwise (the node is in NO_DATA state).
+        """
+
+        if self._prefetcher is not None and self._prefetcher.take(node):
+            return node.state is DataNodeState.MEMORY
+        else:
+            return node.try_load()
+
     def _load_nodes(self, nodes):
         """Ensure that the given nodes are in MEMORY state.
 
@@ -209,24 +359,23 @@ class ComplexAlgorithm(IEvaluationAlgorithm):
             if node.state is DataNodeState.MEMORY:
                 continue
             elif node.state is DataNodeState.DISK:
-                node.load()
+                if self._prefetcher is None \
+                        or not self._prefetcher.take(node):
+                    node.load()
                 if self._too_much_allocated():
                     self._save_memory(nodes_to_keep=nodes)
             else:
                 raise ValueError(f'The node {node} must be either in MEMORY '
                                  f'or DISK state.')
-        # So the `_save_memory` method knows about them
-        self._swap_order.extendleft(nodes)
+        # So the eviction policy knows about them
+        self._eviction_policy.record_use(nodes)
 
     def _save_memory(self, *, nodes_to_keep=()):
         """Move some nodes from MEMORY state to DISK state.
 
-        The order of nodes to swap is given by the `_get_swap_order` method.
+        The order of nodes to swap is given by the eviction policy.
         The method guarantees preserving the state of nodes from the given list.
 
-        The method removes the nodes from the `_previous_order`, so they are
-        not included next time (unless they get there by an other way).
-
         Parameters
         ----------
         nodes_to_keep
@@ -244,10 +393,13 @@ class ComplexAlgorithm(IEvaluationAlgorithm):
 
         logger.debug('Saving memory.')
 
-        self._update_swap_order()
+        if self._prefetcher is not None:
+            self._prefetcher.discard()
+        self._record_processing()
+        memory_nodes = list(self._evaluation_state.memory_nodes)
         total_used_memory_estimate = sum(node.data_size
-                                         for node in self._swap_order)
-        base_estimate = self._evaluation_state.used_virtual_memory \
+                                         for node in memory_nodes)
+        base_estimate = self._memory_accountant.used_memory \
             - total_used_memory_estimate
 
         # If we cannot comply to the given memory limit, as even the 'base'
@@ -263,50 +415,39 @@ class ComplexAlgorithm(IEvaluationAlgorithm):
             # Do memory saving
             memory_to_store = int(total_used_memory_estimate
                                   * self._proportion_to_store)
-            self._do_save_memory(memory_to_store, nodes_to_keep=nodes_to_keep)
+            candidates = [node for node in memory_nodes
+                          if node not in nodes_to_keep]
+            self._do_save_memory(memory_to_store, candidates)
+            self._memory_accountant.update()
 
-    def _do_save_memory(self, memory_to_store, *, nodes_to_keep=()):
+    def _do_save_memory(self, memory_to_store, candidates):
         """Save at least the given amount of memory by swapping nodes to disk.
 
-        The method guarantees that the given nodes `nodes_to_keep` stay in
-        their respective state. Their size is too big, the method cannot save
-        the requested amount of memory.
-
-        The method assumes that the swap order is already updated.
+        The candidates are stored in the order given by the eviction policy.
+        If their size is too small, the method cannot save the requested
+        amount of memory.
 
         Parameters
         ----------
         memory_to_store
             The amount of memory to store.
-        nodes_to_keep
-            The nodes, whose state will be preserved, including the case when
-            they are in the MEMORY state.
+        candidates
+            The nodes in MEMORY state which may be stored.
 
         Warnings
         --------
         ResourceWarning
-            If the method cannot store the given amount of memory while
-            keeping the `nodes_to_keep` in their state.
+            If the method cannot store the given amount of memory by storing
+            the candidates.
         """
 
-        candidate_for_store_idx = 0
+        eviction_order = self._eviction_policy.get_eviction_order(candidates)
         current_saved_amount = 0  # Sum of sizes of swapped nodes
-        # While some more memory needs to be saved
-        # and there are still nodes available to swap
-        while current_saved_amount < memory_to_store \
-                and len(self._swap_order) > candidate_for_store_idx:
-            node_to_store = self._swap_order[candidate_for_store_idx]
-            if node_to_store not in nodes_to_keep:
-                # IDEA: if too slow, improve deletion (now it's quadratic)
-                #  first find all the nodes to store, then remove then at once
-                #  that is a linear solution
-                # Store the node
-                del self._swap_order[candidate_for_store_idx]
-                node_to_store.store()
-                current_saved_amount += node_to_store.data_size
-            else:
-                # The `node_to_store` must not be stored; thus, moving on
-                candidate_for_store_idx += 1
+        for node_to_store in eviction_order:
+            if current_saved_amount >= memory_to_store:
+                break
+            node_to_store.store()
+            current_saved_amount += node_to_store.data_size
 
         # If we are not able store the given amount of memory
         if current_saved_amount < memory_to_store:
@@ -315,78 +456,24 @@ class ComplexAlgorithm(IEvaluationAlgorithm):
                 f'{current_saved_amount} instead {memory_to_store}.'
             )
 
-    def _update_swap_order(self):
-        """Update order in which the nodes should be swapped.
-
-        The order is based on the previous order which is updated with
-        processing state of the current node. That is, by fields `_visited`
-        and `_necessary`. More info on that is in the code.
+    def _record_processing(self):
+        """Inform the eviction policy about the processing state of the DFS.
 
-        The order has some nice properties, such as the parents of the last
-        visited node are last, i.e. they should be swapped last.
+        That is, about the fields `_visited` and `_necessary`.
         """
 
-        # For keeping the invariant that nodes in the order are in MEMORY
-        # It does no harm to not include the node in DISK state to the order
-        # In case they data are needed (and they are transferred to MEMORY),
-        # they will be added to the order, with the appropriate importance
-        # given by their position in `_visited` and `_necessary`
-        visited_in_memory = [node for node in self._visited
-                             if node.state is DataNodeState.MEMORY]
-        necessary_in_memory = [node for node in self._necessary
-                               if node.state is DataNodeState.MEMORY]
-
-        # It is chance that the first visited nodes are roots of the graph
-        # Hence, it is a big chance of their re-use
-        # Thus, they go last
-        self._swap_order.extend(reversed(visited_in_memory))
-        # We definitely do not swap the necessary nodes
-        # The last in necessary are the first which will be used in _process
-        # method
-        # Thus, they go last
-        self._swap_order.extend(necessary_in_memory)
-        # Keep only the last occurrences
-        # The further the element occurs, the more important the node's data are
-        new_order = collections.deque(
-            self._leave_only_last_occurrence(self._swap_order)
-        )
-        self._swap_order = new_order
-
-    @staticmethod
-    def _leave_only_last_occurrence(order: Sequence[DataNode]) \
-            -> Iterator[DataNode]:
-        """Leave only the last occurrence of each element.
-
-        Parameters
-        ----------
-        order
-            Sequence of nodes, possibly with repeated occurrences of some
-            of them.
+        self._eviction_policy.record_processing(self._visited, self._necessary)
 
-        Returns
-        -------
-            Iterator of the nodes with a single occurrence of each. Only the
-            last occurrences are preserved.
-        """
-
-        # IDEA: If it is too slow, get better algorithm
-        # Reverse back, so we have the proper order
-        filtered_order = reversed(
-            # Preserve first occurrence in reversed deque
-            # (i.e. last in the original)
-            dict.fromkeys(
-                reversed(order)
-            )
-        )
-        return filtered_order
+    def _get_free_memory(self):
+        """Return the memory which may be allocated below the memory limit."""
+        return self._memory_limit - self._memory_accountant.used_memory
 
     def _too_much_allocated(self):
-        """True, if the consumed virtual memory exceeds the memory limit."""
+        """True, if the accounted memory exceeds the memory limit."""
         if self._memory_limit == math.inf:
             return False
         else:
-            return self._evaluation_state.used_virtual_memory \
-                   > self._memory_limit
+            return self._memory_accountant.used_memory > self._memory_limit
 
     def _get_algorithm_result(self):
         """Return the expected result of EvaluationAlgorithm's evaluate method.
@@ -398,6 +485,7 @@ class ComplexAlgorithm(IEvaluationAlgorithm):
         """
 
         self._load_nodes(self._evaluation_state.results)
-        result = {node.activation: node.get_data()
+        # The evaluation is over, so the data are handed over without copy
+        result = {node.activation: node.get_data(copy=False)
                   for node in self._evaluation_state.results}
         return result
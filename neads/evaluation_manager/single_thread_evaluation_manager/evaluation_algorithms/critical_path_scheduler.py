@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Container, Iterable, Optional
+
+from neads.evaluation_manager.single_thread_evaluation_manager.data_node \
+    import DataNodeState
+
+if TYPE_CHECKING:
+    from neads.evaluation_manager.single_thread_evaluation_manager.data_node \
+        import DataNode
+
+
+def _unit_cost(node: DataNode) -> float:
+    """Estimate cost of evaluation of each node to 1."""
+    return 1.
+
+
+class CriticalPathScheduler:
+    """Rank nodes by the length of the remaining critical path.
+
+    The scheduler works with the subgraph of unprocessed nodes (i.e. the
+    nodes which are neither in MEMORY nor DISK state) which are necessary
+    for getting data of the given target nodes (usually the significant
+    nodes of an EvaluationAlgorithm). Each unprocessed node has an estimated
+    cost of its evaluation.
+
+    Two lengths are computed for each node of the subgraph. The path to the
+    node is the cost of the most expensive chain of unprocessed ancestors of
+    the node (including the node). It is the least time needed to get the
+    data of the node, no matter how many workers are available. The path from
+    the node is the cost of the most expensive chain of unprocessed
+    descendants leading from the node to a target node (again including the
+    node). Thus, the nodes with the longest path from them lie on the
+    critical path and should be evaluated first.
+
+    Note that the scheduler cannot know how large the subgraph created by a
+    trigger will be, before the trigger is invoked. Thus, the targets are
+    ranked by the path to them, i.e. the targets whose triggers take longest
+    to become invocable are started first. Ties are resolved by the
+    estimated cost of the node (the more expensive, the sooner).
+
+    The caller is supposed to call `update` after a change of the graph
+    (i.e. after invocation of a trigger, see EvaluationState's
+    `graph_version`), which ranks only the new nodes of the subgraph. When a
+    node of the analyzed subgraph gets processed, the caller informs the
+    scheduler by `mark_processed`. Both methods update only the ranks
+    affected by the change.
+    """
+
+    def __init__(self, cost_estimator: Optional[Callable[[DataNode], float]]
+                 = None):
+        """Initialize the CriticalPathScheduler.
+
+        Parameters
+        ----------
+        cost_estimator
+            Function which estimates the cost of evaluation of the given
+            node (e.g. its expected run time). By default, the cost of each
+            node is 1, i.e. the lengths of paths are the numbers of nodes.
+        """
+
+        self._cost_estimator = cost_estimator \
+            if cost_estimator is not None \
+            else _unit_cost
+
+        self._targets: set[DataNode] = set()
+        self._costs: dict[DataNode, float] = {}
+        self._path_to: dict[DataNode, float] = {}
+        self._path_from: dict[DataNode, float] = {}
+
+    def analyze(self, targets: Iterable[DataNode]):
+        """Compute the ranks of the unprocessed ancestors of the targets.
+
+        The ranks computed before are thrown away.
+
+        Parameters
+        ----------
+        targets
+            The nodes whose data are requested.
+        """
+
+        self._targets = set()
+        self._costs = {}
+        self._path_to = {}
+        self._path_from = {}
+        self.update(targets)
+
+    def update(self, targets: Iterable[DataNode]):
+        """Update the ranks after a change of the graph or the targets.
+
+        Only the unprocessed ancestors of the targets which are not in the
+        analyzed subgraph yet are ranked. As the graph grows only by
+        descendants of its nodes, the paths to the analyzed nodes stay the
+        same and the paths from them are lengthened, as far as they lead
+        through the new nodes. The former targets which are not needed
+        anymore leave the subgraph, as well as their ancestors which were
+        needed only for them.
+
+        Parameters
+        ----------
+        targets
+            The nodes whose data are requested.
+        """
+
+        targets = list(targets)
+        former_targets = self._targets
+        self._targets = set(targets)
+
+        new_nodes = self._get_unprocessed_ancestors(targets, self._costs)
+        for node in new_nodes:
+            self._costs[node] = self._cost_estimator(node)
+
+        # Parents are before children in `new_nodes`
+        for node in new_nodes:
+            longest_parent_path = max(
+                (self._path_to[parent] for parent in node.parents
+                 if parent in self._path_to),
+                default=0.
+            )
+            self._path_to[node] = self._costs[node] + longest_parent_path
+
+        for node in reversed(new_nodes):
+            longest_child_path = max(
+                (self._path_from[child] for child in node.children
+                 if child in self._path_from),
+                default=0.
+            )
+            self._path_from[node] = self._costs[node] + longest_child_path
+
+        # The analyzed nodes with new children in the subgraph
+        self._update_paths(self._path_from,
+                           (parent for node in new_nodes
+                            for parent in node.parents),
+                           lambda n: n.children, lambda n: n.parents)
+
+        removed = self._remove_unneeded(former_targets - self._targets)
+        # The removed nodes have no children in the subgraph
+        self._update_paths(self._path_from,
+                           (parent for removed_node in removed
+                            for parent in removed_node.parents),
+                           lambda n: n.children, lambda n: n.parents)
+
+    def mark_processed(self, node: DataNode):
+        """Update the ranks after the node got processed.
+
+        The node leaves the analyzed subgraph, as well as its ancestors
+        which were needed only for the node. The paths to its descendants
+        and the paths from its ancestors are shortened, as far as they led
+        through the node. Nothing happens, if the node was not analyzed.
+
+        Parameters
+        ----------
+        node
+            The node which got to MEMORY or DISK state.
+        """
+
+        if node not in self._costs:
+            return
+
+        # Remove the node and the ancestors which are not needed anymore
+        self._remove(node)
+        removed = [node] + self._remove_unneeded(node.parents)
+
+        # The removed ancestors have no children in the subgraph
+        self._update_paths(self._path_to, node.children,
+                           lambda n: n.parents, lambda n: n.children)
+        self._update_paths(self._path_from,
+                           (parent for removed_node in removed
+                            for parent in removed_node.parents),
+                           lambda n: n.children, lambda n: n.parents)
+
+    def _remove_unneeded(self, nodes: Iterable[DataNode]) -> list[DataNode]:
+        """Remove the nodes which are not needed and their ancestors.
+
+        A node is not needed, if it is not a target and none of its children
+        is in the analyzed subgraph. The removal continues to the parents
+        of the removed nodes.
+
+        Parameters
+        ----------
+        nodes
+            The nodes which may not be needed anymore.
+
+        Returns
+        -------
+            The removed nodes.
+        """
+
+        removed = []
+        candidates = list(nodes)
+        for candidate in candidates:
+            if candidate in self._costs \
+                    and candidate not in self._targets \
+                    and not any(child in self._costs
+                                for child in candidate.children):
+                self._remove(candidate)
+                removed.append(candidate)
+                candidates.extend(candidate.parents)
+        return removed
+
+    def _remove(self, node: DataNode):
+        """Remove the node from the analyzed subgraph."""
+
+        del self._costs[node]
+        del self._path_to[node]
+        del self._path_from[node]
+
+    def _update_paths(self, paths: dict[DataNode, float],
+                      nodes: Iterable[DataNode],
+                      get_predecessors: Callable, get_successors: Callable):
+        """Recompute the paths of the nodes and propagate their changes.
+
+        Parameters
+        ----------
+        paths
+            The paths to update, i.e. `_path_to` or `_path_from`.
+        nodes
+            The nodes whose predecessor left or joined the analyzed
+            subgraph.
+        get_predecessors
+            Function which returns the nodes the paths come from (parents
+            for the paths to nodes).
+        get_successors
+            Function which returns the nodes the paths continue to.
+        """
+
+        stack = [node for node in nodes if node in paths]
+        while stack:
+            node = stack.pop()
+            longest_path = max(
+                (paths[predecessor]
+                 for predecessor in get_predecessors(node)
+                 if predecessor in paths),
+                default=0.
+            )
+            new_path = self._costs[node] + longest_path
+            if new_path != paths[node]:
+                paths[node] = new_path
+                stack.extend(successor for successor in get_successors(node)
+                             if successor in paths)
+
+    def get_path_to(self, node: DataNode) -> float:
+        """Return the length of the longest unprocessed path to the node.
+
+        Returns
+        -------
+            The length of the path or 0, if the node was processed (or not
+            analyzed).
+        """
+
+        return self._path_to.get(node, 0.)
+
+    def get_path_from(self, node: DataNode) -> float:
+        """Return the length of the longest path from the node to a target.
+
+        Returns
+        -------
+            The length of the path or 0, if the node was processed (or not
+            analyzed).
+        """
+
+        return self._path_from.get(node, 0.)
+
+    def order_by_path_to(self, nodes: Iterable[DataNode]) -> list[DataNode]:
+        """Return the nodes ordered by the path to them, the longest first.
+
+        The order of the nodes with equal rank is preserved.
+        """
+
+        return sorted(nodes,
+                      key=lambda n: (self.get_path_to(n),
+                                     self._costs.get(n, 0.)),
+                      reverse=True)
+
+    def select_by_path_to(self, nodes: Iterable[DataNode]) \
+            -> Optional[DataNode]:
+        """Return the node with the longest path to it.
+
+        It is the first node of `order_by_path_to`, found without sorting.
+
+        Returns
+        -------
+            The first of the nodes with the highest rank or None, if there
+            are no nodes.
+        """
+
+        return max(nodes,
+                   key=lambda n: (self.get_path_to(n),
+                                  self._costs.get(n, 0.)),
+                   default=None)
+
+    def order_by_path_from(self, nodes: Iterable[DataNode]) \
+            -> list[DataNode]:
+        """Return the nodes ordered by the path from them, the longest first.
+
+        The order of the nodes with equal rank is preserved.
+        """
+
+        return sorted(nodes,
+                      key=lambda n: (self.get_path_from(n),
+                                     self._costs.get(n, 0.)),
+                      reverse=True)
+
+    @staticmethod
+    def _get_unprocessed_ancestors(
+            targets: Iterable[DataNode], analyzed: Container[DataNode] = ()
+    ) -> list[DataNode]:
+        """Return unprocessed targets and ancestors in topological order.
+
+        Only the ancestors reachable via unprocessed nodes which were not
+        analyzed are included.
+
+        Parameters
+        ----------
+        targets
+            The nodes whose unprocessed ancestors are returned.
+        analyzed
+            The nodes which are skipped, as they were analyzed before.
+
+        Returns
+        -------
+            List of the unprocessed ancestors of the targets (including the
+            targets) in which parents are before their children.
+        """
+
+        def is_unprocessed(node):
+            return node.state is not DataNodeState.MEMORY \
+                and node.state is not DataNodeState.DISK \
+                and node not in analyzed
+
+        ordered_nodes = []
+        visited = set()
+        # Iterative post-order DFS, the graphs may be deep
+        for target in targets:
+            if target in visited or not is_unprocessed(target):
+                continue
+            visited.add(target)
+            stack = [(target, iter(target.parents))]
+            while stack:
+                node, parents_iter = stack[-1]
+                for parent in parents_iter:
+                    if parent not in visited and is_unprocessed(parent):
+                        visited.add(parent)
+                        stack.append((parent, iter(parent.parents)))
+                        break
+                else:
+                    stack.pop()
+                    ordered_nodes.append(node)
+
+        return ordered_nodes
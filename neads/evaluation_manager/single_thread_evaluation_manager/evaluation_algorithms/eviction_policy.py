@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Sequence
+import abc
+import collections
+import itertools
+
+from neads.evaluation_manager.single_thread_evaluation_manager.data_node \
+    import DataNodeState
+
+if TYPE_CHECKING:
+    from neads.evaluation_manager.single_thread_evaluation_manager \
+        .evaluation_state import EvaluationState
+    from neads.evaluation_manager.single_thread_evaluation_manager.data_node \
+        import DataNode
+
+
+class IEvictionPolicy(abc.ABC):
+    """General interface for choosing nodes whose data are stored to disk.
+
+    When an EvaluationAlgorithm needs to release memory, it asks the policy
+    for the order in which the candidate nodes (in MEMORY state) should be
+    stored. The nodes are then stored in that order until enough memory is
+    released.
+
+    The algorithm informs the policy about the use of nodes' data and (in
+    case of ComplexAlgorithm) about the state of its DFS, so the policy can
+    rank the nodes.
+    """
+
+    def start(self, evaluation_state: EvaluationState):
+        """Start the policy for the evaluation.
+
+        Parameters
+        ----------
+        evaluation_state
+            The EvaluationState whose evaluation begins.
+        """
+
+        self._evaluation_state = evaluation_state
+
+    def record_use(self, nodes: Iterable[DataNode]):
+        """Record that the data of the nodes were just used or created.
+
+        Parameters
+        ----------
+        nodes
+            The nodes whose data were used.
+        """
+
+        pass
+
+    def record_processing(self, visited: Sequence[DataNode],
+                          necessary: Sequence[DataNode]):
+        """Record the state of processing of ComplexAlgorithm's DFS.
+
+        Parameters
+        ----------
+        visited
+            The nodes visited by the DFS in post-order.
+        necessary
+            The stack of nodes whose data are guaranteed to be used by the
+            DFS, the last is used first.
+        """
+
+        pass
+
+    @abc.abstractmethod
+    def get_eviction_order(self, candidates: Iterable[DataNode]) \
+            -> list[DataNode]:
+        """Return the candidates in the order in which they should be stored.
+
+        Parameters
+        ----------
+        candidates
+            The nodes in MEMORY state which may be stored.
+
+        Returns
+        -------
+            The candidates, the first to store first.
+        """
+
+        raise NotImplementedError()
+
+
+class DFSEvictionPolicy(IEvictionPolicy):
+    """The order derived from the DFS of ComplexAlgorithm.
+
+    The order is based on the previous order which is updated with the
+    processing state of the DFS (i.e. the visited and necessary nodes). It
+    has some nice properties, such as the parents of the last visited node
+    are last, i.e. they are stored last.
+
+    The candidates unknown to the DFS (e.g. when the policy is used by a
+    different algorithm) are stored last, in the given order.
+    """
+
+    def __init__(self):
+        """Initialize the DFSEvictionPolicy."""
+        self._order = collections.deque()
+
+    def start(self, evaluation_state: EvaluationState):
+        super().start(evaluation_state)
+        self._order = collections.deque()
+
+    def record_use(self, nodes: Iterable[DataNode]):
+        """Put the nodes to the front of the order."""
+        self._order.extendleft(nodes)
+
+    def record_processing(self, visited: Sequence[DataNode],
+                          necessary: Sequence[DataNode]):
+        """Update the order with the processing state of the DFS."""
+
+        # For keeping the invariant that nodes in the order are in MEMORY
+        # It does no harm to not include the node in DISK state to the order
+        # In case they data are needed (and they are transferred to MEMORY),
+        # they will be added to the order, with the appropriate importance
+        # given by their position in `visited` and `necessary`
+        visited_in_memory = [node for node in visited
+                             if node.state is DataNodeState.MEMORY]
+        necessary_in_memory = [node for node in necessary
+                               if node.state is DataNodeState.MEMORY]
+
+        # It is chance that the first visited nodes are roots of the graph
+        # Hence, it is a big chance of their re-use
+        # Thus, they go last
+        self._order.extend(reversed(visited_in_memory))
+        # We definitely do not swap the necessary nodes
+        # The last in necessary are the first which will be used in the DFS
+        # Thus, they go last
+        self._order.extend(necessary_in_memory)
+        # Keep only the last occurrences of nodes in MEMORY
+        # The further the element occurs, the more important the node's data
+        # are
+        self._order = collections.deque(
+            node for node in self._leave_only_last_occurrence(self._order)
+            if node.state is DataNodeState.MEMORY
+        )
+
+    def get_eviction_order(self, candidates: Iterable[DataNode]) \
+            -> list[DataNode]:
+        candidates = list(candidates)
+        candidate_set = set(candidates)
+        ordered = [node for node in self._order if node in candidate_set]
+        ordered_set = set(ordered)
+        unknown = [node for node in candidates if node not in ordered_set]
+        return ordered + unknown
+
+    @staticmethod
+    def _leave_only_last_occurrence(order: Sequence[DataNode]) \
+            -> Iterable[DataNode]:
+        """Leave only the last occurrence of each element.
+
+        Parameters
+        ----------
+        order
+            Sequence of nodes, possibly with repeated occurrences of some
+            of them.
+
+        Returns
+        -------
+            Iterator of the nodes with a single occurrence of each. Only the
+            last occurrences are preserved.
+        """
+
+        # Reverse back, so we have the proper order
+        return reversed(
+            # Preserve first occurrence in reversed deque
+            # (i.e. last in the original)
+            dict.fromkeys(
+                reversed(order)
+            )
+        )
+
+
+class LRUEvictionPolicy(IEvictionPolicy):
+    """The least recently used nodes are stored first."""
+
+    def __init__(self):
+        """Initialize the LRUEvictionPolicy."""
+        self._last_use: dict[DataNode, int] = {}
+        self._clock = itertools.count()
+
+    def start(self, evaluation_state: EvaluationState):
+        super().start(evaluation_state)
+        self._last_use = {}
+
+    def record_use(self, nodes: Iterable[DataNode]):
+        for node in nodes:
+            self._last_use[node] = next(self._clock)
+
+    def get_eviction_order(self, candidates: Iterable[DataNode]) \
+            -> list[DataNode]:
+        return sorted(candidates, key=self._get_last_use)
+
+    def _get_last_use(self, node):
+        """Return the time of the last use of the node (-1 if unknown)."""
+        return self._last_use.get(node, -1)
+
+
+class SizeWeightedEvictionPolicy(LRUEvictionPolicy):
+    """The largest data are stored first.
+
+    Storing the largest data releases the requested memory by the least
+    number of stores. The nodes with equal size are ordered by LRU.
+    """
+
+    def get_eviction_order(self, candidates: Iterable[DataNode]) \
+            -> list[DataNode]:
+        return sorted(candidates,
+                      key=lambda n: (-n.data_size, self._get_last_use(n)))
+
+
+class FutureUseEvictionPolicy(IEvictionPolicy):
+    """The nodes whose data are needed latest are stored first.
+
+    The policy approximates Belady's optimal algorithm with use of the
+    graph, as the future uses of the data are the unprocessed children of
+    the node. The nodes are ordered as follows:
+
+    1. Nodes without unprocessed children, whose data are not needed anymore
+       (unless a new child is created by a trigger).
+    2. Result nodes, whose data are needed only at the end of evaluation.
+    3. Nodes with unprocessed children, which are not necessary for the
+       current DFS of ComplexAlgorithm. Those with fewer unprocessed children
+       go first.
+    4. Necessary nodes of the DFS, in the order of the necessary stack
+       (the last is used first, so it is stored last).
+    """
+
+    def __init__(self):
+        """Initialize the FutureUseEvictionPolicy."""
+        self._necessary_position: dict[DataNode, int] = {}
+
+    def start(self, evaluation_state: EvaluationState):
+        super().start(evaluation_state)
+        self._necessary_position = {}
+
+    def record_processing(self, visited: Sequence[DataNode],
+                          necessary: Sequence[DataNode]):
+        self._necessary_position = {node: position
+                                    for position, node in enumerate(necessary)}
+
+    def get_eviction_order(self, candidates: Iterable[DataNode]) \
+            -> list[DataNode]:
+        return sorted(candidates, key=self._get_rank)
+
+    def _get_rank(self, node):
+        """Return the sort key of the node, see the class docstring."""
+
+        if (position := self._necessary_position.get(node)) is not None:
+            return 3, position
+        unprocessed_children_count = sum(
+            1 for child in node.children
+            if child.state is not DataNodeState.MEMORY
+            and child.state is not DataNodeState.DISK
+        )
+        if unprocessed_children_count:
+            return 2, unprocessed_children_count
+        elif not node.children:
+            return 1, 0
+        else:
+            return 0, 0
+
+
+class RecomputeCostEvictionPolicy(IEvictionPolicy):
+    """The data which are cheapest to recompute per byte are stored first.
+
+    The cost of the node is the estimated run time of its plugin by the
+    CostModel of the EvaluationState (or 1 for each node, if there is no
+    CostModel). The nodes with the least cost per byte of their data go
+    first, so the released memory is the cheapest to get back.
+    """
+
+    def __init__(self):
+        """Initialize the RecomputeCostEvictionPolicy."""
+        self._cost_cache: dict[DataNode, float] = {}
+
+    def start(self, evaluation_state: EvaluationState):
+        super().start(evaluation_state)
+        self._cost_cache = {}
+
+    def get_eviction_order(self, candidates: Iterable[DataNode]) \
+            -> list[DataNode]:
+        return sorted(candidates,
+                      key=lambda n: self._get_cost(n) / max(n.data_size, 1))
+
+    def _get_cost(self, node) -> float:
+        """Return the estimated cost of the node's evaluation."""
+
+        if (cost := self._cost_cache.get(node)) is None:
+            cost_model = self._evaluation_state.cost_model
+            cost = cost_model.estimate_node_cost(node) \
+                if cost_model is not None \
+                else 1.
+            self._cost_cache[node] = cost
+        return cost
+
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+import abc
+import threading
+
+import neads._internal_utils.memory_info as memory_info
+
+if TYPE_CHECKING:
+    from neads.evaluation_manager.single_thread_evaluation_manager \
+        .evaluation_state import EvaluationState
+
+
+class IMemoryAccountant(abc.ABC):
+    """General interface for measuring memory for the memory limit.
+
+    The EvaluationAlgorithms with memory limit compare the used memory
+    reported by the accountant with the limit after each change of the
+    evaluation which may allocate memory. Thus, the `used_memory` property is
+    supposed to be cheap.
+
+    The accountant is started at the beginning of the evaluation and stopped
+    at its end.
+    """
+
+    def start(self, evaluation_state: EvaluationState):
+        """Start the accounting for the evaluation.
+
+        Parameters
+        ----------
+        evaluation_state
+            The EvaluationState whose evaluation begins.
+        """
+
+        self._evaluation_state = evaluation_state
+
+    def stop(self):
+        """Stop the accounting, the evaluation has ended."""
+        self._evaluation_state = None
+
+    def update(self):
+        """Update the used memory after a deliberate release of memory.
+
+        The accountants whose `used_memory` may be out of date are supposed
+        to refresh the value.
+        """
+
+        pass
+
+    def get_memory_limit(self, requested_limit: float) -> float:
+        """Return the memory limit which the algorithm should comply to.
+
+        Parameters
+        ----------
+        requested_limit
+            The limit given to the algorithm.
+
+        Returns
+        -------
+            The limit given to the algorithm, possibly lowered with respect
+            to the accounted memory (e.g. to the limit of a container).
+        """
+
+        return requested_limit
+
+    def add_held_memory(self, size: int):
+        """Account the memory held by the algorithm besides the nodes' data.
+
+        For example, the data read in advance by a Prefetcher. The
+        accountants which measure the memory of the process see such memory
+        anyway, so they ignore the call.
+
+        Parameters
+        ----------
+        size
+            The size in bytes of the newly held memory, negative if the
+            memory is released.
+        """
+
+        pass
+
+    @property
+    @abc.abstractmethod
+    def used_memory(self) -> int:
+        """The amount of used memory in bytes, which is subject to the limit."""
+        raise NotImplementedError()
+
+
+class VirtualMemoryAccountant(IMemoryAccountant):
+    """Account the virtual memory (VMS) of the process.
+
+    The virtual memory is polled from the system on each query. It counts
+    also the reserved address space, so it tends to overestimate the memory
+    actually used.
+    """
+
+    @property
+    def used_memory(self) -> int:
+        """The amount of virtual memory used by the process."""
+        return self._evaluation_state.used_virtual_memory
+
+
+class DataSizeAccountant(IMemoryAccountant):
+    """Account the size of data in memory plus a baseline.
+
+    The used memory is the sum of `data_size` of nodes in MEMORY state, the
+    size of data held until their background write is done, the memory held
+    by the algorithm otherwise (e.g. prefetched data) and a baseline
+    memory, which stands for the rest of the process (the interpreter,
+    imported modules, etc.). No system call is involved in the query.
+    """
+
+    def __init__(self, baseline: Optional[int] = None):
+        """Initialize the DataSizeAccountant.
+
+        Parameters
+        ----------
+        baseline
+            The baseline memory in bytes. By default, it is calibrated at
+            the start of the evaluation as the resident memory (RSS) of the
+            process without the data of the nodes in memory.
+        """
+
+        self._given_baseline = baseline
+        self._baseline = baseline
+        self._held_memory = 0
+
+    def start(self, evaluation_state: EvaluationState):
+        super().start(evaluation_state)
+        self._held_memory = 0
+        if self._given_baseline is not None:
+            self._baseline = self._given_baseline
+        else:
+            self._baseline = evaluation_state.used_physical_memory \
+                - self._get_data_size()
+
+    @property
+    def baseline(self) -> Optional[int]:
+        """The baseline memory in bytes (None before the calibration)."""
+        return self._baseline
+
+    def add_held_memory(self, size: int):
+        """Add the memory held by the algorithm to the used memory."""
+        self._held_memory += size
+
+    @property
+    def used_memory(self) -> int:
+        """The baseline plus the size of the data in memory."""
+        return self._baseline + self._get_data_size() + self._held_memory
+
+    def _get_data_size(self):
+        """Return the total size of the data in memory.
+
+        That is, the data of nodes in MEMORY state and the data whose
+        background write is not done yet.
+        """
+
+        # The running total of the ES, so the query does not visit the nodes
+        return self._evaluation_state.memory_data_size \
+            + self._evaluation_state.pending_write_size
+
+
+class ResidentMemoryAccountant(IMemoryAccountant):
+    """Account the resident memory, sampled on a background thread.
+
+    If the process runs in a cgroup with a memory limit (e.g. in a
+    container), the memory used by the whole cgroup is accounted and the
+    memory limit of the algorithm is lowered to the cgroup's limit, if it is
+    smaller. Otherwise, the resident memory (RSS) of the process is
+    accounted.
+
+    The memory is sampled periodically by a daemon thread, so the query
+    returns the latest sample without a system call. After the algorithm
+    releases memory, the sample is refreshed right away (see `update`).
+    """
+
+    def __init__(self, interval: float = 0.05,
+                 limit_proportion: float = 0.9):
+        """Initialize the ResidentMemoryAccountant.
+
+        Parameters
+        ----------
+        interval
+            The period of sampling in seconds.
+        limit_proportion
+            Which proportion of the cgroup's memory limit may be used,
+            so there is a reserve before the cgroup runs out of memory.
+        """
+
+        self._interval = interval
+        self._limit_proportion = limit_proportion
+
+        self._cgroup_limit: Optional[int] = None
+        self._sample = 0
+        self._stop_event = threading.Event()
+        self._sampling_thread: Optional[threading.Thread] = None
+
+    def start(self, evaluation_state: EvaluationState):
+        super().start(evaluation_state)
+        self._cgroup_limit = memory_info.get_cgroup_memory_limit()
+        self.update()
+        self._stop_event.clear()
+        self._sampling_thread = threading.Thread(
+            target=self._sample_periodically,
+            name='neads_memory_sampler',
+            daemon=True
+        )
+        self._sampling_thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._sampling_thread is not None:
+            self._sampling_thread.join()
+            self._sampling_thread = None
+        super().stop()
+
+    def update(self):
+        """Take a new sample of the used memory right away."""
+
+        usage = memory_info.get_cgroup_memory_usage() \
+            if self._cgroup_limit is not None \
+            else None
+        # Assignment of int is atomic, no lock is necessary
+        self._sample = usage \
+            if usage is not None \
+            else memory_info.get_process_ram_memory()
+
+    def get_memory_limit(self, requested_limit: float) -> float:
+        """Return the requested limit, lowered to the cgroup's limit."""
+
+        if self._cgroup_limit is not None:
+            cgroup_limit = self._cgroup_limit * self._limit_proportion
+            return min(requested_limit, cgroup_limit)
+        else:
+            return requested_limit
+
+    @property
+    def used_memory(self) -> int:
+        """The latest sample of the used memory."""
+        return self._sample
+
+    def _sample_periodically(self):
+        """Take samples until the accountant is stopped."""
+        while not self._stop_event.wait(self._interval):
+            self.update()
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
+import concurrent.futures
+import math
+
+from neads.database import DataNotFound
+from neads.evaluation_manager.single_thread_evaluation_manager.data_node \
+    import DataNodeState
+
+if TYPE_CHECKING:
+    from neads.evaluation_manager.single_thread_evaluation_manager \
+        .evaluation_state import EvaluationState
+    from neads.evaluation_manager.single_thread_evaluation_manager \
+        .evaluation_algorithms.memory_accountant import IMemoryAccountant
+    from neads.evaluation_manager.single_thread_evaluation_manager.data_node \
+        import DataNode
+
+import logging
+logger = logging.getLogger('neads.prefetcher')
+
+
+class _Prefetch:
+    """Data of a node being read in the background."""
+
+    def __init__(self, future: concurrent.futures.Future,
+                 state: DataNodeState, size: int):
+        self.future = future
+        self.state = state  # State of the node at the time of prefetch
+        self.size = size
+
+
+class Prefetcher:
+    """Read stored data of nodes in advance on a background thread.
+
+    The algorithm announces the nodes whose data it will need soon (e.g. the
+    parents of the node which is about to be evaluated). The data of those
+    in DISK state (from tmp file or database) and in UNKNOWN state (from
+    database) are read in the background, while the algorithm evaluates
+    other nodes. When the algorithm needs the data, it takes them from the
+    prefetcher, which changes the node's state on the calling thread.
+
+    The prefetched data are held by the prefetcher, so the prefetching is
+    limited by the free memory reported by the algorithm. Their estimated
+    size is added to the algorithm's memory accountant, until the data are
+    taken or dropped. The data of UNKNOWN nodes are prefetched under a
+    finite memory limit only if their size can be estimated by the
+    CostModel.
+
+    The prefetched data which are not needed anymore are dropped. If their
+    read is already running, the prefetcher waits for it, so the read does
+    not overlap with a later write of the node's tmp file.
+
+    Note that the database is read from the background thread, so it must
+    tolerate reads concurrent with the evaluation (FileDatabase does).
+    """
+
+    def __init__(self, max_prefetched: int = 4):
+        """Initialize the Prefetcher.
+
+        Parameters
+        ----------
+        max_prefetched
+            The maximal number of nodes whose data are held by the
+            prefetcher at once.
+        """
+
+        self._max_prefetched = max_prefetched
+        self._evaluation_state: Optional[EvaluationState] = None
+        self._get_free_memory: Callable[[], float] = lambda: math.inf
+        self._memory_accountant: Optional[IMemoryAccountant] = None
+        self._executor: Optional[concurrent.futures.Executor] = None
+        self._prefetches: dict[DataNode, _Prefetch] = {}
+
+    def start(self, evaluation_state: EvaluationState,
+              get_free_memory: Callable[[], float] = lambda: math.inf,
+              memory_accountant: Optional[IMemoryAccountant] = None):
+        """Start the prefetcher for the evaluation.
+
+        Parameters
+        ----------
+        evaluation_state
+            The EvaluationState whose evaluation begins.
+        get_free_memory
+            Function which returns the memory in bytes which may be
+            allocated before reaching the algorithm's memory limit.
+        memory_accountant
+            The accountant of the algorithm's memory, which is informed about
+            the prefetched data. Then, the free memory is supposed to
+            reflect the prefetched data already. Otherwise, their size is
+            subtracted from the free memory by the prefetcher.
+        """
+
+        self._evaluation_state = evaluation_state
+        self._get_free_memory = get_free_memory
+        self._memory_accountant = memory_accountant
+        self._prefetches = {}
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix='neads_prefetcher'
+        )
+
+    def stop(self):
+        """Stop the prefetcher and drop the prefetched data."""
+
+        self.discard()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._evaluation_state = None
+        self._memory_accountant = None
+
+    @property
+    def prefetched_size(self) -> int:
+        """The estimated size of the data held by the prefetcher."""
+        return sum(prefetch.size for prefetch in self._prefetches.values())
+
+    def prefetch(self, nodes: Iterable[DataNode]):
+        """Start reading the data of the nodes in the background.
+
+        Only the nodes in DISK or UNKNOWN state are prefetched, as long as
+        their data fit to the free memory.
+
+        Parameters
+        ----------
+        nodes
+            The nodes whose data will be needed soon, the most urgent first.
+        """
+
+        for node in nodes:
+            if len(self._prefetches) >= self._max_prefetched:
+                break
+            if node in self._prefetches \
+                    or (node.state is not DataNodeState.DISK
+                        and node.state is not DataNodeState.UNKNOWN):
+                continue
+            size = self._estimate_size(node)
+            free_memory = self._get_free_memory()
+            if self._memory_accountant is None:
+                free_memory -= self.prefetched_size
+            if size is None and free_memory != math.inf \
+                    or size is not None and size > free_memory:
+                continue
+            logger.debug(f'Prefetching: {node}.')
+            future = self._executor.submit(node.read_stored_data)
+            self._prefetches[node] = _Prefetch(future, node.state, size or 0)
+            if self._memory_accountant is not None:
+                self._memory_accountant.add_held_memory(size or 0)
+
+    def take(self, node: DataNode) -> bool:
+        """Pass the prefetched data to the node, if there are any.
+
+        The call waits until the read of the data is done. A node in DISK
+        state gets to MEMORY state. A node in UNKNOWN state gets to MEMORY
+        state or to NO_DATA state, if its data are not in the database.
+
+        Parameters
+        ----------
+        node
+            The node whose data are needed.
+
+        Returns
+        -------
+            True, if the node's state was changed by the prefetched data.
+            False, if there were no prefetched data for the node in its
+            current state (and the node was not changed).
+
+        Raises
+        ------
+        Exception
+            The exception raised by the read of the data, except for
+            DataNotFound.
+        """
+
+        prefetch = self._prefetches.pop(node, None)
+        if prefetch is None:
+            return False
+        elif prefetch.state is not node.state:
+            # The node changed its state meanwhile, the data are not needed
+            self._drop(prefetch)
+            return False
+
+        try:
+            data = prefetch.future.result()
+        except DataNotFound:
+            node.set_not_found()
+        else:
+            if node.state is DataNodeState.DISK:
+                node.set_reloaded_data(data)
+            else:
+                node.set_loaded_data(data)
+        finally:
+            # The data are accounted as the node's data from now on
+            self._release_held_memory(prefetch)
+        return True
+
+    def discard(self):
+        """Drop all the prefetched data, e.g. to release memory.
+
+        The call waits for the read which is already running.
+        """
+
+        for prefetch in self._prefetches.values():
+            self._drop(prefetch)
+        self._prefetches = {}
+
+    def _drop(self, prefetch: _Prefetch):
+        """Cancel the read of the data or wait for it, if it is running.
+
+        The result of the read is ignored, including its exception.
+        """
+
+        if not prefetch.future.cancel():
+            # The running read may not overlap with a store of the node
+            concurrent.futures.wait([prefetch.future])
+        self._release_held_memory(prefetch)
+
+    def _release_held_memory(self, prefetch: _Prefetch):
+        """Inform the memory accountant that the data are not held anymore."""
+
+        if self._memory_accountant is not None:
+            self._memory_accountant.add_held_memory(-prefetch.size)
+
+    def _estimate_size(self, node) -> Optional[int]:
+        """Return the estimated size of the node's data, or None if unknown."""
+
+        if node.data_size is not None:
+            return node.data_size
+        cost_model = self._evaluation_state.cost_model
+        if cost_model is not None \
+                and (costs := cost_model.get_costs(node.activation.plugin.id)):
+            return int(costs.mean_result_size)
+        return None
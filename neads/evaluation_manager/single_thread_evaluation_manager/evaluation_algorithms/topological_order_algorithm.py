@@ -4,9 +4,6 @@ from typing import TYPE_CHECKING, Any
 
 from neads.evaluation_manager.single_thread_evaluation_manager\
     .evaluation_algorithms.i_evaluation_algorithm import IEvaluationAlgorithm
-from neads.evaluation_manager.single_thread_evaluation_manager.data_node \
-    import DataNodeState
-
 
 if TYPE_CHECKING:
     from neads.activation_model import SealedActivation
@@ -50,8 +47,9 @@ class TopologicalOrderAlgorithm(IEvaluationAlgorithm):
         while node := self._get_next_node_to_process(evaluation_state):
             self._process(node)
 
+        # The evaluation is over, so the data are handed over without copy
         results = {
-            node.activation: node.get_data()
+            node.activation: node.get_data(copy=False)
             for node in evaluation_state.results
         }
 
@@ -66,18 +64,8 @@ class TopologicalOrderAlgorithm(IEvaluationAlgorithm):
             if all nodes were processed.
         """
 
-        unprocessed_nodes = [node for node in evaluation_state
-                             if self._is_unprocessed(node)]
-        if unprocessed_nodes:
-            sorted_unprocessed_nodes = sorted(unprocessed_nodes,
-                                              key=lambda dn: dn.level)
-            return sorted_unprocessed_nodes[0]
-        else:
-            return None
-
-    @staticmethod
-    def _is_unprocessed(data_node: DataNode):
-        return data_node.state is DataNodeState.UNKNOWN
+        # The unprocessed nodes are exactly the UNKNOWN nodes
+        return evaluation_state.get_top_unknown_node()
 
     @staticmethod
     def _process(node: DataNode):
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import heapq
 import itertools
-from typing import TYPE_CHECKING, Iterator, Iterable
+from typing import TYPE_CHECKING, Iterator, Iterable, Optional
 import collections.abc
 
 import neads._internal_utils.memory_info as memory_info
@@ -13,6 +14,10 @@ from neads.evaluation_manager.single_thread_evaluation_manager \
 if TYPE_CHECKING:
     from neads.activation_model import SealedActivationGraph, SealedActivation
     from neads.database import IDatabase
+    from neads.evaluation_manager.cost_model import CostModel
+    from neads._internal_utils.background_writer import BackgroundWriter
+    from neads._internal_utils.serializers import ISerializer
+    from neads._internal_utils.spill_arena import SpillArena
 
 
 class EvaluationState(collections.abc.Iterable):
@@ -40,11 +45,24 @@ class EvaluationState(collections.abc.Iterable):
     for invocation, one of them is chosen first and its invocation (which
     creates new Activations) may block invocation of the other triggers for
     the moment. Similarly with the graph's trigger.
+
+    In the batched mode, all eligible trigger-on-descendants methods are
+    invoked one after another (skipping those which got blocked by the
+    Activations created in the meantime) and their new Activations are
+    incorporated at once. The triggers are invoked in the same order as in
+    the default mode.
     """
 
     def __init__(self,
                  activation_graph: SealedActivationGraph,
-                 database: IDatabase):
+                 database: IDatabase,
+                 cost_model: Optional[CostModel] = None,
+                 *,
+                 spill_to_database: bool = False,
+                 writer: Optional[BackgroundWriter] = None,
+                 spill_serializer: Optional[ISerializer] = None,
+                 spill_arena: Optional[SpillArena] = None,
+                 batch_triggers: bool = False):
         """Initialize an EvaluationState instance.
 
         Parameters
@@ -57,22 +75,67 @@ class EvaluationState(collections.abc.Iterable):
             data from there and save the data there after evaluation (unless
             the data were found right away). The database is supposed to be
             open.
+        cost_model
+            CostModel where DataNodes record costs of their evaluation. If
+            None, the costs are not recorded.
+        spill_to_database
+            Whether DataNodes store their data by releasing them and loading
+            them from the database again, instead of writing them to a tmp
+            file (see DataNode).
+        writer
+            BackgroundWriter which writes DataNodes' tmp files. If None,
+            the tmp files are written synchronously.
+        spill_serializer
+            Serializer of DataNodes' tmp files. If None, pickle is used.
+        spill_arena
+            SpillArena where DataNodes store their data instead of tmp
+            files of their own.
+        batch_triggers
+            Whether the eligible trigger-on-descendants methods are invoked
+            in batches, whose new Activations are incorporated at once. It
+            saves the bookkeeping, when many triggers get eligible together.
         """
 
         self._activation_graph = activation_graph
         self._database = database
+        self._cost_model = cost_model
+        self._spill_to_database = spill_to_database
+        self._writer = writer
+        self._spill_serializer = spill_serializer
+        self._spill_arena = spill_arena
+        self._batch_triggers = batch_triggers
 
         # If the ES is in complete state, i.e. the graph contains some triggers
         self._is_complete = False
+        # The number of invoked triggers
+        self._graph_version = 0
 
         # Some fields
         self._top_level = []
-        self._objectives = []
+        # Ordered set (i.e. dict with None values), so the removal is O(1)
+        self._objectives: dict[DataNode, None] = {}
         self._results = []
 
         # Nodes by state
-        self._nodes_by_state: dict[DataNodeState, set[DataNode]] = \
-            collections.defaultdict(set)
+        # The nodes are held in ordered sets, so they are iterated in the
+        # order of their arrival to the state
+        self._nodes_by_state: dict[DataNodeState, dict[DataNode, None]] = {
+            state: {} for state in DataNodeState
+        }
+
+        # Total size of data of the nodes in MEMORY state
+        self._memory_data_size = 0
+
+        # UNKNOWN nodes by their levels (ordered sets) and a heap of the
+        # levels, which may contain levels without UNKNOWN nodes
+        self._unknown_nodes_by_level: dict[int, dict[DataNode, None]] = {}
+        self._unknown_levels: list[int] = []
+
+        # UNKNOWN nodes whose presence of data was not checked yet
+        self._unchecked_nodes: list[DataNode] = []
+        # UNKNOWN nodes whose data are known to be present in the database
+        # Ordered set, so the nodes leaving UNKNOWN state are removed in O(1)
+        self._present_nodes: dict[DataNode, None] = {}
 
         # Cache for callbacks (so they need not to be created repeatedly)
         self._callback_cache = {}
@@ -103,11 +166,20 @@ class EvaluationState(collections.abc.Iterable):
 
         # Extending some fields
         self._top_level.extend(node for node in nodes if node.level == 0)
-        self._objectives.extend(node for node in nodes
+        self._objectives.update((node, None) for node in nodes
                                 if node.has_trigger_on_result)
 
         # All new nodes are UNKNOWN
-        self._nodes_by_state[DataNodeState.UNKNOWN].update(nodes)
+        self._nodes_by_state[DataNodeState.UNKNOWN].update(
+            dict.fromkeys(nodes)
+        )
+        self._unchecked_nodes.extend(nodes)
+        for node in nodes:
+            if (level_nodes := self._unknown_nodes_by_level.get(node.level)) \
+                    is None:
+                level_nodes = self._unknown_nodes_by_level[node.level] = {}
+                heapq.heappush(self._unknown_levels, node.level)
+            level_nodes[node] = None
 
     def _get_new_data_nodes(self, activations) -> list[DataNode]:
         """Create DataNodes for the given activations with assigned callbacks.
@@ -141,7 +213,12 @@ class EvaluationState(collections.abc.Iterable):
         for activation in ordered_activations:
             parent_nodes = [self._act_to_node[act]
                             for act in activation.parents]
-            created_node = DataNode(activation, parent_nodes, self._database)
+            created_node = DataNode(activation, parent_nodes, self._database,
+                                    self._cost_model,
+                                    spill_to_database=self._spill_to_database,
+                                    writer=self._writer,
+                                    spill_serializer=self._spill_serializer,
+                                    spill_arena=self._spill_arena)
             self._act_to_node[activation] = created_node
             self._node_to_act[created_node] = activation
             created_nodes.append(created_node)
@@ -236,10 +313,23 @@ class EvaluationState(collections.abc.Iterable):
             pass
         else:
             # New callback is created
+            # The sign of the node's data size in the size of data in memory
+            size_sign = (state_to is DataNodeState.MEMORY) \
+                - (state_from is DataNodeState.MEMORY)
+
             def callback(data_node: DataNode):
                 # Move node inside the ES's data structures
-                self._nodes_by_state[state_from].remove(data_node)
-                self._nodes_by_state[state_to].add(data_node)
+                del self._nodes_by_state[state_from][data_node]
+                self._nodes_by_state[state_to][data_node] = None
+                if size_sign:
+                    self._memory_data_size += \
+                        size_sign * (data_node.data_size or 0)
+                if state_from is DataNodeState.UNKNOWN:
+                    self._present_nodes.pop(data_node, None)
+                    level_nodes = self._unknown_nodes_by_level[data_node.level]
+                    del level_nodes[data_node]
+                    if not level_nodes:
+                        del self._unknown_nodes_by_level[data_node.level]
 
                 if not self._is_complete:
                     # If requested, set off the trigger invocation
@@ -265,8 +355,8 @@ class EvaluationState(collections.abc.Iterable):
         processed_activation = self._node_to_act[data_node]
         self._process_general_trigger(processed_activation,
                                       'trigger_on_result',
-                                      data_node.get_data())
-        self._objectives.remove(data_node)
+                                      data_node.get_read_only_data())
+        del self._objectives[data_node]
 
     def _process_trigger_on_descendants(self, data_node):
         """Process the trigger-on-descendants of the given node.
@@ -305,16 +395,61 @@ class EvaluationState(collections.abc.Iterable):
             for the trigger-on-result method.
         """
 
-        # Initialization
+        new_activations = self._call_trigger(obj, trigger_name, *trigger_args)
+        self._incorporate_activations(new_activations)
+        self._trigger_detector.update(obj, new_activations)
+
+    def _call_trigger(self, obj, trigger_name: str, *trigger_args):
+        """Call the described trigger method (i.e. remove it first).
+
+        The version of the graph is increased.
+
+        Returns
+        -------
+            The new Activations created by the trigger.
+        """
+
         trigger = getattr(obj, trigger_name)
         delattr(obj, trigger_name)
+        self._graph_version += 1
+        return trigger(*trigger_args)
 
-        # Invocation
-        new_activations = trigger(*trigger_args)
+    def _process_triggers_on_descendants_batch(self, activations):
+        """Process the trigger-on-descendants of the given Activations at once.
+
+        The triggers are invoked in the given order. The Activations which
+        get blocked by the new Activations of the preceding triggers are
+        skipped (their triggers are left for the next batch). Then,
+        the new Activations of all the triggers are incorporated and the
+        trigger detector is updated only once.
+
+        Parameters
+        ----------
+        activations
+            Activations with eligible trigger-on-descendants.
+        """
+
+        remaining = set(activations)
+        invoked_activations = []
+        new_activations = []
+        for activation in activations:
+            if activation not in remaining:
+                # Blocked by the new Activations
+                continue
+            remaining.remove(activation)
+            created = list(self._call_trigger(activation,
+                                              'trigger_on_descendants'))
+            invoked_activations.append(activation)
+            new_activations.extend(created)
+            if remaining:
+                remaining.difference_update(
+                    self._trigger_detector.get_blocked_activations(remaining,
+                                                                   created)
+                )
 
-        # Finish
         self._incorporate_activations(new_activations)
-        self._trigger_detector.update(obj, new_activations)
+        self._trigger_detector.update_many(invoked_activations,
+                                           new_activations)
 
     def _invoke_eligible_non_result_triggers(self):
         """Successively invoke all eligible triggers-on-descendants and graph's.
@@ -329,12 +464,16 @@ class EvaluationState(collections.abc.Iterable):
         """
 
         # Process all eligible trigger-on-descendants methods
-        while self._trigger_detector.eligible_activations:
-            eligible_activation = \
-                self._trigger_detector.eligible_activations[0]
-            self._process_trigger_on_descendants(
-                self._act_to_node[eligible_activation]
-            )
+        while eligible_activations := self._trigger_detector \
+                .eligible_activations:
+            if self._batch_triggers:
+                self._process_triggers_on_descendants_batch(
+                    eligible_activations
+                )
+            else:
+                self._process_trigger_on_descendants(
+                    self._act_to_node[eligible_activations[0]]
+                )
 
         # No eligible Activations with trigger-on-descendants
 
@@ -343,7 +482,7 @@ class EvaluationState(collections.abc.Iterable):
         # there is no eligible trigger-on-descendants, then either no such
         # method is present or a trigger-on-descendants is 'blocked' (made
         # ineligible) by a trigger-on-result
-        if len(self._objectives):
+        if self._objectives:
             # Nothing we can do right now
             # No eligible activation and graph's trigger (if exists) is blocked
             return
@@ -369,6 +508,104 @@ class EvaluationState(collections.abc.Iterable):
         self._results = [node for node in self if len(node.children) == 0]
         self._is_complete = True
 
+    def check_presence(self) -> list[DataNode]:
+        """Check presence of data of all UNKNOWN nodes in a single pass.
+
+        The database is asked once for all UNKNOWN nodes which were not
+        checked before (i.e. the nodes created since the last check). The
+        nodes whose data are not present are switched to NO_DATA state right
+        away (without access to the data). The nodes with data present
+        remain in UNKNOWN state, their data are loaded by `try_load` when
+        needed.
+
+        Returns
+        -------
+            The UNKNOWN nodes whose data are present in the database.
+        """
+
+        # Some of the new nodes may have already left UNKNOWN state
+        unchecked_nodes = [node for node in self._unchecked_nodes
+                           if node.state is DataNodeState.UNKNOWN]
+        self._unchecked_nodes = []
+        if unchecked_nodes:
+            present_definitions = self._database.contains_many(
+                node.activation.definition for node in unchecked_nodes
+            )
+            for node in unchecked_nodes:
+                if node.activation.definition in present_definitions:
+                    self._present_nodes[node] = None
+                else:
+                    node.set_not_found()
+
+        # The nodes which left UNKNOWN state were removed by the callbacks
+        return list(self._present_nodes)
+
+    def try_load_many(self, nodes: Iterable[DataNode]) -> list[DataNode]:
+        """Try load data of the given UNKNOWN nodes in a single pass.
+
+        The effect is the same as calling `try_load` on each of the nodes,
+        but the database is asked for all the data at once. Note that the
+        data of all found nodes get to memory.
+
+        Parameters
+        ----------
+        nodes
+            The nodes to load. The nodes which are not in UNKNOWN state
+            are skipped.
+
+        Returns
+        -------
+            The nodes whose data were loaded, i.e. which are in MEMORY state.
+        """
+
+        unknown_nodes = [node for node in nodes
+                         if node.state is DataNodeState.UNKNOWN]
+        data_by_definition = self._database.load_many(
+            node.activation.definition for node in unknown_nodes
+        )
+
+        loaded_nodes = []
+        for node in unknown_nodes:
+            definition = node.activation.definition
+            if definition in data_by_definition:
+                # Releasing the reference, so only the node holds the data
+                node.set_loaded_data(data_by_definition.pop(definition))
+                loaded_nodes.append(node)
+            else:
+                node.set_not_found()
+        return loaded_nodes
+
+    def release_dead_parents(self, data_node: DataNode) -> list[DataNode]:
+        """Release data of the node's parents which will not be read again.
+
+        The parent's data are dead, if the parent is in MEMORY state, all
+        its children are processed (i.e. in MEMORY or DISK state) and it is
+        not an objective. The parents are released without any write to disk
+        (see DataNode's `release` method), as their data are in the database.
+
+        The method is supposed to be called after the given node got its
+        data. Note that a trigger may create a new child of a released node,
+        whose data are then loaded from the database again.
+
+        Parameters
+        ----------
+        data_node
+            The node whose parents are examined.
+
+        Returns
+        -------
+            The released parents.
+        """
+
+        released_nodes = []
+        for parent in data_node.parents:
+            if parent.state is DataNodeState.MEMORY \
+                    and not parent.pending_children_count \
+                    and parent not in self._objectives:
+                parent.release()
+                released_nodes.append(parent)
+        return released_nodes
+
     @property
     def used_virtual_memory(self) -> int:
         """The amount of used virtual memory by the process
@@ -397,25 +634,48 @@ class EvaluationState(collections.abc.Iterable):
 
         return memory_info.get_available_memory()
 
+    @property
+    def pending_write_size(self) -> int:
+        """The size of data held in memory until their write is done.
+
+        The data are written in the background either to tmp files (by
+        stored DataNodes) or to the database.
+        """
+
+        writer_size = self._writer.in_flight_bytes \
+            if self._writer is not None \
+            else 0
+        return writer_size + self._database.pending_write_size
+
+    @property
+    def memory_data_size(self) -> int:
+        """The total size of data of the nodes in MEMORY state in bytes.
+
+        The size is kept up to date on changes of nodes' states, so the query
+        is O(1).
+        """
+
+        return self._memory_data_size
+
     @property
     def memory_nodes(self) -> Iterable[DataNode]:
         """Data nodes in the state MEMORY."""
-        return self._nodes_by_state[DataNodeState.MEMORY]
+        return self._nodes_by_state[DataNodeState.MEMORY].keys()
 
     @property
     def disk_nodes(self) -> Iterable[DataNode]:
         """Data nodes in the state DISK."""
-        return self._nodes_by_state[DataNodeState.DISK]
+        return self._nodes_by_state[DataNodeState.DISK].keys()
 
     @property
     def no_data_nodes(self) -> Iterable[DataNode]:
         """Data nodes in the state MEMORY."""
-        return self._nodes_by_state[DataNodeState.NO_DATA]
+        return self._nodes_by_state[DataNodeState.NO_DATA].keys()
 
     @property
     def unknown_nodes(self) -> Iterable[DataNode]:
         """Data nodes in the state UNKNOWN."""
-        return self._nodes_by_state[DataNodeState.UNKNOWN]
+        return self._nodes_by_state[DataNodeState.UNKNOWN].keys()
 
     @property
     def objectives(self) -> Iterable[DataNode]:
@@ -437,7 +697,7 @@ class EvaluationState(collections.abc.Iterable):
         each invocation of a trigger.
         """
 
-        return self._objectives
+        return self._objectives.keys()
 
     @property
     def results(self) -> Iterable[DataNode]:
@@ -454,6 +714,24 @@ class EvaluationState(collections.abc.Iterable):
 
         return self._results
 
+    @property
+    def cost_model(self) -> Optional[CostModel]:
+        """CostModel where the costs of evaluation are recorded, if any."""
+        return self._cost_model
+
+    @property
+    def graph_version(self) -> int:
+        """The version of the graph, which changes with each trigger.
+
+        The graph may change only by invocation of a trigger method. Thus,
+        as long as the version is the same, no nodes are added and the
+        objectives and results may only get processed. The users of the ES
+        may keep the results of their analyses of the graph until the
+        version changes.
+        """
+
+        return self._graph_version
+
     @property
     def has_graph_trigger(self) -> bool:
         """Whether the corresponding graph has a trigger method."""
@@ -483,4 +761,51 @@ class EvaluationState(collections.abc.Iterable):
             An iterator over all DataNodes in the EvaluationState.
         """
 
-        return itertools.chain(*self._nodes_by_state.values())
+        return itertools.chain.from_iterable(self._nodes_by_state.values())
+
+    def __len__(self) -> int:
+        """Return the number of all DataNodes of the underlying graph."""
+        return sum(len(nodes) for nodes in self._nodes_by_state.values())
+
+    def get_top_unknown_node(self) -> Optional[DataNode]:
+        """Return the UNKNOWN node with the lowest level.
+
+        The UNKNOWN nodes are kept by their levels, so the method does not
+        iterate over them. Of the nodes with the same level, the one which
+        arrived first to UNKNOWN state is returned.
+
+        Returns
+        -------
+            The UNKNOWN node with the lowest level. None, if there is no
+            UNKNOWN node.
+        """
+
+        levels = self._unknown_levels
+        # Dropping the levels which lost all their UNKNOWN nodes
+        while levels and levels[0] not in self._unknown_nodes_by_level:
+            heapq.heappop(levels)
+        if not levels:
+            return None
+        return next(iter(self._unknown_nodes_by_level[levels[0]]))
+
+    def get_node_count(self, *states: DataNodeState) -> int:
+        """Return the number of DataNodes in the given states.
+
+        The counts are kept up to date with each change of a node's state,
+        so the method does not iterate over the nodes. Thus, it is cheap
+        enough to be called after each processed node (e.g. for logging).
+
+        Parameters
+        ----------
+        states
+            The states whose nodes are counted. If no state is given,
+            all the nodes are counted.
+
+        Returns
+        -------
+            The number of DataNodes in the given states.
+        """
+
+        if not states:
+            return len(self)
+        return sum(len(self._nodes_by_state[state]) for state in set(states))
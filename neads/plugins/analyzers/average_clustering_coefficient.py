@@ -4,4 +4,5 @@ from neads import Plugin, PluginID
 
 
 average_clustering_coefficient = \
-    Plugin(PluginID('average_clustering_coefficient', 0), nx.average_clustering)
+    Plugin(PluginID('average_clustering_coefficient', 0),
+           nx.average_clustering, read_only_arguments=True)
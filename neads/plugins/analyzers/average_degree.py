@@ -22,4 +22,5 @@ def method(network):
     return av_deg
 
 
-average_degree = Plugin(PluginID('average_degree', 0), method)
+average_degree = Plugin(PluginID('average_degree', 0), method,
+                        read_only_arguments=True)
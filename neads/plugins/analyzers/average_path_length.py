@@ -30,4 +30,5 @@ def method(network):
     return mean(flat_lengths)
 
 
-average_path_length = Plugin(PluginID('average_path_length', 0), method)
+average_path_length = Plugin(PluginID('average_path_length', 0), method,
+                             read_only_arguments=True)
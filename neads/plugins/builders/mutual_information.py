@@ -36,7 +36,8 @@ def method(df, normalize=False):
     return g
 
 
-mutual_information = Plugin(PluginID('mutual_information', 0), method)
+mutual_information = Plugin(PluginID('mutual_information', 0), method,
+                            read_only_arguments=True)
 
 
 # Original author: Nikola Jajcay, jajcay(at)cs.cas.cz
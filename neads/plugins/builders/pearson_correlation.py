@@ -33,4 +33,5 @@ def method(df: pd.DataFrame):
     return g
 
 
-pearson_correlation = Plugin(PluginID('pearson_correlation', 0), method)
+pearson_correlation = Plugin(PluginID('pearson_correlation', 0), method,
+                             read_only_arguments=True)
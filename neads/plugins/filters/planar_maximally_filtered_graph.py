@@ -44,4 +44,5 @@ def _get_sorted_edges(G):
 
 
 planar_maximally_filtered_graph = \
-    Plugin(PluginID('planar_maximally_filtered_graph', 0), method)
+    Plugin(PluginID('planar_maximally_filtered_graph', 0), method,
+           read_only_arguments=True)
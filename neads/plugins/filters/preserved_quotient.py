@@ -33,4 +33,5 @@ def method(network, quotient):
     return new_network
 
 
-preserved_quotient = Plugin(PluginID('preserved_quotient', 0), method)
+preserved_quotient = Plugin(PluginID('preserved_quotient', 0), method,
+                            read_only_arguments=True)
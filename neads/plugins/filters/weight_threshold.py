@@ -28,4 +28,5 @@ def method(network, threshold):
     return new_network
 
 
-weight_threshold = Plugin(PluginID('weight_threshold', 0), method)
+weight_threshold = Plugin(PluginID('weight_threshold', 0), method,
+                          read_only_arguments=True)
@@ -21,4 +21,5 @@ def method(df):
     return log_ret
 
 
-logarithmic_return = Plugin(PluginID('logarithmic_return', 0), method)
+logarithmic_return = Plugin(PluginID('logarithmic_return', 0), method,
+                            read_only_arguments=True)
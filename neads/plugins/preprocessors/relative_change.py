@@ -20,4 +20,5 @@ def method(df):
     return relative_change_
 
 
-relative_change = Plugin(PluginID('relative_change', 0), method)
+relative_change = Plugin(PluginID('relative_change', 0), method,
+                         read_only_arguments=True)
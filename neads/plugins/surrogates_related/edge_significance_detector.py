@@ -44,4 +44,5 @@ def method(data_network, surrogate_networks, alpha=0.95, *, weight='weight'):
 
 
 edge_significance_detector \
-    = Plugin(PluginID('edge_significance_detector', 0), method)
+    = Plugin(PluginID('edge_significance_detector', 0), method,
+             read_only_arguments=True)
@@ -26,7 +26,8 @@ def method(data, *, seed):
     return result_data
 
 
-surrogate_series = Plugin(PluginID('surrogate_series', 0), method)
+surrogate_series = Plugin(PluginID('surrogate_series', 0), method,
+                          read_only_arguments=True)
 
 
 # Original author: Nikola Jajcay, jajcay(at)cs.cas.cz
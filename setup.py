@@ -44,6 +44,7 @@ setup(
         'neads.activation_model.symbolic_objects.concrete_composite_objects',
         'neads.database',
         'neads.evaluation_manager',
+        'neads.evaluation_manager.pool_evaluation_manager',
         'neads.evaluation_manager.single_thread_evaluation_manager',
         'neads.evaluation_manager.single_thread_evaluation_manager.evaluation_algorithms',
         'neads.plugins',
@@ -0,0 +1,25 @@
+from neads.evaluation_manager.single_thread_evaluation_manager \
+    .evaluation_algorithms import ComplexAlgorithm, DataSizeAccountant
+
+
+def get_swapping_algorithm(*, proportion_to_store=1, **kwargs):
+    """Return ComplexAlgorithm which is forced to swap.
+
+    Any data in memory exceed the limit, so the data are stored to disk
+    as soon as possible.
+
+    Parameters
+    ----------
+    proportion_to_store
+        The proportion of data in memory stored to disk at once.
+    kwargs
+        Other keyword arguments of the ComplexAlgorithm.
+
+    Returns
+    -------
+        ComplexAlgorithm with zero memory limit.
+    """
+
+    return ComplexAlgorithm(memory_limit=0,
+                            proportion_to_store=proportion_to_store,
+                            memory_accountant=DataSizeAccountant(0), **kwargs)
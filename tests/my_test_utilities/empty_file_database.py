@@ -9,11 +9,11 @@ DB_DIR = pathlib.Path(__file__).parent / 'file_database'
 _finalizer = None
 
 
-def get():
+def get(**kwargs):
     _do_delete()
 
     FileDatabase.create(DB_DIR)
-    db = FileDatabase(DB_DIR)
+    db = FileDatabase(DB_DIR, **kwargs)
 
     global _finalizer
     _finalizer = weakref.finalize(db, _do_delete)
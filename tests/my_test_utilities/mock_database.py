@@ -25,6 +25,9 @@ class MockDatabase(IDatabase):
         except KeyError:
             raise DataNotFound()
 
+    def _do_contains(self, key):
+        return key in self._content
+
     def _do_delete(self, key):
         try:
             del self._content[key]
@@ -1,10 +1,18 @@
 import unittest
 
+import datetime
+import gc
 import pathlib
 import os
+import subprocess
+import sys
 import pickle as pkl
 
+from frozendict import frozendict
+import numpy as np
+
 from neads.activation_model.data_definition import DataDefinition
+from neads.activation_model.plugin import PluginID
 from neads.activation_model.symbolic_argument_set import SymbolicArgumentSet
 from neads.activation_model.symbolic_objects import *
 
@@ -123,5 +131,219 @@ class MyTestCase(unittest.TestCase):
         self.assertIs(ddf_outer_1, ddf_outer_2)
 
 
+
+class _Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __eq__(self, other):
+        return (self.x, self.y) == (other.x, other.y)
+
+    def __hash__(self):
+        return hash((self.x, self.y))
+
+
+class TestDataDefinitionDigest(unittest.TestCase):
+    def setUp(self) -> None:
+        def f_1(x):  # noqa
+            pass
+
+        self.f_1 = f_1
+        self.fid = PluginID('digest_function', 0)
+        self.sym_a = Symbol()
+
+    def _get_ddf(self, *args, **kwargs):
+        return DataDefinition.get_instance(
+            self.fid, SymbolicArgumentSet(self.f_1, *args, **kwargs)
+        )
+
+    def test_digest_is_sha256(self):
+        digest = self._get_ddf(1).digest
+
+        self.assertEqual(64, len(digest))
+        int(digest, 16)
+
+    def test_different_arguments_different_digest(self):
+        self.assertNotEqual(self._get_ddf(1).digest, self._get_ddf(2).digest)
+        self.assertNotEqual(self._get_ddf('1').digest,
+                            self._get_ddf(1).digest)
+        self.assertNotEqual(self._get_ddf((1,)).digest,
+                            self._get_ddf((1, 1)).digest)
+
+    def test_different_function_id_different_digest(self):
+        ddf_other = DataDefinition.get_instance(
+            PluginID('digest_function', 1),
+            SymbolicArgumentSet(self.f_1, 1)
+        )
+
+        self.assertNotEqual(self._get_ddf(1).digest, ddf_other.digest)
+
+    def test_equal_arguments_same_digest(self):
+        encodings = [
+            (self._get_ddf(1.0), 1),
+            (self._get_ddf(-0.0), 0),
+            (self._get_ddf(frozendict(b=2, a=1)), frozendict(a=1, b=2)),
+            (self._get_ddf(frozenset([3, 1, 2])), frozenset([1, 2, 3])),
+            (self._get_ddf(np.int64(3)), 3),
+            (self._get_ddf(np.float32(0.5)), 0.5),
+            (self._get_ddf(np.bool_(True)), 1),
+            (self._get_ddf(datetime.datetime(
+                2021, 1, 1, 1, tzinfo=datetime.timezone(
+                    datetime.timedelta(hours=1))
+            )), datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)),
+        ]
+
+        for ddf, equal_argument in encodings:
+            with self.subTest(argument=equal_argument):
+                # Compute the digest from the equal arguments directly
+                other = DataDefinition.__new__(DataDefinition)
+                other._function_id = self.fid
+                other._arguments = SymbolicArgumentSet(self.f_1,
+                                                       equal_argument)
+                other._digest = None
+                self.assertEqual(ddf.digest, other.digest)
+
+    def test_digest_of_nested_definition(self):
+        ddf_1 = self._get_ddf(1)
+        ddf_2 = self._get_ddf(2)
+        sas = SymbolicArgumentSet(self.f_1, self.sym_a)
+
+        outer_1 = DataDefinition.get_instance(self.fid, sas,
+                                              {self.sym_a: ddf_1})
+        outer_2 = DataDefinition.get_instance(self.fid, sas,
+                                              {self.sym_a: ddf_2})
+
+        self.assertNotEqual(outer_1.digest, outer_2.digest)
+        self.assertNotEqual(ddf_1.digest, outer_1.digest)
+
+    def test_digest_of_dates(self):
+        self.assertNotEqual(self._get_ddf(datetime.date(2021, 1, 1)).digest,
+                            self._get_ddf(datetime.date(2021, 1, 2)).digest)
+        self.assertNotEqual(
+            self._get_ddf(datetime.date(2021, 1, 1)).digest,
+            self._get_ddf(datetime.datetime(2021, 1, 1)).digest
+        )
+        self.assertNotEqual(self._get_ddf(datetime.timedelta(1)).digest,
+                            self._get_ddf(datetime.timedelta(2)).digest)
+
+    def test_digest_of_unsupported_argument(self):
+        ddf = self._get_ddf(_Point(1, 2))
+
+        with self.assertRaises(TypeError):
+            ddf.digest
+
+    def test_digest_with_registered_encoder(self):
+        DataDefinition.register_encoder(
+            _Point, lambda p: f'{p.x},{p.y}'.encode()
+        )
+        self.addCleanup(DataDefinition._encoders.pop, _Point)
+
+        self.assertEqual(self._get_ddf(_Point(1, 2)).digest,
+                         self._get_ddf(_Point(1, 2)).digest)
+        self.assertNotEqual(self._get_ddf(_Point(1, 2)).digest,
+                            self._get_ddf(_Point(2, 1)).digest)
+        self.assertNotEqual(self._get_ddf(_Point(1, 2)).digest,
+                            self._get_ddf('1,2').digest)
+
+    def test_digest_is_same_in_other_process(self):
+        code = (
+            'from frozendict import frozendict\n'
+            'from neads.activation_model import *\n'
+            'from neads.activation_model.plugin import PluginID\n'
+            'def f_1(x): pass\n'
+            'fid = PluginID("digest_function", 0)\n'
+            'sym = Symbol()\n'
+            'ddf = DataDefinition.get_instance(fid, '
+            'SymbolicArgumentSet(f_1, frozendict(a=(1, 2.5), b=None)))\n'
+            'outer = DataDefinition.get_instance(fid, '
+            'SymbolicArgumentSet(f_1, sym), {sym: ddf})\n'
+            'print(outer.digest)\n'
+        )
+        sym = Symbol()
+        ddf = self._get_ddf(frozendict(b=None, a=(1, 2.5)))
+        outer = DataDefinition.get_instance(
+            self.fid, SymbolicArgumentSet(self.f_1, sym), {sym: ddf}
+        )
+
+        result = subprocess.run([sys.executable, '-c', code],
+                                capture_output=True, text=True, check=True,
+                                cwd=pathlib.Path(__file__).parents[2])
+
+        self.assertEqual(outer.digest, result.stdout.strip())
+
+
+class TestDataDefinitionRegistry(unittest.TestCase):
+    def setUp(self) -> None:
+        def f_1(x):  # noqa
+            pass
+
+        self.fid = 'registry_function'
+        self.sym_a = Symbol()
+        self.sas_f_1__1 = SymbolicArgumentSet(f_1, 1)
+        self.sas_f_1__2 = SymbolicArgumentSet(f_1, 2)
+        self.sas_f_1__sym_a = SymbolicArgumentSet(f_1, self.sym_a)
+
+    def tearDown(self) -> None:
+        DataDefinition.set_cache_size(0)
+
+    def _count_instances(self):
+        return sum(ddf._function_id == self.fid
+                   for ddf in DataDefinition._instances.values())
+
+    def test_unused_instances_are_freed(self):
+        ddf = DataDefinition.get_instance(self.fid, self.sas_f_1__1)
+        DataDefinition.get_instance(self.fid, self.sas_f_1__sym_a,
+                                    {self.sym_a: ddf})
+        del ddf
+        gc.collect()
+
+        self.assertEqual(0, self._count_instances())
+
+    def test_parent_is_kept_alive_by_child(self):
+        ddf = DataDefinition.get_instance(self.fid, self.sas_f_1__1)
+        ddf_outer = DataDefinition.get_instance(self.fid, self.sas_f_1__sym_a,
+                                                {self.sym_a: ddf})
+        ddf_id = id(ddf)
+        del ddf
+        gc.collect()
+
+        self.assertEqual(2, self._count_instances())
+        ddf = DataDefinition.get_instance(self.fid, self.sas_f_1__1)
+        self.assertEqual(ddf_id, id(ddf))
+        self.assertIs(ddf_outer, DataDefinition.get_instance(
+            self.fid, self.sas_f_1__sym_a, {self.sym_a: ddf}
+        ))
+
+    def test_cache_keeps_recently_used_instances(self):
+        DataDefinition.set_cache_size(1)
+
+        DataDefinition.get_instance(self.fid, self.sas_f_1__1)
+        gc.collect()
+        self.assertEqual(1, self._count_instances())
+
+        DataDefinition.get_instance(self.fid, self.sas_f_1__2)
+        gc.collect()
+        # Only the most recently used instance is kept
+        self.assertEqual(1, self._count_instances())
+
+    def test_shrinking_cache_frees_instances(self):
+        DataDefinition.set_cache_size(2)
+        DataDefinition.get_instance(self.fid, self.sas_f_1__1)
+        DataDefinition.get_instance(self.fid, self.sas_f_1__2)
+
+        DataDefinition.set_cache_size(0)
+        gc.collect()
+
+        self.assertEqual(0, self._count_instances())
+
+    def test_negative_cache_size(self):
+        self.assertRaises(
+            ValueError,
+            DataDefinition.set_cache_size,
+            -1
+        )
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -35,12 +35,21 @@ class TestPlugin(unittest.TestCase):
         expected = inspect.signature(self.f_x_y)
         self.assertEqual(expected, actual)
 
+    def test_signature_is_cached(self):
+        self.assertIs(self.plugin.signature, self.plugin.signature)
+
     def test_id(self):
         actual = self.plugin.id
 
         expected = self.pl_id
         self.assertEqual(expected, actual)
 
+    def test_read_only_arguments(self):
+        plugin = Plugin(self.pl_id, self.f_x_y, read_only_arguments=True)
+
+        self.assertFalse(self.plugin.read_only_arguments)
+        self.assertTrue(plugin.read_only_arguments)
+
     def test_call(self):
         actual = self.plugin(10, 20)
 
@@ -3,6 +3,8 @@ import inspect
 
 from neads.activation_model.symbolic_argument_set import SymbolicArgumentSet
 from neads.activation_model.symbolic_objects import *
+from neads.activation_model.symbolic_objects.symbolic_object_exception \
+    import SymbolicObjectException
 
 
 class TestSymbolicArgumentSet(unittest.TestCase):
@@ -216,6 +218,74 @@ class TestSymbolicArgumentSet(unittest.TestCase):
         self.assertIs(actual[0], actual[1])
         self.assertIs(actual[0], actual[2])
 
+    def test_get_actual_arguments_with_all_kinds_of_parameters(self):
+        def f(x, /, y, *args, z, **kwargs):
+            pass
+
+        sas = SymbolicArgumentSet(f, 1, self.symbol_a, 3, 4, z=self.list_ab,
+                                  w=5)
+
+        actual = sas.get_actual_arguments({self.symbol_a: 2,
+                                           self.symbol_b: 6})
+
+        expected = inspect.signature(f).bind(1, 2, 3, 4, z=[2, 6], w=5)
+        self.assertEqual(expected, actual)
+
+    def test_get_actual_arguments_without_variadic_arguments(self):
+        sas = SymbolicArgumentSet(self.g_args_kwargs)
+
+        actual = sas.get_actual_arguments()
+
+        expected = inspect.signature(self.g_args_kwargs).bind()
+        self.assertEqual(expected, actual)
+
+    def test_get_actual_arguments_repeated(self):
+        sas = SymbolicArgumentSet(self.f_x_y, self.symbol_a, [2])
+
+        actual_1 = sas.get_actual_arguments(self.symbol_a, 1)
+        actual_2 = sas.get_actual_arguments(self.symbol_a, 3)
+
+        self.assertEqual((1, [2]), actual_1.args)
+        self.assertEqual((3, [2]), actual_2.args)
+        # The mutable constant is not shared between the calls
+        self.assertIsNot(actual_1.args[1], actual_2.args[1])
+
+    def test_get_actual_arguments_missing_symbol(self):
+        sas = SymbolicArgumentSet(self.f_x_y, self.symbol_a, self.list_ab)
+
+        self.assertRaises(
+            SymbolicObjectException,
+            sas.get_actual_arguments,
+            self.symbol_a, 1
+        )
+
+    def test_get_value_copy_share_with_nested_symbol(self):
+        list_ = [1]
+        to_subs = {
+            self.symbol_a: list_,
+            self.symbol_b: list_
+        }
+
+        sas = SymbolicArgumentSet(self.f_x_y, self.symbol_a, self.list_ab)
+        actual = sas.get_actual_arguments(to_subs).args
+
+        self.assertIsNot(list_, actual[0])
+        self.assertIs(actual[0], actual[1][0])
+        self.assertIsNot(actual[0], actual[1][1])
+
+    def test_get_value_copy_not_share_with_nested_symbol(self):
+        list_ = [1]
+        to_subs = {
+            self.symbol_a: list_,
+            self.symbol_b: list_
+        }
+
+        sas = SymbolicArgumentSet(self.f_x_y, self.symbol_a, self.list_ab)
+        actual = sas.get_actual_arguments(to_subs, share=False).args
+
+        self.assertIsNot(list_, actual[1][0])
+        self.assertIsNot(actual[0], actual[1][0])
+
     def test_eq_keyword_or_positional_arguments(self):
         sas_1 = SymbolicArgumentSet(self.f_x_y, 1, 2)
         sas_2 = SymbolicArgumentSet(self.f_x_y, x=1, y=2)
@@ -1,4 +1,5 @@
 import unittest
+import pickle
 
 from neads.activation_model.symbolic_objects import *
 
@@ -181,6 +182,25 @@ class TestListObjectFlat(unittest.TestCase):
 
         self.assertNotEqual(hash(self.list_object), hash(other))
 
+    def test_eq_with_cached_hashes(self):
+        equal = ListObject(self.symbol_1, self.symbol_1, self.symbol_2,
+                           Value(self.int_value))
+        different = ListObject(self.symbol_1)
+        hash(self.list_object), hash(equal), hash(different)
+
+        self.assertEqual(self.list_object, equal)
+        self.assertNotEqual(self.list_object, different)
+
+    def test_pickle_drops_cached_hash(self):
+        list_object = ListObject(Value(1), Value('a'))
+        hash(list_object)
+
+        unpickled = pickle.loads(pickle.dumps(list_object))
+
+        self.assertIsNone(unpickled._hash)
+        self.assertEqual(list_object, unpickled)
+        self.assertEqual(hash(list_object), hash(unpickled))
+
     def test_getitem(self):
         self.assertIs(self.symbol_1, self.list_object[0])
         self.assertIs(self.symbol_1, self.list_object[1])
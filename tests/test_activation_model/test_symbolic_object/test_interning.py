@@ -0,0 +1,81 @@
+import unittest
+import gc
+
+from neads.activation_model.symbolic_objects import *
+from neads.activation_model.symbolic_objects.interning import \
+    intern_symbolic_object, _interned
+
+
+class TestInterning(unittest.TestCase):
+    def test_equal_values_are_interned(self):
+        value_1 = intern_symbolic_object(Value('abc'))
+        value_2 = intern_symbolic_object(Value('abc'))
+
+        self.assertIs(value_1, value_2)
+
+    def test_values_of_different_types_are_not_interned_together(self):
+        value_int = intern_symbolic_object(Value(1))
+        value_bool = intern_symbolic_object(Value(True))
+
+        self.assertIsNot(value_int, value_bool)
+        self.assertIs(type(value_int.get_value()), int)
+        self.assertIs(type(value_bool.get_value()), bool)
+
+    def test_float_value_is_not_interned(self):
+        value = Value(-0.0)
+
+        self.assertIs(value, intern_symbolic_object(value))
+        self.assertIsNot(intern_symbolic_object(Value(0.0)),
+                         intern_symbolic_object(Value(-0.0)))
+
+    def test_nested_objects_are_interned(self):
+        symbol = Symbol()
+
+        def make():
+            return ListObject(
+                symbol,
+                DictObject({Value('a'): Value(1)}),
+                ListObject(Value(2), Value(None))
+            )
+
+        list_1 = intern_symbolic_object(make())
+        list_2 = intern_symbolic_object(make())
+
+        self.assertIs(list_1, list_2)
+        self.assertEqual(make(), list_1)
+
+    def test_object_with_interned_subobjects_is_reused(self):
+        list_object = ListObject(Symbol(), Symbol())
+
+        self.assertIs(list_object, intern_symbolic_object(list_object))
+
+    def test_mutable_value_is_not_interned(self):
+        value = Value([1])
+
+        self.assertIs(value, intern_symbolic_object(value))
+        self.assertIsNot(intern_symbolic_object(Value([1])),
+                         intern_symbolic_object(Value([1])))
+
+    def test_value_of_object_compared_by_identity_is_not_interned(self):
+        content = object()
+        value = Value(content)
+
+        self.assertIs(value, intern_symbolic_object(value))
+        self.assertIsNot(intern_symbolic_object(Value(content)),
+                         intern_symbolic_object(Value(content)))
+
+    def test_interned_objects_are_freed(self):
+        size_before = len(_interned)
+        list_object = intern_symbolic_object(
+            ListObject(Value('unique key of the test'))
+        )
+        self.assertGreater(len(_interned), size_before)
+
+        del list_object
+        gc.collect()
+
+        self.assertEqual(size_before, len(_interned))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -65,6 +65,18 @@ class TestSymbol(unittest.TestCase):
         self.assertNotEqual(self.nested_lists, result_2)
         self.assertNotEqual(result_1, result_2)
 
+    def test_get_value_immutable_object_is_not_copied(self):
+        value = Value((1, 'string', (2.5, None)))
+
+        self.assertTrue(value.is_immutable)
+        self.assertIs(value.get_value(), value.get_value())
+
+    def test_get_value_tuple_with_mutable_item_is_copied(self):
+        value = Value((1, [2]))
+
+        self.assertFalse(value.is_immutable)
+        self.assertIsNot(value.get_value(), value.get_value())
+
     def test_eq_comparison_with_self(self):
         expected = True
 
@@ -108,6 +120,24 @@ class TestSymbol(unittest.TestCase):
 
         self.assertNotEqual(hash(val_x), hash(val_y))
 
+    def test_hash_is_cached(self):
+        value = Value((1, 'a'))
+
+        hash(value)
+
+        self.assertEqual(hash((1, 'a')), value._hash)
+
+    def test_unpickle_value_without_cached_attributes(self):
+        value = Value([1])
+        state = value.__getstate__()
+        del state['_is_immutable']  # As if pickled by an older version
+        unpickled = Value.__new__(Value)
+
+        unpickled.__setstate__(state)
+
+        self.assertFalse(unpickled.is_immutable)
+        self.assertEqual(value, unpickled)
+
     def test_hash_of_un_hashable(self):
         val = Value([1])
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import unittest
+import unittest.mock
 
 from typing import TYPE_CHECKING
 import abc
@@ -114,6 +115,57 @@ class BaseTestClassWrapper:
                 actual = self.database.load(key)
                 self.assertEqual(data, actual)
 
+        def test_contains_when_not_open(self):
+            self.assertRaises(
+                DatabaseAccessError,
+                self.database.contains,
+                'key'
+            )
+
+        def test_contains(self):
+            self.database.open()
+            self.database.save('data', 'key')
+
+            self.assertTrue(self.database.contains('key'))
+            self.assertFalse(self.database.contains('other_key'))
+
+        def test_contains_does_not_load_data(self):
+            self.database.open()
+            self.database.save('data', 'key')
+
+            with unittest.mock.patch.object(self.database, '_do_load') \
+                    as do_load:
+                self.assertTrue(self.database.contains('key'))
+                self.assertEqual({'key'},
+                                 self.database.contains_many(['key', 'other']))
+
+            do_load.assert_not_called()
+
+        def test_contains_many(self):
+            self.database.open()
+            self.database.save('data', 'key')
+            self.database.save('other_data', 'other_key')
+
+            actual = self.database.contains_many(['key', 'missing_key'])
+
+            self.assertEqual({'key'}, actual)
+
+        def test_load_many(self):
+            self.database.open()
+            self.database.save('data', 'key')
+            self.database.save('other_data', 'other_key')
+
+            actual = self.database.load_many(['key', 'missing_key'])
+
+            self.assertEqual({'key': 'data'}, actual)
+
+        def test_load_many_when_not_open(self):
+            self.assertRaises(
+                DatabaseAccessError,
+                self.database.load_many,
+                ['key']
+            )
+
         def test_open_close(self):
             self.assertFalse(self.database.is_open)
             self.database.open()
@@ -1,8 +1,29 @@
+import pickle as pkl
+import unittest.mock as mock
+
 from tests.test_database.test_database import BaseTestClassWrapper
 
+from neads.activation_model import DataDefinition, SymbolicArgumentSet
+from neads.activation_model.plugin import PluginID
+from neads._internal_utils.serializers import MemoryMapSerializer, \
+    CompressingSerializer
+
 import tests.my_test_utilities.empty_file_database as file_db
 
 
+class _Opaque:
+    """Argument without canonical encoding."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return isinstance(other, _Opaque) and self.value == other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
+
 class TestFileDatabase(BaseTestClassWrapper.BaseTestDatabase):
 
     def get_database(self):
@@ -11,3 +32,137 @@ class TestFileDatabase(BaseTestClassWrapper.BaseTestDatabase):
     def tearDown(self) -> None:
         super().tearDown()
         file_db.delete()
+
+    @staticmethod
+    def _get_definition(value):
+        def f(x):  # noqa
+            pass
+
+        return DataDefinition.get_instance(PluginID('f', 0),
+                                           SymbolicArgumentSet(f, value))
+
+    def test_data_definition_indexed_by_digest(self):
+        ddf = self._get_definition(1)
+        self.database.open()
+
+        self.database.save('data', ddf)
+
+        self.assertIn(ddf.digest, self.database._index)
+        self.assertEqual('data', self.database.load(ddf))
+        self.assertEqual({ddf}, self.database.contains_many([ddf]))
+
+    def test_index_with_data_definitions_is_converted(self):
+        ddf_1, ddf_2 = self._get_definition(1), self._get_definition(2)
+        self.database.open()
+        self.database.save('data_1', ddf_1)
+        self.database.save('data_2', ddf_2)
+        self.database.close()
+        # Write the index as the older versions did
+        with open(self.database._index_path, 'wb') as f:
+            pkl.dump({ddf_1: 0, ddf_2: 1}, f)
+
+        self.database.open()
+
+        self.assertEqual([ddf_1.digest, ddf_2.digest],
+                         list(self.database._index))
+        self.assertEqual({ddf_1: 'data_1', ddf_2: 'data_2'},
+                         self.database.load_many([ddf_1, ddf_2]))
+
+    def test_data_definition_without_digest(self):
+        ddf = self._get_definition(_Opaque(1))
+        self.database.open()
+
+        self.database.save('data', ddf)
+        self.database.close()
+        self.database.open()
+
+        self.assertIn(ddf, self.database._index)
+        self.assertTrue(self.database.contains(ddf))
+        self.assertEqual('data', self.database.load(ddf))
+
+    def test_index_with_definition_without_digest_is_opened(self):
+        ddf_1 = self._get_definition(1)
+        ddf_2 = self._get_definition(_Opaque(2))
+        self.database.open()
+        self.database.save('data_1', ddf_1)
+        self.database.save('data_2', ddf_2)
+        self.database.close()
+        # Write the index as the older versions did
+        with open(self.database._index_path, 'wb') as f:
+            pkl.dump({ddf_1: 0, ddf_2: 1}, f)
+
+        self.database.open()
+
+        self.assertEqual([ddf_1.digest, ddf_2], list(self.database._index))
+        self.assertEqual({ddf_1: 'data_1', ddf_2: 'data_2'},
+                         self.database.load_many([ddf_1, ddf_2]))
+
+
+class TestFileDatabaseWithWriteBehind(TestFileDatabase):
+
+    def get_database(self):
+        return file_db.get(write_behind=True, max_pending_writes=1)
+
+    def test_load_waits_for_write(self):
+        data = list(range(100_000))
+        self.database.open()
+
+        self.database.save(data, 'key')
+        actual = self.database.load('key')
+
+        self.assertEqual(data, actual)
+
+    def test_saved_data_persist_after_close(self):
+        self.database.open()
+        for i in range(10):
+            self.database.save(i, f'key_{i}')
+        self.database.close()
+
+        self.database.open()
+        actual = self.database.load_many(f'key_{i}' for i in range(10))
+
+        self.assertEqual({f'key_{i}': i for i in range(10)}, actual)
+
+    def test_save_with_known_size(self):
+        self.database.open()
+        mock_path = 'neads.database.file_database.memory_info'
+
+        with mock.patch(mock_path) as memory_info_mock:
+            self.database.save('data', 'key', size=100)
+
+        memory_info_mock.get_object_size.assert_not_called()
+        self.assertEqual('data', self.database.load('key'))
+
+    def test_index_is_not_written_after_failed_write(self):
+        self.database.open()
+        self.database.save('data', 'key')
+        self.database.close()
+        self.database.open()
+
+        with mock.patch.object(self.database._serializer, 'save',
+                               side_effect=OSError()):
+            self.database.save('other_data', 'other_key')
+            self.assertRaises(OSError, self.database.close)
+
+        self.database.open()
+        self.assertFalse(self.database.contains('other_key'))
+        self.assertEqual('data', self.database.load('key'))
+
+    def test_no_pending_write_after_close(self):
+        self.database.open()
+        self.database.save(list(range(100_000)), 'key')
+        self.database.close()
+
+        self.assertEqual(0, self.database.pending_write_size)
+
+
+class TestFileDatabaseWithMemoryMapSerializer(TestFileDatabase):
+
+    def get_database(self):
+        return file_db.get(serializer=MemoryMapSerializer())
+
+
+class TestFileDatabaseWithCompressingSerializer(TestFileDatabase):
+
+    def get_database(self):
+        return file_db.get(serializer=CompressingSerializer())
@@ -1,3 +1,6 @@
+import unittest
+
+from neads.database import IDatabase, DataNotFound
 from tests.test_database.test_database import BaseTestClassWrapper
 from tests.my_test_utilities.mock_database import MockDatabase
 
@@ -6,3 +9,46 @@ class TestMockDatabase(BaseTestClassWrapper.BaseTestDatabase):
 
     def get_database(self):
         return MockDatabase()
+
+
+class _LoadingDatabase(IDatabase):
+    """Database which implements only the abstract methods."""
+
+    def __init__(self):
+        self._content = {}
+        self._is_open = False
+
+    @property
+    def is_open(self):
+        return self._is_open
+
+    def _do_open(self):
+        self._is_open = True
+
+    def _do_close(self):
+        self._is_open = False
+
+    def _do_save(self, data, key):
+        self._content[key] = data
+
+    def _do_load(self, key):
+        try:
+            return self._content[key]
+        except KeyError:
+            raise DataNotFound()
+
+    def _do_delete(self, key):
+        del self._content[key]
+
+
+class TestDefaultContains(unittest.TestCase):
+    def test_contains_by_loading(self):
+        database = _LoadingDatabase()
+
+        with database:
+            database.save('data', 'key')
+
+            self.assertTrue(database.contains('key'))
+            self.assertFalse(database.contains('other_key'))
+            self.assertEqual({'key'},
+                             database.contains_many(['key', 'other_key']))
@@ -0,0 +1,45 @@
+import unittest
+
+from neads.evaluation_manager import IEvaluationManager, \
+    BaseEvaluationManager, SingleThreadEvaluationManager, \
+    ProcessPoolEvaluationManager
+
+from tests.my_test_utilities.mock_database import MockDatabase
+import tests.my_test_utilities.activation_graphs_for_tests as graphs
+
+
+class EvaluateOnlyManager(IEvaluationManager):
+    def evaluate(self, activation_graph):
+        return {}
+
+
+class TestIEvaluationManager(unittest.TestCase):
+    def test_manager_without_plan_can_be_instantiated(self):
+        em = EvaluateOnlyManager()
+
+        self.assertDictEqual({}, em.evaluate(None))
+
+    def test_plan_is_not_supported_by_default(self):
+        em = EvaluateOnlyManager()
+        graph, _ = graphs.simple_tree()
+
+        with self.assertRaises(NotImplementedError):
+            em.plan(graph)
+
+
+class TestBaseEvaluationManager(unittest.TestCase):
+    def test_managers_share_the_base(self):
+        db = MockDatabase()
+
+        self.assertIsInstance(SingleThreadEvaluationManager(db),
+                              BaseEvaluationManager)
+        self.assertIsInstance(ProcessPoolEvaluationManager(db),
+                              BaseEvaluationManager)
+
+    def test_base_requires_default_algorithm(self):
+        with self.assertRaises(TypeError):
+            BaseEvaluationManager(MockDatabase())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+import unittest
+import unittest.mock as mock
+
+import os
+import shutil
+import tempfile
+
+from neads.activation_model import SealedActivationGraph
+from neads.activation_model.plugin import PluginID
+from neads.evaluation_manager.cost_model import CostModel, measure_call
+from neads.evaluation_manager.single_thread_evaluation_manager\
+    .evaluation_manager import SingleThreadEvaluationManager
+from neads.evaluation_manager.single_thread_evaluation_manager.data_node \
+    import DataNode
+
+import tests.my_test_utilities.arithmetic_plugins as ar_plugins
+from tests.my_test_utilities.mock_database import MockDatabase
+import tests.my_test_utilities.activation_graphs_for_tests as graphs
+
+
+class TestCostModel(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = CostModel()
+        self.plugin_id = PluginID('plugin', 0)
+
+    def test_measure_call(self):
+        result, wall_time, memory_delta = measure_call(ar_plugins.pow, 10)
+
+        self.assertEqual(1024, result)
+        self.assertGreaterEqual(wall_time, 0)
+        self.assertGreaterEqual(memory_delta, 0)
+
+    def test_record_and_get_costs(self):
+        self.model.record(self.plugin_id, 1., 10, 100)
+        self.model.record(self.plugin_id, 3., 30, 300)
+
+        costs = self.model.get_costs(self.plugin_id)
+
+        self.assertEqual(2, costs.count)
+        self.assertEqual(2., costs.mean_time)
+        self.assertEqual(3., costs.max_time)
+        self.assertEqual(20, costs.mean_memory_delta)
+        self.assertEqual(300, costs.max_result_size)
+
+    def test_estimate_time_without_record(self):
+        self.assertIsNone(self.model.estimate_time(self.plugin_id))
+        self.assertEqual(5., self.model.estimate_time(self.plugin_id, 5.))
+
+    def test_estimate_node_cost(self):
+        ag = SealedActivationGraph()
+        act_1 = ag.add_activation(ar_plugins.const, 1)
+        act_2 = ag.add_activation(ar_plugins.add, act_1.symbol, 1)
+        dn_1 = DataNode(act_1, [], MockDatabase())
+        dn_2 = DataNode(act_2, [dn_1], MockDatabase())
+
+        self.assertEqual(1., self.model.estimate_node_cost(dn_1))
+
+        self.model.record(ar_plugins.const.id, 4., 0, 0)
+
+        self.assertEqual(4., self.model.estimate_node_cost(dn_1))
+        # The mean of all plugins
+        self.assertEqual(4., self.model.estimate_node_cost(dn_2))
+
+    def test_estimate_node_cost_does_not_aggregate_all_plugins(self):
+        ag = SealedActivationGraph()
+        act = ag.add_activation(ar_plugins.const, 1)
+        dn = DataNode(act, [], MockDatabase())
+        self.model.record(self.plugin_id, 4., 0, 0)
+        costs = mock.MagicMock(wraps=self.model._costs)
+        costs.get.side_effect = self.model._costs.get
+
+        with mock.patch.object(self.model, '_costs', costs):
+            self.assertEqual(4., self.model.estimate_node_cost(dn))
+
+        costs.values.assert_not_called()
+
+    def test_load_from_missing_file(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+
+        model = CostModel.load_from(os.path.join(directory, 'costs.pkl'))
+
+        self.assertNotIn(self.plugin_id, model)
+
+    def test_save_to_and_load_from_file(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'costs.pkl')
+        self.model.record(self.plugin_id, 1., 10, 100)
+        self.model.record(self.plugin_id, 3., 10, 100)
+
+        self.model.save_to(path)
+        model = CostModel.load_from(path)
+
+        self.assertEqual(2., model.estimate_time(self.plugin_id))
+        self.assertEqual(2., model.mean_time)
+        self.assertEqual(['costs.pkl'], os.listdir(directory))
+
+
+class TestCostModelInEvaluation(unittest.TestCase):
+    def test_data_node_records_costs(self):
+        ag = SealedActivationGraph()
+        act = ag.add_activation(ar_plugins.const, 5)
+        model = CostModel()
+        db = MockDatabase()
+        db.open()
+        dn = DataNode(act, [], db, model)
+
+        dn.try_load()
+        dn.evaluate()
+
+        self.assertEqual(1, model.get_costs(ar_plugins.const.id).count)
+        self.assertEqual(dn.data_size,
+                         model.get_costs(ar_plugins.const.id).max_result_size)
+
+    def setUp(self) -> None:
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, 'costs.pkl')
+
+    def test_evaluation_manager_persists_costs(self):
+        db = MockDatabase()
+        em = SingleThreadEvaluationManager(db, cost_model_path=self.path)
+        graph, _ = graphs.simple_tree()
+
+        em.evaluate(graph)
+
+        model = CostModel.load_from(self.path)
+        self.assertEqual(2, model.get_costs(ar_plugins.add.id).count
+                         + model.get_costs(ar_plugins.sub.id).count)
+
+    def test_evaluation_manager_does_not_persist_costs_by_default(self):
+        content = {}
+        db = MockDatabase(content)
+        em = SingleThreadEvaluationManager(db)
+        graph, _ = graphs.simple_tree()
+
+        with mock.patch.object(CostModel, 'save_to') as save_to:
+            em.evaluate(graph)
+
+        save_to.assert_not_called()
+        # Only the data of the graph are in the database
+        self.assertCountEqual([act.definition for act in graph], content)
+
+    def test_evaluation_manager_without_costs(self):
+        db = MockDatabase()
+        em = SingleThreadEvaluationManager(db, record_costs=False,
+                                           cost_model_path=self.path)
+        graph, _ = graphs.simple_tree()
+
+        em.evaluate(graph)
+
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+
+from neads.evaluation_manager.cost_model import CostModel
+from neads.evaluation_manager.evaluation_planner import EvaluationPlanner
+from neads.evaluation_manager.single_thread_evaluation_manager\
+    .evaluation_manager import SingleThreadEvaluationManager
+from neads.evaluation_manager.pool_evaluation_manager import \
+    ProcessPoolEvaluationManager
+
+from tests.my_test_utilities.mock_database import MockDatabase
+import tests.my_test_utilities.activation_graphs_for_tests as graphs
+
+
+class TestEvaluationPlanner(unittest.TestCase):
+    def setUp(self) -> None:
+        self.db = MockDatabase()
+        self.db.open()
+
+    def tearDown(self) -> None:
+        self.db.close()
+
+    def test_plan_with_empty_database(self):
+        graph, _ = graphs.simple_tree()
+        planner = EvaluationPlanner(self.db)
+
+        plan = planner.plan(graph)
+
+        self.assertEqual(0, len(plan.loaded))
+        self.assertCountEqual(list(graph), plan.recomputed)
+        self.assertEqual(0, len(plan.skipped))
+        self.assertTrue(plan.is_complete)
+        self.assertEqual(0., plan.hit_rate)
+        self.assertEqual(5, plan.unknown_cost_count)
+
+    def test_plan_with_data_in_database(self):
+        graph, results = graphs.simple_tree()
+        act_3, act_4, _ = results
+        act_1, act_2 = act_3.parents[0], act_4.parents[0]
+        self.db.save(30, act_2.definition)
+        planner = EvaluationPlanner(self.db)
+
+        plan = planner.plan(graph)
+
+        # Act 1 is needed only by act 3, act 2 is loaded
+        self.assertCountEqual([act_2], plan.loaded)
+        self.assertCountEqual(list(results) + [act_1], plan.recomputed)
+        self.assertEqual(0, len(plan.skipped))
+
+    def test_plan_with_results_in_database(self):
+        graph, results = graphs.simple_tree()
+        for act, result in results.items():
+            self.db.save(result, act.definition)
+        planner = EvaluationPlanner(self.db)
+
+        plan = planner.plan(graph)
+
+        self.assertCountEqual(list(results), plan.loaded)
+        self.assertEqual(0, len(plan.recomputed))
+        self.assertEqual(2, len(plan.skipped))
+        self.assertEqual(1., plan.hit_rate)
+
+    def test_plan_with_triggers(self):
+        graph, _ = graphs.trigger_on_result_with_graph_trigger()
+        planner = EvaluationPlanner(self.db)
+
+        plan = planner.plan(graph)
+
+        self.assertFalse(plan.is_complete)
+        self.assertCountEqual(list(graph), plan.recomputed)
+
+    def test_plan_predicts_costs(self):
+        graph, _ = graphs.simple_tree()
+        cost_model = CostModel()
+        for act in graph:
+            cost_model.record(act.plugin.id, 2., 100, 10)
+        planner = EvaluationPlanner(self.db, cost_model)
+
+        plan = planner.plan(graph)
+
+        self.assertEqual(10., plan.predicted_runtime)
+        self.assertEqual(5 * 10 + 100, plan.predicted_peak_memory)
+        self.assertEqual(0, plan.unknown_cost_count)
+
+
+class TestEvaluationManagerPlan(unittest.TestCase):
+    def test_plan_before_and_after_evaluation(self):
+        for em_class in [SingleThreadEvaluationManager,
+                         ProcessPoolEvaluationManager]:
+            with self.subTest(em_class=em_class):
+                em = em_class(MockDatabase())
+                graph, results = graphs.simple_diamond()
+
+                plan_before = em.plan(graph)
+                em.evaluate(graph)
+                graph, results = graphs.simple_diamond()
+                plan_after = em.plan(graph)
+
+                self.assertEqual(4, len(plan_before.recomputed))
+                self.assertEqual(list(results), plan_after.loaded)
+                self.assertEqual(0, len(plan_after.recomputed))
+                self.assertEqual(0, plan_after.unknown_cost_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
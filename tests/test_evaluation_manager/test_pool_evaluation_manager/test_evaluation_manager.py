@@ -0,0 +1,75 @@
+import unittest
+import unittest.mock as mock
+
+import psutil
+
+from neads.evaluation_manager.pool_evaluation_manager import \
+    ProcessPoolEvaluationManager, ProcessPoolAlgorithm, ThreadPoolAlgorithm
+from neads.evaluation_manager.single_thread_evaluation_manager\
+    .evaluation_algorithms import TopologicalOrderAlgorithm
+
+from tests.my_test_utilities.mock_database import MockDatabase
+import tests.my_test_utilities.activation_graphs_for_tests as graphs
+
+
+class TestProcessPoolEvaluationManager(unittest.TestCase):
+    def setUp(self) -> None:
+        self.db = MockDatabase()
+        self.em = ProcessPoolEvaluationManager(self.db, max_workers=2)
+
+    def test_evaluate_with_given_algorithm(self):
+        graph, results = graphs.trigger_on_result_with_graph_trigger()
+        alg = TopologicalOrderAlgorithm()
+
+        actual = self.em.evaluate(graph, alg)
+
+        self.assertDictEqual(results, actual)
+
+    def test_evaluate_with_default_algorithm(self):
+        graph, results = graphs.trigger_on_result_with_graph_trigger()
+
+        actual = self.em.evaluate(graph)
+
+        self.assertDictEqual(results, actual)
+
+    def test_default_algorithm_has_memory_limit(self):
+        algorithm = self.em._get_default_algorithm()
+
+        self.assertEqual(2, algorithm.max_workers)
+        self.assertEqual(psutil.virtual_memory().total / 2,
+                         algorithm._memory_limit)
+
+    def test_default_algorithm_of_process_pool(self):
+        algorithm = self.em._get_default_algorithm()
+
+        self.assertIsInstance(algorithm, ProcessPoolAlgorithm)
+
+    def test_evaluate_with_thread_pool(self):
+        em = ProcessPoolEvaluationManager(self.db, max_workers=2,
+                                          pool='thread')
+        graph, results = graphs.trigger_on_result_with_graph_trigger()
+
+        with mock.patch.object(ThreadPoolAlgorithm, 'evaluate', autospec=True,
+                               side_effect=ThreadPoolAlgorithm.evaluate) \
+                as evaluate:
+            actual = em.evaluate(graph)
+
+        evaluate.assert_called_once()
+        self.assertDictEqual(results, actual)
+
+    def test_unknown_pool(self):
+        with self.assertRaises(ValueError):
+            ProcessPoolEvaluationManager(self.db, pool='fiber')
+
+    def test_evaluate_with_data_in_database(self):
+        graph, results = graphs.simple_diamond()
+        self.em.evaluate(graph)
+        graph, results = graphs.simple_diamond()
+
+        actual = self.em.evaluate(graph)
+
+        self.assertDictEqual(results, actual)
+
+
+if __name__ == '__main__':
+    unittest.main()
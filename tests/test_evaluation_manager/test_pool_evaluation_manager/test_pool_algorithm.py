@@ -0,0 +1,86 @@
+import unittest.mock as mock
+
+from tests.test_evaluation_manager.test_single_thread_evaluation_manager \
+    .test_evaluation_algorithms.test_evaluation_algorithm import \
+    BaseTestClassWrapper
+from neads.evaluation_manager.pool_evaluation_manager import \
+    ProcessPoolAlgorithm, ThreadPoolAlgorithm
+from neads.evaluation_manager.single_thread_evaluation_manager \
+    .evaluation_algorithms import CriticalPathScheduler
+from neads.activation_model import SealedActivationGraph
+from neads.activation_model.plugin import Plugin, PluginID
+
+import tests.my_test_utilities.arithmetic_plugins as ar_plugins
+import tests.my_test_utilities.activation_graphs_for_tests as graphs
+
+
+class TestProcessPoolAlgorithm(BaseTestClassWrapper
+                               .BaseTestEvaluationAlgorithm):
+
+    def get_algorithm(self):
+        return ProcessPoolAlgorithm(max_workers=2)
+
+    def test_plugin_which_cannot_be_pickled(self):
+        ag = SealedActivationGraph()
+        act_1 = ag.add_activation(ar_plugins.const, 10)
+        make_list = Plugin(PluginID('make_list', 0), lambda x: [x])
+        act_2 = ag.add_activation(make_list, act_1.symbol)
+        act_3 = ag.add_activation(ar_plugins.mul, act_2.symbol, 2)
+
+        self.assertGraphResultsEqual({act_3: [10, 10]}, ag)
+
+
+class TestThreadPoolAlgorithm(BaseTestClassWrapper
+                              .BaseTestEvaluationAlgorithm):
+
+    def get_algorithm(self):
+        return ThreadPoolAlgorithm(max_workers=2)
+
+    def test_graph_is_analyzed_once_per_version(self):
+        graph, results = graphs.trigger_on_result_with_graph_trigger()
+        es = self.get_evaluation_state(graph)
+
+        with mock.patch.object(CriticalPathScheduler, 'analyze',
+                               autospec=True,
+                               side_effect=CriticalPathScheduler.analyze) \
+                as analyze, \
+                mock.patch.object(CriticalPathScheduler, 'update',
+                                  autospec=True,
+                                  side_effect=CriticalPathScheduler.update) \
+                as update:
+            actual = self.algorithm.evaluate(es)
+
+        self.assertDictEqual(results, actual)
+        self.assertEqual(1, analyze.call_count)
+        self.assertLessEqual(update.call_count, es.graph_version + 1)
+
+    def test_graph_is_searched_once_per_version(self):
+        graph, results = graphs.trigger_on_result_with_graph_trigger()
+        es = self.get_evaluation_state(graph)
+
+        with mock.patch.object(ThreadPoolAlgorithm, '_search_ready_nodes',
+                               autospec=True,
+                               side_effect=ThreadPoolAlgorithm
+                               ._search_ready_nodes) as search:
+            actual = self.algorithm.evaluate(es)
+
+        self.assertDictEqual(results, actual)
+        self.assertLessEqual(search.call_count, es.graph_version + 1)
+
+    def test_children_of_processed_node_become_ready(self):
+        ag = SealedActivationGraph()
+        act_1 = ag.add_activation(ar_plugins.const, 1)
+        act_2 = ag.add_activation(ar_plugins.add, act_1.symbol, 1)
+        act_3 = ag.add_activation(ar_plugins.add, act_1.symbol, act_2.symbol)
+        act_4 = ag.add_activation(ar_plugins.mul, act_3.symbol, 10)
+
+        self.assertGraphResultsEqual({act_4: 30}, ag)
+
+
+class TestThreadPoolAlgorithmWithSwapping(BaseTestClassWrapper
+                                          .BaseTestEvaluationAlgorithm):
+
+    def get_algorithm(self):
+        # Every node is above the limit, thus all the nodes are swapped
+        return ThreadPoolAlgorithm(max_workers=2, memory_limit=0,
+                                   proportion_to_store=1)
@@ -1,6 +1,7 @@
 import unittest
 import unittest.mock as mock
 
+import numpy as np
 import pympler.asizeof
 from parameterized import parameterized
 
@@ -205,6 +206,76 @@ class TestDataNodeAccessData(unittest.TestCase):
         self.assertEqual(expected, actual)
 
 
+class TestDataNodeReadOnlyArguments(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.received = []
+
+        def receive(array):
+            self.received.append(array)
+            return 0
+
+        ag = SealedActivationGraph()
+        self.act_1 = ag.add_activation(make_array, 10)
+        self.act_2 = ag.add_activation(
+            Plugin(PluginID('receive', 0), receive), self.act_1.symbol
+        )
+        self.act_3 = ag.add_activation(
+            Plugin(PluginID('receive_read_only', 0), receive,
+                   read_only_arguments=True),
+            self.act_1.symbol
+        )
+
+        self.db = MockDatabase()
+        self.db.open()
+        self.dn_1 = DataNode(self.act_1, [], self.db)
+        self.dn_1.try_load()
+        self.dn_1.evaluate()
+
+    def tearDown(self) -> None:
+        self.db.close()
+
+    def test_arguments_are_copied(self):
+        dn_2 = DataNode(self.act_2, [self.dn_1], self.db)
+        dn_2.try_load()
+
+        dn_2.evaluate()
+
+        array = self.received[0]
+        parent_array = self.dn_1.get_data(copy=False)
+        self.assertTrue(array.flags.writeable)
+        self.assertFalse(np.shares_memory(array, parent_array))
+
+    def test_read_only_arguments_are_shared(self):
+        dn_3 = DataNode(self.act_3, [self.dn_1], self.db)
+        dn_3.try_load()
+
+        dn_3.evaluate()
+
+        array = self.received[0]
+        parent_array = self.dn_1.get_data(copy=False)
+        self.assertFalse(array.flags.writeable)
+        self.assertTrue(np.shares_memory(array, parent_array))
+
+    def test_read_only_arguments_without_copy(self):
+        dn_3 = DataNode(self.act_3, [self.dn_1], self.db)
+        dn_3.try_load()
+
+        arguments = dn_3.get_actual_arguments(copy=False)
+
+        self.assertIs(self.dn_1.get_data(copy=False), arguments.args[0])
+
+    def test_get_read_only_data(self):
+        array = self.dn_1.get_read_only_data()
+
+        self.assertFalse(array.flags.writeable)
+        self.assertTrue(np.shares_memory(array,
+                                         self.dn_1.get_data(copy=False)))
+
+
+make_array = Plugin(PluginID('make_array', 0), lambda n: np.arange(n))
+
+
 class TestDataNodeInGraph(unittest.TestCase):
 
     @staticmethod
@@ -338,6 +409,97 @@ class TestDataNodeInGraph(unittest.TestCase):
             child.evaluate
         )
 
+    def test_get_actual_arguments_and_set_evaluated_data(self):
+        parent = self.dns[0]
+        child = self.dns[1]
+        parent.try_load()
+        parent.evaluate()
+        child.try_load()
+
+        arguments = child.get_actual_arguments()
+        child.set_evaluated_data(
+            child.activation.plugin(*arguments.args, **arguments.kwargs)
+        )
+
+        self.assertEqual(DataNodeState.MEMORY, child.state)
+        self.assertEqual(25, child.get_data())
+        self.assertEqual(25, self.db.load(child.activation.definition))
+
+    def test_pending_children_count(self):
+        for dn in self.dns[:3]:
+            dn.try_load()
+            dn.evaluate()
+
+        self.assertEqual(0, self.dns[0].pending_children_count)
+        self.assertEqual(1, self.dns[1].pending_children_count)
+        self.assertEqual(1, self.dns[2].pending_children_count)
+        self.assertEqual(0, self.dns[3].pending_children_count)
+
+    def test_release_and_load_from_database(self):
+        parent = self.dns[0]
+        child = self.dns[1]
+        parent.try_load()
+        parent.evaluate()
+
+        parent.release()
+        self.assertEqual(DataNodeState.DISK, parent.state)
+        self.assertIsNone(parent.get_data())
+
+        parent.load()
+        child.try_load()
+        child.evaluate()
+
+        self.assertEqual(5, parent.get_data())
+        self.assertEqual(25, child.get_data())
+
+    def test_store_and_load_with_spill_to_database(self):
+        dn = DataNode(self.acts[0], [], self.db, spill_to_database=True)
+        dn.try_load()
+        dn.evaluate()
+
+        with mock.patch.object(DataNode, '_OBJECT_TEMP_FILE_PROVIDER') \
+                as temp_file_mock:
+            dn.store()
+            dn.load()
+
+        temp_file_mock.assert_not_called()
+        self.assertEqual(5, dn.get_data())
+
+    def test_release_with_not_memory(self):
+        self.assertRaises(
+            DataNodeStateException,
+            self.dns[0].release
+        )
+
+    def test_read_stored_data_and_set_reloaded_data(self):
+        dn = self.dns[0]
+        dn.try_load()
+        dn.evaluate()
+        dn.store()
+
+        data = dn.read_stored_data()
+        self.assertEqual(DataNodeState.DISK, dn.state)
+        dn.set_reloaded_data(data)
+
+        self.assertEqual(DataNodeState.MEMORY, dn.state)
+        self.assertEqual(5, dn.get_data())
+
+    def test_read_stored_data_with_unknown(self):
+        self.db.save(5, self.acts[0].definition)
+
+        data = self.dns[0].read_stored_data()
+
+        self.assertEqual(DataNodeState.UNKNOWN, self.dns[0].state)
+        self.assertEqual(5, data)
+
+    def test_read_stored_data_with_no_data(self):
+        self.dns[0].try_load()
+
+        self.assertRaises(
+            DataNodeStateException,
+            self.dns[0].read_stored_data
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -230,6 +230,19 @@ class TestActivationEligibilityDetector(unittest.TestCase):
         expected = False
         self.assertEqual(expected, actual)
 
+    def test_shared_descendant_is_visited_once(self):
+        ag = SealedActivationGraph()
+        act_1 = ag.add_activation(ar_plugins.const, 10)
+        act_1.trigger_on_descendants = mock.Mock()
+        act_2 = ag.add_activation(ar_plugins.add, act_1.symbol, 1)
+        act_3 = ag.add_activation(ar_plugins.add, act_1.symbol, 2)
+        act_4 = ag.add_activation(ar_plugins.sub, act_2.symbol, act_3.symbol)
+        act_4.trigger_on_result = mock.Mock()
+
+        aed = ActivationEligibilityDetector(act_1)
+
+        self.assertEqual([act_4], aed._get_descendants_with_trigger())
+
 
 class TestEligibilityDetector(unittest.TestCase):
     def test_eligible_and_tracked_activations_simple(self):
@@ -474,5 +487,129 @@ class TestEligibilityDetector(unittest.TestCase):
         self.assertCountEqual(expected_tracked, actual_tracked)
 
 
+    def test_update_in_diamond(self):
+        ag = SealedActivationGraph()
+        act_1 = ag.add_activation(ar_plugins.const, 10)
+        act_1.trigger_on_descendants = mock.Mock()
+        act_2 = ag.add_activation(ar_plugins.add, act_1.symbol, 1)
+        act_3 = ag.add_activation(ar_plugins.add, act_1.symbol, 2)
+        act_4 = ag.add_activation(ar_plugins.sub, act_2.symbol, act_3.symbol)
+        act_4.trigger_on_result = mock.Mock(return_value=[])
+
+        ed = EligibilityDetector(ag)
+        self.assertEqual((), ed.eligible_activations)
+
+        # The blocker reachable by two paths is counted once
+        tm = act_4.trigger_on_result
+        del act_4.trigger_on_result
+        ed.update(act_4, tm(5))
+
+        self.assertEqual((act_1,), ed.eligible_activations)
+
+    def test_eligible_activations_in_tracking_order(self):
+        ag = SealedActivationGraph()
+        act_1 = ag.add_activation(ar_plugins.const, 10)
+        act_1.trigger_on_descendants = mock.Mock()
+        act_2 = ag.add_activation(ar_plugins.add, act_1.symbol, 1)
+        act_2.trigger_on_result = mock.Mock(return_value=[])
+        act_3 = ag.add_activation(ar_plugins.const, 20)
+        act_3.trigger_on_descendants = mock.Mock()
+
+        ed = EligibilityDetector(ag)
+        self.assertEqual((act_3,), ed.eligible_activations)
+
+        # The act_1 becomes eligible after act_3, but it was tracked first
+        tm = act_2.trigger_on_result
+        del act_2.trigger_on_result
+        ed.update(act_2, tm(11))
+
+        self.assertEqual((act_1, act_3), ed.eligible_activations)
+
+    def test_update_new_activations_with_triggers_in_chain(self):
+        ag = SealedActivationGraph()
+        act_1 = ag.add_activation(ar_plugins.const, 10)
+        act_1.trigger_on_descendants = mock.Mock()
+
+        def ag_trigger():
+            act_2 = ag.add_activation(ar_plugins.add, act_1.symbol, 1)
+            act_2.trigger_on_descendants = mock.Mock()
+            act_3 = ag.add_activation(ar_plugins.add, act_2.symbol, 2)
+            act_3.trigger_on_result = mock.Mock()
+            return [act_2, act_3]
+
+        ag.trigger_method = ag_trigger
+        ed = EligibilityDetector(ag)
+
+        tm = ag.trigger_method
+        del ag.trigger_method
+        act_2, act_3 = tm()
+        ed.update(ag, [act_2, act_3])
+
+        self.assertEqual((), ed.eligible_activations)
+        self.assertEqual(2, ed._blocker_counts[act_1])
+        self.assertEqual(1, ed._blocker_counts[act_2])
+
+        # After act_3's trigger, act_2 is eligible, act_1 is still blocked
+        del act_3.trigger_on_result
+        ed.update(act_3, [])
+
+        self.assertEqual((act_2,), ed.eligible_activations)
+
+    def test_eligible_activations_in_order_of_tracking(self):
+        ag = SealedActivationGraph()
+        acts = [ag.add_activation(ar_plugins.const, i) for i in range(5)]
+        for act in reversed(acts):
+            act.trigger_on_descendants = mock.Mock()
+
+        ed = EligibilityDetector(ag)
+
+        self.assertEqual(ed.tracked_activations, ed.eligible_activations)
+
+    def test_update_many_equals_successive_updates(self):
+        def get_graph():
+            ag = SealedActivationGraph()
+            act_1 = ag.add_activation(ar_plugins.const, 10)
+            act_2 = ag.add_activation(ar_plugins.const, 20)
+            act_1.trigger_on_descendants = mock.Mock()
+            act_2.trigger_on_descendants = mock.Mock()
+            return ag, act_1, act_2
+
+        def invoke(ag, act):
+            del act.trigger_on_descendants
+            new_act = ag.add_activation(ar_plugins.add, act.symbol, 1)
+            new_act.trigger_on_descendants = mock.Mock()
+            return [new_act]
+
+        ag, act_1, act_2 = get_graph()
+        ed = EligibilityDetector(ag)
+        for act in [act_1, act_2]:
+            ed.update(act, invoke(ag, act))
+        expected = [act.definition for act in ed.eligible_activations]
+
+        ag, act_1, act_2 = get_graph()
+        ed = EligibilityDetector(ag)
+        new_acts = invoke(ag, act_1) + invoke(ag, act_2)
+        ed.update_many([act_1, act_2], new_acts)
+
+        self.assertEqual(new_acts, list(ed.eligible_activations))
+        self.assertEqual(expected,
+                         [act.definition for act in ed.eligible_activations])
+        self.assertCountEqual(new_acts, ed.tracked_activations)
+
+    def test_get_blocked_activations(self):
+        ag = SealedActivationGraph()
+        act_1 = ag.add_activation(ar_plugins.const, 10)
+        act_2 = ag.add_activation(ar_plugins.const, 20)
+        act_3 = ag.add_activation(ar_plugins.add, act_1.symbol, 1)
+        act_4 = ag.add_activation(ar_plugins.add, act_2.symbol, 2)
+        act_4.trigger_on_result = mock.Mock()
+
+        blocked = EligibilityDetector.get_blocked_activations(
+            [act_1, act_2], [act_3, act_4]
+        )
+
+        self.assertEqual({act_2}, blocked)
+
+
 if __name__ == '__main__':
     unittest.main()
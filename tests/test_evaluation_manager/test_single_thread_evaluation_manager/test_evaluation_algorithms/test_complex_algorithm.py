@@ -1,8 +1,24 @@
+import unittest.mock as mock
+
 from tests.test_evaluation_manager.test_single_thread_evaluation_manager \
     .test_evaluation_algorithms.test_evaluation_algorithm import \
     BaseTestClassWrapper
 from neads.evaluation_manager.single_thread_evaluation_manager \
-    .evaluation_algorithms import ComplexAlgorithm
+    .evaluation_algorithms import ComplexAlgorithm, ResidentMemoryAccountant, \
+    LRUEvictionPolicy, SizeWeightedEvictionPolicy, FutureUseEvictionPolicy, \
+    RecomputeCostEvictionPolicy, Prefetcher, CriticalPathScheduler
+from neads.evaluation_manager.single_thread_evaluation_manager \
+    .evaluation_state import EvaluationState
+
+from neads.evaluation_manager.single_thread_evaluation_manager.data_node \
+    import DataNodeState
+from neads.activation_model import SealedActivationGraph
+
+from tests.my_test_utilities.mock_database import MockDatabase
+from tests.my_test_utilities.algorithms_for_tests import \
+    get_swapping_algorithm
+import tests.my_test_utilities.activation_graphs_for_tests as graphs
+import tests.my_test_utilities.arithmetic_plugins as ar_plugins
 
 
 class TestComplexAlgorithmWithoutSwapping(BaseTestClassWrapper.
@@ -11,5 +27,130 @@ class TestComplexAlgorithmWithoutSwapping(BaseTestClassWrapper.
     def get_algorithm(self):
         return ComplexAlgorithm()
 
+    def test_graph_is_analyzed_once_per_version(self):
+        graph, results = graphs.trigger_on_result_with_graph_trigger()
+        es = self.get_evaluation_state(graph)
+
+        with mock.patch.object(CriticalPathScheduler, 'analyze',
+                               autospec=True,
+                               side_effect=CriticalPathScheduler.analyze) \
+                as analyze, \
+                mock.patch.object(CriticalPathScheduler, 'update',
+                                  autospec=True,
+                                  side_effect=CriticalPathScheduler.update) \
+                as update:
+            actual = self.algorithm.evaluate(es)
+
+        self.assertDictEqual(results, actual)
+        self.assertEqual(1, analyze.call_count)
+        self.assertLessEqual(update.call_count, es.graph_version + 1)
+
+
+class TestComplexAlgorithmWithDataSizeAccountant(BaseTestClassWrapper.
+                                                 BaseTestEvaluationAlgorithm):
+
+    def get_algorithm(self):
+        return get_swapping_algorithm()
+
+
+class TestComplexAlgorithmWithResidentMemoryAccountant(
+        BaseTestClassWrapper.BaseTestEvaluationAlgorithm):
+
+    def get_algorithm(self):
+        return ComplexAlgorithm(memory_limit=0, proportion_to_store=1,
+                                memory_accountant=ResidentMemoryAccountant())
+
+
+def _get_evicting_algorithm(eviction_policy):
+    return get_swapping_algorithm(proportion_to_store=0.5,
+                                  eviction_policy=eviction_policy)
+
+
+class TestComplexAlgorithmWithLRUEviction(BaseTestClassWrapper.
+                                          BaseTestEvaluationAlgorithm):
+
+    def get_algorithm(self):
+        return _get_evicting_algorithm(LRUEvictionPolicy())
+
+
+class TestComplexAlgorithmWithSizeWeightedEviction(
+        BaseTestClassWrapper.BaseTestEvaluationAlgorithm):
+
+    def get_algorithm(self):
+        return _get_evicting_algorithm(SizeWeightedEvictionPolicy())
+
+
+class TestComplexAlgorithmWithFutureUseEviction(
+        BaseTestClassWrapper.BaseTestEvaluationAlgorithm):
+
+    def get_algorithm(self):
+        return _get_evicting_algorithm(FutureUseEvictionPolicy())
+
+
+class TestComplexAlgorithmWithRecomputeCostEviction(
+        BaseTestClassWrapper.BaseTestEvaluationAlgorithm):
+
+    def get_algorithm(self):
+        return _get_evicting_algorithm(RecomputeCostEvictionPolicy())
+
+
+class TestComplexAlgorithmWithPrefetcher(BaseTestClassWrapper.
+                                         BaseTestEvaluationAlgorithm):
+
+    def get_algorithm(self):
+        return ComplexAlgorithm(prefetcher=Prefetcher())
+
+    def test_next_node_is_prefetched_while_plugin_runs(self):
+        ag = SealedActivationGraph()
+        act_x = ag.add_activation(ar_plugins.const, 1)
+        act_a = ag.add_activation(ar_plugins.add, act_x.symbol, 1)
+        act_b = ag.add_activation(ar_plugins.const, 2)
+        act_d = ag.add_activation(ar_plugins.mul, act_b.symbol, 2)
+        act_c = ag.add_activation(ar_plugins.add, act_a.symbol, act_d.symbol)
+        db = MockDatabase()
+        db.open()
+        db.save(2, act_b.definition)
+        es = EvaluationState(ag, db)
+        node_x, node_b = (next(node for node in es if node.activation is act)
+                          for act in [act_x, act_b])
+
+        # Whether the node 1 was evaluated, when the node 2 was prefetched
+        x_states = []
+
+        def prefetch(prefetcher, nodes):
+            nodes = list(nodes)
+            if node_b in nodes:
+                x_states.append(node_x.state)
+            return original_prefetch(prefetcher, nodes)
+
+        original_prefetch = Prefetcher.prefetch
+        with mock.patch.object(Prefetcher, 'prefetch', autospec=True,
+                               side_effect=prefetch):
+            actual = self.algorithm.evaluate(es)
+
+        self.assertDictEqual({act_c: 6}, actual)
+        self.assertIn(DataNodeState.NO_DATA, x_states)
+
+
+class TestComplexAlgorithmWithPrefetcherAndSwapping(
+        BaseTestClassWrapper.BaseTestEvaluationAlgorithm):
+
+    def get_algorithm(self):
+        return get_swapping_algorithm(proportion_to_store=0.5,
+                                      prefetcher=Prefetcher())
+
+
+class TestComplexAlgorithmWithBatchedTriggers(
+        BaseTestClassWrapper.BaseTestEvaluationAlgorithm):
+
+    def get_algorithm(self):
+        return ComplexAlgorithm()
+
+    @staticmethod
+    def get_evaluation_state(activation_graph):
+        db = MockDatabase()
+        db.open()
+        return EvaluationState(activation_graph, db, batch_triggers=True)
+
 
 # TODO: Add more test with use of DB etc.
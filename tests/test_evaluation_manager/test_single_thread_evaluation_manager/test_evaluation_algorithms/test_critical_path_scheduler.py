@@ -0,0 +1,187 @@
+import unittest
+
+from neads.activation_model import SealedActivationGraph
+from neads.evaluation_manager.single_thread_evaluation_manager.data_node \
+    import DataNode
+from neads.evaluation_manager.single_thread_evaluation_manager \
+    .evaluation_algorithms import CriticalPathScheduler
+
+import tests.my_test_utilities.arithmetic_plugins as ar_plugins
+from tests.my_test_utilities.mock_database import MockDatabase
+
+
+class TestCriticalPathScheduler(unittest.TestCase):
+    r"""Test on a graph with a long and a short branch.
+
+        1
+       / \
+      2   5
+      |
+      3
+      |
+      4
+    """
+
+    def setUp(self) -> None:
+        ag = SealedActivationGraph()
+        act_1 = ag.add_activation(ar_plugins.const, 1)
+        act_2 = ag.add_activation(ar_plugins.add, act_1.symbol, 2)
+        act_3 = ag.add_activation(ar_plugins.add, act_2.symbol, 3)
+        act_4 = ag.add_activation(ar_plugins.add, act_3.symbol, 4)
+        act_5 = ag.add_activation(ar_plugins.add, act_1.symbol, 5)
+
+        self.db = MockDatabase()
+        self.db.open()
+        self.dns = []
+        act_to_dn = {}
+        for act in [act_1, act_2, act_3, act_4, act_5]:
+            dn = DataNode(act, [act_to_dn[p] for p in act.parents], self.db)
+            act_to_dn[act] = dn
+            self.dns.append(dn)
+
+    def tearDown(self) -> None:
+        self.db.close()
+
+    def test_path_to_targets(self):
+        scheduler = CriticalPathScheduler()
+        dn_1, dn_2, dn_3, dn_4, dn_5 = self.dns
+
+        scheduler.analyze([dn_5, dn_4])
+
+        self.assertEqual(4, scheduler.get_path_to(dn_4))
+        self.assertEqual(2, scheduler.get_path_to(dn_5))
+        self.assertEqual([dn_4, dn_5],
+                         scheduler.order_by_path_to([dn_5, dn_4]))
+
+    def test_path_from_nodes(self):
+        scheduler = CriticalPathScheduler()
+        dn_1, dn_2, dn_3, dn_4, dn_5 = self.dns
+
+        scheduler.analyze([dn_5, dn_4])
+
+        self.assertEqual(4, scheduler.get_path_from(dn_1))
+        self.assertEqual(1, scheduler.get_path_from(dn_5))
+        self.assertEqual([dn_2, dn_5],
+                         scheduler.order_by_path_from([dn_5, dn_2]))
+
+    def test_cost_estimator(self):
+        dn_1, dn_2, dn_3, dn_4, dn_5 = self.dns
+        costs = {dn_5: 10}
+        scheduler = CriticalPathScheduler(lambda n: costs.get(n, 1))
+
+        scheduler.analyze([dn_4, dn_5])
+
+        self.assertEqual([dn_5, dn_4],
+                         scheduler.order_by_path_to([dn_4, dn_5]))
+
+    def test_processed_nodes_are_skipped(self):
+        scheduler = CriticalPathScheduler()
+        dn_1, dn_2, dn_3, dn_4, dn_5 = self.dns
+        for dn in [dn_1, dn_2]:
+            dn.try_load()
+            dn.evaluate()
+
+        scheduler.analyze([dn_4, dn_5])
+
+        self.assertEqual(2, scheduler.get_path_to(dn_4))
+        self.assertEqual(0, scheduler.get_path_to(dn_2))
+        self.assertEqual(0, scheduler.get_path_from(dn_1))
+
+    def assertRanksEqual(self, expected, actual):  # noqa
+        for dn in self.dns:
+            self.assertEqual(expected.get_path_to(dn), actual.get_path_to(dn))
+            self.assertEqual(expected.get_path_from(dn),
+                             actual.get_path_from(dn))
+
+    def test_mark_processed_shortens_path_to_descendants(self):
+        scheduler = CriticalPathScheduler()
+        dn_1, dn_2, dn_3, dn_4, dn_5 = self.dns
+        scheduler.analyze([dn_5, dn_4])
+
+        dn_1.try_load()
+        dn_1.evaluate()
+        scheduler.mark_processed(dn_1)
+
+        self.assertEqual(3, scheduler.get_path_to(dn_4))
+        self.assertEqual(1, scheduler.get_path_to(dn_5))
+        fresh_scheduler = CriticalPathScheduler()
+        fresh_scheduler.analyze([dn_5, dn_4])
+        self.assertRanksEqual(fresh_scheduler, scheduler)
+
+    def test_mark_processed_removes_unneeded_ancestors(self):
+        scheduler = CriticalPathScheduler()
+        dn_1, dn_2, dn_3, dn_4, dn_5 = self.dns
+        scheduler.analyze([dn_5, dn_4])
+
+        self.db.save(6, dn_3.activation.definition)
+        dn_3.try_load()
+        scheduler.mark_processed(dn_3)
+
+        # The node 2 is not needed anymore
+        self.assertEqual(0, scheduler.get_path_from(dn_2))
+        self.assertEqual(2, scheduler.get_path_from(dn_1))
+        self.assertEqual(1, scheduler.get_path_to(dn_4))
+        fresh_scheduler = CriticalPathScheduler()
+        fresh_scheduler.analyze([dn_5, dn_4])
+        self.assertRanksEqual(fresh_scheduler, scheduler)
+
+    def test_mark_processed_of_not_analyzed_node(self):
+        scheduler = CriticalPathScheduler()
+        dn_1, dn_2, dn_3, dn_4, dn_5 = self.dns
+        scheduler.analyze([dn_5])
+
+        scheduler.mark_processed(dn_4)
+
+        self.assertEqual(2, scheduler.get_path_to(dn_5))
+
+    def test_update_ranks_new_nodes(self):
+        scheduler = CriticalPathScheduler()
+        dn_1, dn_2, dn_3, dn_4, dn_5 = self.dns
+        scheduler.analyze([dn_5, dn_3])
+
+        scheduler.update([dn_5, dn_4])
+
+        self.assertEqual(4, scheduler.get_path_to(dn_4))
+        self.assertEqual(4, scheduler.get_path_from(dn_1))
+        fresh_scheduler = CriticalPathScheduler()
+        fresh_scheduler.analyze([dn_5, dn_4])
+        self.assertRanksEqual(fresh_scheduler, scheduler)
+
+    def test_update_estimates_only_new_nodes(self):
+        estimated = []
+        scheduler = CriticalPathScheduler(lambda n: estimated.append(n) or 1)
+        dn_1, dn_2, dn_3, dn_4, dn_5 = self.dns
+        scheduler.analyze([dn_3])
+        estimated.clear()
+
+        scheduler.update([dn_5, dn_4])
+
+        self.assertCountEqual([dn_4, dn_5], estimated)
+
+    def test_update_removes_former_targets(self):
+        scheduler = CriticalPathScheduler()
+        dn_1, dn_2, dn_3, dn_4, dn_5 = self.dns
+        scheduler.analyze([dn_5, dn_4])
+
+        scheduler.update([dn_3])
+
+        self.assertEqual(0, scheduler.get_path_to(dn_5))
+        self.assertEqual(0, scheduler.get_path_to(dn_4))
+        self.assertEqual(3, scheduler.get_path_from(dn_1))
+        fresh_scheduler = CriticalPathScheduler()
+        fresh_scheduler.analyze([dn_3])
+        self.assertRanksEqual(fresh_scheduler, scheduler)
+
+    def test_select_by_path_to(self):
+        scheduler = CriticalPathScheduler()
+        dn_1, dn_2, dn_3, dn_4, dn_5 = self.dns
+
+        scheduler.analyze([dn_5, dn_4])
+
+        self.assertIs(dn_4, scheduler.select_by_path_to([dn_5, dn_4]))
+        self.assertIs(dn_2, scheduler.select_by_path_to([dn_2, dn_5]))
+        self.assertIsNone(scheduler.select_by_path_to([]))
+
+
+if __name__ == '__main__':
+    unittest.main()
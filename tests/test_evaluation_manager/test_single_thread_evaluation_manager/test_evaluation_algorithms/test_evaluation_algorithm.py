@@ -5,6 +5,8 @@ import unittest
 from typing import TYPE_CHECKING, Callable, Any
 import abc
 
+from neads.activation_model import SealedActivationGraph
+from neads.activation_model.plugin import Plugin, PluginID
 from neads.evaluation_manager.single_thread_evaluation_manager\
     .evaluation_state import EvaluationState
 
@@ -74,3 +76,16 @@ class BaseTestClassWrapper:
         def test_trigger_on_result_with_graph_trigger(self):
             self.do_test_graph_generator(
                 graphs.trigger_on_result_with_graph_trigger)
+
+        def test_results_are_not_copied(self):
+            graph = SealedActivationGraph()
+            act = graph.add_activation(make_list, 3)
+            es = self.get_evaluation_state(graph)
+
+            results = self.algorithm.evaluate(es)
+
+            result_node = next(iter(es.results))
+            self.assertIs(result_node.get_data(copy=False), results[act])
+
+
+make_list = Plugin(PluginID('make_list', 0), lambda n: list(range(n)))
@@ -0,0 +1,122 @@
+import unittest
+import unittest.mock as mock
+
+from neads.activation_model import SealedActivationGraph
+from neads.evaluation_manager.cost_model import CostModel
+from neads.evaluation_manager.single_thread_evaluation_manager \
+    .evaluation_state import EvaluationState
+from neads.evaluation_manager.single_thread_evaluation_manager \
+    .evaluation_algorithms.eviction_policy import DFSEvictionPolicy, \
+    LRUEvictionPolicy, SizeWeightedEvictionPolicy, FutureUseEvictionPolicy, \
+    RecomputeCostEvictionPolicy
+
+import tests.my_test_utilities.arithmetic_plugins as ar_plugins
+from tests.my_test_utilities.mock_database import MockDatabase
+
+
+class TestEvictionPolicies(unittest.TestCase):
+    r"""Tests on the graph with evaluated nodes 1, 2 and 3.
+
+          1
+         / \
+       2-   -3
+      /
+    4-
+    """
+
+    def setUp(self) -> None:
+        ag = SealedActivationGraph()
+        act_1 = ag.add_activation(ar_plugins.const, 10)
+        act_2 = ag.add_activation(ar_plugins.add, act_1.symbol, 20)
+        # The list of factors is the largest data
+        act_3 = ag.add_activation(ar_plugins.factor, act_1.symbol)
+        act_4 = ag.add_activation(ar_plugins.mul, act_2.symbol, 2)
+
+        self.db = MockDatabase()
+        self.db.open()
+        self.cost_model = CostModel()
+        self.es = EvaluationState(ag, self.db, self.cost_model)
+        self.node_1 = self._get_node(ag, act_1)
+        self.node_2 = self._get_node(ag, act_2)
+        self.node_3 = self._get_node(ag, act_3)
+        self.node_4 = self._get_node(ag, act_4)
+        for node in [self.node_1, self.node_2, self.node_3]:
+            self._evaluate_with_parents(node)
+        self.candidates = [self.node_1, self.node_2, self.node_3]
+
+    def tearDown(self) -> None:
+        self.db.close()
+
+    def _get_node(self, ag, act):
+        return next(node for node in self.es if node.activation is act)
+
+    @staticmethod
+    def _evaluate_with_parents(node):
+        for parent in node.parents:
+            TestEvictionPolicies._evaluate_with_parents(parent)
+        if node.state.name == 'UNKNOWN' and not node.try_load():
+            node.evaluate()
+
+    def test_dfs_policy(self):
+        policy = DFSEvictionPolicy()
+        policy.start(self.es)
+        policy.record_processing([self.node_1, self.node_2], [self.node_2])
+        policy.record_processing([self.node_3], [self.node_3])
+
+        actual = policy.get_eviction_order(self.candidates)
+
+        self.assertEqual([self.node_1, self.node_2, self.node_3], actual)
+
+    def test_lru_policy(self):
+        policy = LRUEvictionPolicy()
+        policy.start(self.es)
+        policy.record_use([self.node_3, self.node_1, self.node_2])
+
+        actual = policy.get_eviction_order(self.candidates)
+
+        self.assertEqual([self.node_3, self.node_1, self.node_2], actual)
+
+    def test_size_weighted_policy(self):
+        policy = SizeWeightedEvictionPolicy()
+        policy.start(self.es)
+        policy.record_use([self.node_2, self.node_1])
+
+        actual = policy.get_eviction_order(self.candidates)
+
+        self.assertEqual([self.node_3, self.node_2, self.node_1], actual)
+
+    def test_future_use_policy(self):
+        policy = FutureUseEvictionPolicy()
+        policy.start(self.es)
+
+        actual = policy.get_eviction_order(self.candidates)
+
+        # Node 1 is not needed anymore, node 3 is a result, node 2 has
+        # an unprocessed child
+        self.assertEqual([self.node_1, self.node_3, self.node_2], actual)
+
+    def test_future_use_policy_with_necessary_nodes(self):
+        policy = FutureUseEvictionPolicy()
+        policy.start(self.es)
+        policy.record_processing([self.node_1, self.node_2],
+                                 [self.node_1, self.node_2])
+
+        actual = policy.get_eviction_order(self.candidates)
+
+        self.assertEqual([self.node_3, self.node_1, self.node_2], actual)
+
+    def test_recompute_cost_policy(self):
+        policy = RecomputeCostEvictionPolicy()
+        policy.start(self.es)
+
+        # The measured run times would make the test depend on timing
+        with mock.patch.object(self.cost_model, 'estimate_node_cost',
+                               return_value=1.):
+            actual = policy.get_eviction_order(self.candidates)
+
+        # All plugins have equal costs, the largest data go first
+        self.assertEqual(self.node_3, actual[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+import unittest.mock as mock
+
+from neads.activation_model import SealedActivationGraph
+from neads.evaluation_manager.single_thread_evaluation_manager \
+    .evaluation_state import EvaluationState
+from neads.evaluation_manager.single_thread_evaluation_manager \
+    .evaluation_algorithms.memory_accountant import VirtualMemoryAccountant, \
+    DataSizeAccountant, ResidentMemoryAccountant
+
+import tests.my_test_utilities.arithmetic_plugins as ar_plugins
+from tests.my_test_utilities.mock_database import MockDatabase
+
+
+class TestMemoryAccountants(unittest.TestCase):
+    def setUp(self) -> None:
+        ag = SealedActivationGraph()
+        ag.add_activation(ar_plugins.const, 10)
+        self.db = MockDatabase()
+        self.db.open()
+        self.es = EvaluationState(ag, self.db)
+        self.node = next(iter(self.es))
+
+    def tearDown(self) -> None:
+        self.db.close()
+
+    def test_virtual_memory_accountant(self):
+        accountant = VirtualMemoryAccountant()
+        accountant.start(self.es)
+
+        self.assertGreater(accountant.used_memory, 0)
+        self.assertEqual(100, accountant.get_memory_limit(100))
+        accountant.stop()
+
+    def test_data_size_accountant_with_baseline(self):
+        accountant = DataSizeAccountant(1000)
+        accountant.start(self.es)
+        self.assertEqual(1000, accountant.used_memory)
+
+        self.node.try_load()
+        self.node.evaluate()
+
+        self.assertEqual(1000 + self.node.data_size, accountant.used_memory)
+        accountant.stop()
+
+    def test_data_size_accountant_after_release(self):
+        accountant = DataSizeAccountant(1000)
+        accountant.start(self.es)
+        self.node.try_load()
+        self.node.evaluate()
+
+        self.node.store()
+        self.assertEqual(1000, accountant.used_memory)
+        self.node.load()
+        self.assertEqual(1000 + self.node.data_size, accountant.used_memory)
+        accountant.stop()
+
+    def test_data_size_accountant_does_not_visit_nodes(self):
+        accountant = DataSizeAccountant(1000)
+        accountant.start(self.es)
+        self.node.try_load()
+        self.node.evaluate()
+
+        with mock.patch.object(EvaluationState, 'memory_nodes',
+                               new_callable=mock.PropertyMock) as memory_nodes:
+            used_memory = accountant.used_memory
+
+        memory_nodes.assert_not_called()
+        self.assertEqual(1000 + self.node.data_size, used_memory)
+        accountant.stop()
+
+    def test_data_size_accountant_calibration(self):
+        self.node.try_load()
+        self.node.evaluate()
+        accountant = DataSizeAccountant()
+
+        accountant.start(self.es)
+
+        self.assertEqual(accountant.baseline + self.node.data_size,
+                         accountant.used_memory)
+        accountant.stop()
+
+    def test_resident_memory_accountant(self):
+        accountant = ResidentMemoryAccountant(interval=0.001)
+        accountant.start(self.es)
+
+        self.assertGreater(accountant.used_memory, 0)
+        accountant.stop()
+
+    def test_resident_memory_accountant_with_cgroup_limit(self):
+        mock_path = 'neads.evaluation_manager' \
+                    '.single_thread_evaluation_manager' \
+                    '.evaluation_algorithms.memory_accountant.memory_info'
+        with mock.patch(mock_path) as memory_info_mock:
+            memory_info_mock.get_cgroup_memory_limit.return_value = 1000
+            memory_info_mock.get_cgroup_memory_usage.return_value = 500
+            accountant = ResidentMemoryAccountant(limit_proportion=0.5)
+            accountant.start(self.es)
+
+            self.assertEqual(500, accountant.used_memory)
+            self.assertEqual(500, accountant.get_memory_limit(800))
+            self.assertEqual(200, accountant.get_memory_limit(200))
+            accountant.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
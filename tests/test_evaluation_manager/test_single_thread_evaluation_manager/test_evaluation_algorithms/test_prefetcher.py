@@ -0,0 +1,187 @@
+import threading
+import unittest
+import unittest.mock as mock
+
+from neads.activation_model import SealedActivationGraph
+from neads.evaluation_manager.single_thread_evaluation_manager \
+    .evaluation_state import EvaluationState
+from neads.evaluation_manager.single_thread_evaluation_manager.data_node \
+    import DataNodeState
+from neads.evaluation_manager.single_thread_evaluation_manager \
+    .evaluation_algorithms.prefetcher import Prefetcher
+from neads.evaluation_manager.single_thread_evaluation_manager \
+    .evaluation_algorithms.memory_accountant import DataSizeAccountant
+
+import tests.my_test_utilities.arithmetic_plugins as ar_plugins
+from tests.my_test_utilities.mock_database import MockDatabase
+
+
+class TestPrefetcher(unittest.TestCase):
+    r"""Tests on the graph with nodes 1 and 2.
+
+    1
+    |
+    2
+    """
+
+    def setUp(self) -> None:
+        ag = SealedActivationGraph()
+        self.act_1 = ag.add_activation(ar_plugins.const, 10)
+        self.act_2 = ag.add_activation(ar_plugins.add, self.act_1.symbol, 20)
+
+        self.db = MockDatabase()
+        self.db.open()
+        self.es = EvaluationState(ag, self.db)
+        self.node_1 = self._get_node(self.act_1)
+        self.node_2 = self._get_node(self.act_2)
+        self.prefetcher = Prefetcher()
+
+    def tearDown(self) -> None:
+        self.prefetcher.stop()
+        self.db.close()
+
+    def _get_node(self, act):
+        return next(node for node in self.es if node.activation is act)
+
+    def test_prefetch_disk_node(self):
+        self.node_1.try_load()
+        self.node_1.evaluate()
+        self.node_1.store()
+        self.prefetcher.start(self.es)
+
+        self.prefetcher.prefetch([self.node_1])
+        taken = self.prefetcher.take(self.node_1)
+
+        self.assertTrue(taken)
+        self.assertIs(DataNodeState.MEMORY, self.node_1.state)
+        self.assertEqual(10, self.node_1.get_data())
+
+    def test_prefetch_node_in_database(self):
+        self.db.save(10, self.act_1.definition)
+        self.prefetcher.start(self.es)
+
+        self.prefetcher.prefetch([self.node_1])
+        taken = self.prefetcher.take(self.node_1)
+
+        self.assertTrue(taken)
+        self.assertIs(DataNodeState.MEMORY, self.node_1.state)
+        self.assertEqual(10, self.node_1.get_data())
+
+    def test_prefetch_node_not_in_database(self):
+        self.prefetcher.start(self.es)
+
+        self.prefetcher.prefetch([self.node_1])
+        taken = self.prefetcher.take(self.node_1)
+
+        self.assertTrue(taken)
+        self.assertIs(DataNodeState.NO_DATA, self.node_1.state)
+
+    def test_take_without_prefetch(self):
+        self.prefetcher.start(self.es)
+
+        taken = self.prefetcher.take(self.node_1)
+
+        self.assertFalse(taken)
+        self.assertIs(DataNodeState.UNKNOWN, self.node_1.state)
+
+    def test_take_after_change_of_state(self):
+        self.prefetcher.start(self.es)
+        self.prefetcher.prefetch([self.node_1])
+        self.node_1.try_load()
+
+        taken = self.prefetcher.take(self.node_1)
+
+        self.assertFalse(taken)
+        self.assertIs(DataNodeState.NO_DATA, self.node_1.state)
+
+    def test_prefetch_respects_free_memory(self):
+        self.node_1.try_load()
+        self.node_1.evaluate()
+        self.node_1.store()
+        self.prefetcher.start(self.es, lambda: 0)
+
+        self.prefetcher.prefetch([self.node_1])
+        taken = self.prefetcher.take(self.node_1)
+
+        self.assertFalse(taken)
+        self.assertIs(DataNodeState.DISK, self.node_1.state)
+
+    def test_prefetch_skips_processed_node(self):
+        self.node_1.try_load()
+        self.node_1.evaluate()
+        self.prefetcher.start(self.es)
+
+        self.prefetcher.prefetch([self.node_1])
+
+        self.assertEqual(0, self.prefetcher.prefetched_size)
+        self.assertFalse(self.prefetcher.take(self.node_1))
+
+    def test_discard(self):
+        self.node_1.try_load()
+        self.node_1.evaluate()
+        self.node_1.store()
+        self.prefetcher.start(self.es)
+        self.prefetcher.prefetch([self.node_1])
+
+        self.prefetcher.discard()
+
+        self.assertEqual(0, self.prefetcher.prefetched_size)
+        self.assertFalse(self.prefetcher.take(self.node_1))
+
+    def test_discard_waits_for_running_read(self):
+        self.node_1.try_load()
+        self.node_1.evaluate()
+        self.node_1.store()
+        self.prefetcher.start(self.es)
+        started = threading.Event()
+        finished = threading.Event()
+        original_read = self.node_1.read_stored_data
+
+        def read_stored_data():
+            started.set()
+            finished.wait(0.2)
+            data = original_read()
+            finished.set()
+            return data
+
+        with mock.patch.object(self.node_1, 'read_stored_data',
+                               side_effect=read_stored_data):
+            self.prefetcher.prefetch([self.node_1])
+            started.wait()
+            self.prefetcher.discard()
+
+        self.assertTrue(finished.is_set())
+
+    def test_prefetched_data_are_accounted(self):
+        self.node_1.try_load()
+        self.node_1.evaluate()
+        self.node_1.store()
+        size = self.node_1.data_size
+        accountant = DataSizeAccountant(baseline=0)
+        accountant.start(self.es)
+        self.prefetcher.start(self.es, memory_accountant=accountant)
+
+        self.prefetcher.prefetch([self.node_1])
+        held_size = accountant.used_memory
+        self.prefetcher.take(self.node_1)
+
+        self.assertEqual(size, held_size)
+        # The data are accounted as the data of the node
+        self.assertEqual(size, accountant.used_memory)
+
+    def test_discarded_data_are_not_accounted(self):
+        self.node_1.try_load()
+        self.node_1.evaluate()
+        self.node_1.store()
+        accountant = DataSizeAccountant(baseline=0)
+        accountant.start(self.es)
+        self.prefetcher.start(self.es, memory_accountant=accountant)
+        self.prefetcher.prefetch([self.node_1])
+
+        self.prefetcher.discard()
+
+        self.assertEqual(0, accountant.used_memory)
+
+
+if __name__ == '__main__':
+    unittest.main()
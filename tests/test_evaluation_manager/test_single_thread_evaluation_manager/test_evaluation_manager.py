@@ -1,13 +1,28 @@
 import unittest
+import unittest.mock as mock
 
+import numpy as np
 
+from neads.activation_model import SealedActivationGraph
+from neads.activation_model.plugin import Plugin, PluginID
 from neads.evaluation_manager.single_thread_evaluation_manager\
     .evaluation_manager import SingleThreadEvaluationManager
 from neads.evaluation_manager.single_thread_evaluation_manager\
     .evaluation_algorithms import TopologicalOrderAlgorithm
+from neads.evaluation_manager.single_thread_evaluation_manager.data_node \
+    import DataNode
+from neads._internal_utils.background_writer import BackgroundWriter
+from neads._internal_utils.spill_arena import SpillArena
+from neads._internal_utils.serializers import MemoryMapSerializer
 
 from tests.my_test_utilities.mock_database import MockDatabase
+from tests.my_test_utilities.algorithms_for_tests import \
+    get_swapping_algorithm
 import tests.my_test_utilities.activation_graphs_for_tests as graphs
+import tests.my_test_utilities.arithmetic_plugins as ar_plugins
+
+
+make_array = Plugin(PluginID('make_array', 0), lambda n: np.arange(n))
 
 
 # TODO: Write true unit tests
@@ -32,6 +47,92 @@ class TestEvaluationManager(unittest.TestCase):
 
         self.assertDictEqual(results, actual)
 
+    def evaluate_with_swapping(self, em, graph):
+        """Evaluate the graph by an algorithm which is forced to swap.
+
+        Returns
+        -------
+            The results of the evaluation and the nodes which were stored.
+        """
+
+        with mock.patch.object(DataNode, 'store', autospec=True,
+                               side_effect=DataNode.store) as store:
+            actual = em.evaluate(graph, get_swapping_algorithm())
+
+        stored_nodes = [call.args[0] for call in store.call_args_list]
+        self.assertTrue(stored_nodes)
+        return actual, stored_nodes
+
+    def test_evaluate_with_spill_to_database(self):
+        em = SingleThreadEvaluationManager(self.db, spill_to_database=True)
+        graph, results = graphs.trigger_on_result_with_graph_trigger()
+
+        actual, stored_nodes = self.evaluate_with_swapping(em, graph)
+
+        self.assertDictEqual(results, actual)
+        with self.db:
+            for node in stored_nodes:
+                self.assertIsNone(node._temp_file)
+                self.assertTrue(self.db.contains(node.activation.definition))
+
+    def test_evaluate_with_write_behind(self):
+        em = SingleThreadEvaluationManager(self.db, write_behind=True)
+        graph, results = graphs.trigger_on_result_with_graph_trigger()
+
+        with mock.patch.object(BackgroundWriter, 'flush', autospec=True,
+                               side_effect=BackgroundWriter.flush) as flush:
+            actual, stored_nodes = self.evaluate_with_swapping(em, graph)
+
+        self.assertDictEqual(results, actual)
+        flush.assert_called()
+        writer = flush.call_args.args[0]
+        self.assertTrue(writer.is_closed)
+        self.assertEqual(0, writer.in_flight_bytes)
+
+    def test_evaluate_with_memory_map_spill_serializer(self):
+        em = SingleThreadEvaluationManager(
+            self.db, write_behind=True, spill_serializer=MemoryMapSerializer()
+        )
+        ag = SealedActivationGraph()
+        act_1 = ag.add_activation(make_array, 1000)
+        act_2 = ag.add_activation(ar_plugins.add, act_1.symbol, 1)
+        act_3 = ag.add_activation(ar_plugins.mul, act_1.symbol, 2)
+        loaded_data = []
+        original_load = MemoryMapSerializer.load
+
+        def load(serializer, filename):
+            data = original_load(serializer, filename)
+            loaded_data.append(data)
+            return data
+
+        with mock.patch.object(MemoryMapSerializer, 'load', autospec=True,
+                               side_effect=load):
+            actual, _ = self.evaluate_with_swapping(em, ag)
+
+        np.testing.assert_array_equal(np.arange(1000) + 1, actual[act_2])
+        np.testing.assert_array_equal(np.arange(1000) * 2, actual[act_3])
+        # The array was loaded as a view of the mapped file
+        self.assertTrue(loaded_data)
+        for data in loaded_data:
+            self.assertFalse(data.flags.owndata)
+            self.assertFalse(data.flags.writeable)
+
+    def test_evaluate_with_spill_arena(self):
+        em = SingleThreadEvaluationManager(self.db, write_behind=True,
+                                           spill_arena=True)
+        graph, results = graphs.trigger_on_result_with_graph_trigger()
+
+        with mock.patch.object(SpillArena, '_create_arena_file',
+                               autospec=True,
+                               side_effect=SpillArena._create_arena_file) \
+                as create_arena_file:
+            actual, stored_nodes = self.evaluate_with_swapping(em, graph)
+
+        self.assertDictEqual(results, actual)
+        create_arena_file.assert_called_once()
+        arenas = {node._temp_file._arena for node in stored_nodes}
+        self.assertEqual(1, len(arenas))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,9 +3,14 @@ import unittest.mock as mock
 
 from typing import Any
 
+import numpy as np
+
 from neads.activation_model import SealedActivationGraph
+from neads.activation_model.plugin import Plugin, PluginID
 from neads.evaluation_manager.single_thread_evaluation_manager \
     .evaluation_state import EvaluationState
+from neads.evaluation_manager.single_thread_evaluation_manager.data_node \
+    import DataNodeState
 
 import tests.my_test_utilities.arithmetic_plugins as ar_plugins
 from tests.my_test_utilities.mock_database import MockDatabase
@@ -17,6 +22,10 @@ def get_empty_trigger_mock():
     trigger_mock.return_value = []
     return trigger_mock
 
+
+make_array = Plugin(PluginID('make_array', 0), lambda n: np.arange(n))
+
+
 class TestEvaluationStateMemoryMethods(unittest.TestCase):
     def setUp(self):
         mock_path = 'neads.evaluation_manager' \
@@ -165,6 +174,176 @@ class TestEvaluationStateSimpleStateChangesNoTriggers(unittest.TestCase):
         self.expected_state.memory_nodes = [self.dn]
         assertEvaluationShapeIs(self.expected_state, self.es)
 
+    def test_check_presence_with_data(self):
+        self.db.save(10, self.act.definition)
+
+        present_nodes = self.es.check_presence()
+
+        self.assertEqual([self.dn], present_nodes)
+        self.expected_state.unknown_nodes = [self.dn]
+        assertEvaluationShapeIs(self.expected_state, self.es)
+
+    def test_check_presence_without_data(self):
+        present_nodes = self.es.check_presence()
+
+        self.assertEqual([], present_nodes)
+        self.expected_state.no_data_nodes = [self.dn]
+        assertEvaluationShapeIs(self.expected_state, self.es)
+
+    def test_check_presence_checks_each_node_once(self):
+        self.db.save(10, self.act.definition)
+        self.es.check_presence()
+
+        with mock.patch.object(self.db, 'contains_many') as contains_many:
+            present_nodes = self.es.check_presence()
+
+        contains_many.assert_not_called()
+        self.assertEqual([self.dn], present_nodes)
+
+    def test_check_presence_after_load(self):
+        self.db.save(10, self.act.definition)
+        self.es.check_presence()
+        self.dn.try_load()
+
+        present_nodes = self.es.check_presence()
+
+        self.assertEqual([], present_nodes)
+
+    def test_try_load_many_with_data(self):
+        self.db.save(10, self.act.definition)
+
+        loaded_nodes = self.es.try_load_many([self.dn])
+
+        self.assertEqual([self.dn], loaded_nodes)
+        self.assertEqual(10, self.dn.get_data())
+        self.expected_state.memory_nodes = [self.dn]
+        assertEvaluationShapeIs(self.expected_state, self.es)
+
+    def test_try_load_many_without_data(self):
+        loaded_nodes = self.es.try_load_many([self.dn])
+
+        self.assertEqual([], loaded_nodes)
+        self.expected_state.no_data_nodes = [self.dn]
+        assertEvaluationShapeIs(self.expected_state, self.es)
+
+
+class TestEvaluationStateNodeCounts(unittest.TestCase):
+    def setUp(self) -> None:
+        self.ag = SealedActivationGraph()
+        self.acts = [self.ag.add_activation(ar_plugins.const, i)
+                     for i in range(4)]
+
+        self.db = MockDatabase()
+        self.db.open()
+
+    def test_counts_follow_state_changes(self):
+        es = EvaluationState(self.ag, self.db)
+        dn_1, dn_2, dn_3, _ = es.top_level
+        dn_1.try_load()
+        dn_1.evaluate()
+        dn_2.try_load()
+        dn_2.evaluate()
+        dn_2.store()
+        dn_3.try_load()
+
+        self.assertEqual(4, len(es))
+        self.assertEqual(4, es.get_node_count())
+        self.assertEqual(1, es.get_node_count(DataNodeState.MEMORY))
+        self.assertEqual(1, es.get_node_count(DataNodeState.DISK))
+        self.assertEqual(2, es.get_node_count(DataNodeState.UNKNOWN,
+                                              DataNodeState.NO_DATA))
+
+    def test_nodes_are_in_order_of_arrival_to_state(self):
+        es = EvaluationState(self.ag, self.db)
+        nodes = list(es.top_level)
+        for dn in reversed(nodes):
+            dn.try_load()
+
+        self.assertEqual(nodes[::-1], list(es.no_data_nodes))
+
+    def test_objectives_keep_order_after_removal(self):
+        for act in self.acts:
+            act.trigger_on_result = get_empty_trigger_mock()
+        es = EvaluationState(self.ag, self.db)
+        nodes = list(es.top_level)
+
+        nodes[1].try_load()
+        nodes[1].evaluate()
+
+        self.assertEqual([nodes[0], nodes[2], nodes[3]], list(es.objectives))
+
+
+    def test_top_unknown_node_follows_state_changes(self):
+        child = self.ag.add_activation(ar_plugins.add, self.acts[0].symbol, 1)
+        es = EvaluationState(self.ag, self.db)
+        nodes = list(es.top_level)
+        child_node = next(dn for dn in es if dn.activation is child)
+
+        self.assertIs(nodes[0], es.get_top_unknown_node())
+        for dn in nodes:
+            dn.try_load()
+            dn.evaluate()
+        self.assertIs(child_node, es.get_top_unknown_node())
+        child_node.try_load()
+        self.assertIsNone(es.get_top_unknown_node())
+
+    def test_top_unknown_node_of_new_level(self):
+        self.acts[0].trigger_on_result = lambda data: [
+            self.ag.add_activation(ar_plugins.add, self.acts[0].symbol, 1)
+        ]
+        es = EvaluationState(self.ag, self.db)
+        nodes = list(es.top_level)
+        nodes[0].try_load()
+        nodes[0].evaluate()
+        new_node = next(dn for dn in es if dn.level == 1)
+
+        for dn in nodes[1:]:
+            self.assertIs(dn, es.get_top_unknown_node())
+            dn.try_load()
+            dn.evaluate()
+        self.assertIs(new_node, es.get_top_unknown_node())
+
+
+class TestEvaluationStateReleaseDeadParents(unittest.TestCase):
+    def setUp(self) -> None:
+        ag = SealedActivationGraph()
+        self.act_1 = ag.add_activation(ar_plugins.const, 10)
+        self.act_2 = ag.add_activation(ar_plugins.add, self.act_1.symbol, 1)
+        self.act_3 = ag.add_activation(ar_plugins.add, self.act_1.symbol, 2)
+
+        self.db = MockDatabase()
+        self.db.open()
+        self.es = EvaluationState(ag, self.db)
+        self.dns = {node.activation: node for node in self.es}
+
+    def tearDown(self) -> None:
+        self.db.close()
+
+    def _evaluate(self, act):
+        node = self.dns[act]
+        node.try_load()
+        node.evaluate()
+        return node
+
+    def test_parent_with_pending_child_is_not_released(self):
+        self._evaluate(self.act_1)
+        node_2 = self._evaluate(self.act_2)
+
+        released = self.es.release_dead_parents(node_2)
+
+        self.assertEqual([], released)
+        self.assertIn(self.dns[self.act_1], self.es.memory_nodes)
+
+    def test_parent_without_pending_child_is_released(self):
+        self._evaluate(self.act_1)
+        self._evaluate(self.act_2)
+        node_3 = self._evaluate(self.act_3)
+
+        released = self.es.release_dead_parents(node_3)
+
+        self.assertEqual([self.dns[self.act_1]], released)
+        self.assertIn(self.dns[self.act_1], self.es.disk_nodes)
+
 
 class TestEvaluationStateWithTriggersSimple(unittest.TestCase):
     """Tests cases with single node an a trigger called as soon as possible."""
@@ -217,6 +396,20 @@ class TestEvaluationStateWithTriggersSimple(unittest.TestCase):
         act_trigger.assert_called_once_with(10)  # Trigger was called
         self.assertIsNone(self.act.trigger_on_result)  # It is removed now
 
+    def test_trigger_on_result_gets_read_only_data(self):
+        act = self.ag.add_activation(make_array, 10)
+        act_trigger = get_empty_trigger_mock()
+        act.trigger_on_result = act_trigger
+        es = EvaluationState(self.ag, self.db)
+        dn = next(node for node in es if node.activation is act)
+
+        dn.try_load()
+        dn.evaluate()
+
+        data = act_trigger.call_args.args[0]
+        self.assertFalse(data.flags.writeable)
+        self.assertTrue(np.shares_memory(data, dn.get_data(copy=False)))
+
     def test_node_with_trigger_on_descendants(self):
         act_trigger = get_empty_trigger_mock()
         self.act.trigger_on_descendants = act_trigger
@@ -449,5 +642,85 @@ class TestEvaluationStateWithTriggersComplex(unittest.TestCase):
         self.assertIsNone(act_1.trigger_on_descendants)
 
 
+class TestEvaluationStateBatchedTriggers(unittest.TestCase):
+    def setUp(self) -> None:
+        self.ag = SealedActivationGraph()
+        self.db = MockDatabase()
+        self.db.open()
+        self.calls = []
+
+    def get_trigger(self, act, *, child_trigger=None, other_parent=None):
+        """Return trigger which records its call and creates act's child."""
+
+        def trigger():
+            self.calls.append(act)
+            if other_parent is None:
+                child = self.ag.add_activation(ar_plugins.add, act.symbol, 1)
+            else:
+                child = self.ag.add_activation(ar_plugins.add, act.symbol,
+                                               other_parent.symbol)
+            if child_trigger is not None:
+                setattr(child, child_trigger, get_empty_trigger_mock())
+            return [child]
+
+        return trigger
+
+    def test_all_eligible_triggers_are_invoked_at_once(self):
+        acts = [self.ag.add_activation(ar_plugins.const, i) for i in range(5)]
+        for act in acts:
+            act.trigger_on_descendants = self.get_trigger(act)
+
+        with mock.patch.object(EvaluationState, '_incorporate_activations',
+                               autospec=True,
+                               side_effect=EvaluationState
+                               ._incorporate_activations) as incorporate:
+            es = EvaluationState(self.ag, self.db, batch_triggers=True)
+
+        # Once for the graph, once for the batch
+        self.assertEqual(2, incorporate.call_count)
+        self.assertEqual(acts, self.calls)
+        self.assertEqual(10, len(list(es)))
+        self.assertEqual(5, len(list(es.results)))
+
+    def test_triggers_of_new_activations_are_invoked_in_next_batch(self):
+        acts = [self.ag.add_activation(ar_plugins.const, i) for i in range(3)]
+        for act in acts:
+            act.trigger_on_descendants = self.get_trigger(
+                act, child_trigger='trigger_on_descendants'
+            )
+
+        es = EvaluationState(self.ag, self.db, batch_triggers=True)
+
+        self.assertEqual(acts, self.calls)
+        # The children's triggers are invoked in the next batch
+        for dn in es.results:
+            self.assertIsNone(dn.activation.trigger_on_descendants)
+        self.assertEqual(3, len(list(es.results)))
+
+    def test_blocked_trigger_is_skipped(self):
+        act_1 = self.ag.add_activation(ar_plugins.const, 10)
+        act_2 = self.ag.add_activation(ar_plugins.const, 20)
+        # The new Activation with trigger-on-result is a descendant of both
+        act_1.trigger_on_descendants = self.get_trigger(
+            act_1, child_trigger='trigger_on_result', other_parent=act_2
+        )
+        act_2.trigger_on_descendants = self.get_trigger(act_2)
+
+        es = EvaluationState(self.ag, self.db, batch_triggers=True)
+
+        self.assertEqual([act_1], self.calls)
+        self.assertIsNotNone(act_2.trigger_on_descendants)
+
+        # After the result, the act_2's trigger is eligible again
+        dn_3 = next(iter(es.objectives))
+        for dn in [*dn_3.parents, dn_3]:
+            dn.try_load()
+            dn.evaluate()
+
+        self.assertEqual([act_1, act_2], self.calls)
+        self.assertIsNone(act_2.trigger_on_descendants)
+        self.assertEqual(2, len(list(es.results)))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,104 @@
+import threading
+import unittest
+
+from neads._internal_utils.background_writer import BackgroundWriter
+
+
+class TestBackgroundWriter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.writer = BackgroundWriter(max_pending=2)
+        self.written = []
+
+    def tearDown(self) -> None:
+        try:
+            self.writer.close()
+        except Exception:
+            pass
+
+    def test_writes_in_order(self):
+        for i in range(10):
+            self.writer.submit(i, lambda i=i: self.written.append(i))
+
+        self.writer.flush()
+
+        self.assertEqual(list(range(10)), self.written)
+
+    def test_wait_for_key(self):
+        self.writer.submit('key', lambda: self.written.append('data'))
+
+        self.writer.wait('key')
+
+        self.assertEqual(['data'], self.written)
+
+    def test_wait_for_unknown_key(self):
+        # Expects to just return immediately
+        self.writer.wait('key')
+
+    def test_done_write_is_forgotten(self):
+        self.writer.submit('key', lambda: self.written.append('data'))
+        self.writer.submit('other_key', lambda: None)
+
+        # The writes are done in order
+        self.writer.wait('other_key')
+
+        self.assertNotIn('key', self.writer._pending)
+
+    def test_failed_write_is_kept_until_raised(self):
+        def fail():
+            raise ValueError()
+
+        self.writer.submit('key', fail)
+        self.writer.submit('other_key', lambda: None)
+        self.writer.wait('other_key')
+
+        self.assertRaises(ValueError, self.writer.wait, 'key')
+        self.assertNotIn('key', self.writer._pending)
+
+    def test_in_flight_bytes(self):
+        release = threading.Event()
+        self.writer.submit('key', release.wait, 100)
+
+        in_flight_before = self.writer.in_flight_bytes
+        release.set()
+        self.writer.wait('key')
+
+        self.assertEqual(100, in_flight_before)
+        self.assertEqual(0, self.writer.in_flight_bytes)
+
+    def test_wait_raises_error_of_write(self):
+        def fail():
+            raise ValueError()
+
+        self.writer.submit('key', fail)
+
+        self.assertRaises(ValueError, self.writer.wait, 'key')
+
+    def test_flush_raises_error_of_write(self):
+        def fail():
+            raise ValueError()
+
+        self.writer.submit('key', fail)
+
+        self.assertRaises(ValueError, self.writer.flush)
+
+    def test_close_flushes(self):
+        self.writer.submit('key', lambda: self.written.append('data'))
+
+        self.writer.close()
+
+        self.assertEqual(['data'], self.written)
+        self.assertTrue(self.writer.is_closed)
+
+    def test_submit_after_close(self):
+        self.writer.close()
+
+        self.assertRaises(
+            RuntimeError,
+            self.writer.submit,
+            'key',
+            lambda: None
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,4 @@
-# Intentionally left blank
-
+# The functions returning the memory usage of the process are not tested.
 # The results of the code are so nondeterministic that is would be very hard
 # to test it properly.
 # The code is so simple, however, that the tests are not necessary.
@@ -8,3 +7,118 @@
 
 # Of course, should the code change, an edit of this message and maybe an
 # addition of the tests is required.
+
+# The sizing of objects is tested below.
+
+import unittest
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pympler.asizeof
+
+import neads._internal_utils.memory_info as memory_info
+
+
+class TestGetObjectSize(unittest.TestCase):
+    def assertSizeClose(self, expected, actual, tolerance=0.25):
+        self.assertLessEqual(abs(expected - actual), expected * tolerance)
+
+    def test_atomic_object(self):
+        for obj in [5, 2**100, 1.5, 'abc', b'abc', True, None]:
+            with self.subTest(obj=obj):
+                expected = pympler.asizeof.asizeof(obj)
+
+                actual = memory_info.get_object_size(obj)
+
+                self.assertEqual(expected, actual)
+
+    def test_small_container(self):
+        obj = [1, (2, 'three'), {'four': [5.]}, {6}]
+        expected = pympler.asizeof.asizeof(obj)
+
+        actual = memory_info.get_object_size(obj)
+
+        self.assertEqual(expected, actual)
+
+    def test_large_list(self):
+        obj = [str(i) * 3 for i in range(10_000)]
+        expected = pympler.asizeof.asizeof(obj)
+
+        actual = memory_info.get_object_size(obj)
+
+        self.assertSizeClose(expected, actual)
+
+    def test_large_set(self):
+        obj = {str(i) for i in range(10_000)}
+        expected = pympler.asizeof.asizeof(obj)
+
+        actual = memory_info.get_object_size(obj)
+
+        self.assertSizeClose(expected, actual)
+
+    def test_ndarray(self):
+        obj = np.zeros(10_000)
+
+        actual = memory_info.get_object_size(obj)
+
+        self.assertSizeClose(obj.nbytes, actual)
+
+    def test_ndarray_view(self):
+        obj = np.zeros(10_000)[::2]
+
+        actual = memory_info.get_object_size(obj)
+
+        self.assertSizeClose(obj.nbytes, actual)
+
+    def test_data_frame(self):
+        obj = pd.DataFrame({'a': range(10_000),
+                            'b': [str(i) for i in range(10_000)]})
+        expected = obj.memory_usage(index=True, deep=True).sum()
+
+        actual = memory_info.get_object_size(obj)
+
+        self.assertSizeClose(expected, actual)
+
+    def test_graph(self):
+        obj = nx.gnm_random_graph(1_000, 5_000, seed=0)
+        expected = pympler.asizeof.asizeof(obj)
+
+        actual = memory_info.get_object_size(obj)
+
+        # Shared objects (e.g. edge attributes) are counted repeatedly
+        self.assertGreaterEqual(actual, expected)
+        self.assertLessEqual(actual, 3 * expected)
+
+    def test_multiple_objects(self):
+        objs = [5, 'abc', [1, 2]]
+        expected = sum(pympler.asizeof.asizeof(obj) for obj in objs)
+
+        actual = memory_info.get_object_size(*objs)
+
+        self.assertEqual(expected, actual)
+
+    def test_register_sizer(self):
+        class Sized:
+            pass
+
+        class SizedSubclass(Sized):
+            pass
+
+        memory_info.register_sizer(Sized, lambda obj: 42)
+
+        self.assertEqual(42, memory_info.get_object_size(Sized()))
+        self.assertEqual(42, memory_info.get_object_size(SizedSubclass()))
+
+    def test_register_sizer_by_name(self):
+        class Sized:
+            pass
+
+        name = f'{Sized.__module__}.{Sized.__qualname__}'
+        memory_info.register_sizer(name, lambda obj: 42)
+
+        self.assertEqual(42, memory_info.get_object_size(Sized()))
+
+
+if __name__ == '__main__':
+    unittest.main()
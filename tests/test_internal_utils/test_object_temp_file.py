@@ -4,6 +4,7 @@ import os
 
 
 from neads._internal_utils.object_temp_file import ObjectTempFile
+from neads._internal_utils.background_writer import BackgroundWriter
 
 
 class TestObjectTempFileWithGivenName(unittest.TestCase):
@@ -86,6 +87,33 @@ class TestObjectTempFileWithGivenName(unittest.TestCase):
         self.assertTrue(self.file.is_disposed)
 
 
+class TestObjectTempFileWithWriter(TestObjectTempFileWithGivenName):
+    def setUp(self) -> None:
+        self.path = __file__ + '_tmp_file'
+        self.writer = BackgroundWriter()
+        self.file = ObjectTempFile(path=self.path, writer=self.writer)
+        self.object = [1, '10', {}]
+
+    def tearDown(self) -> None:
+        self.writer.close()
+        super().tearDown()
+
+    def test_save_load_large_object(self):
+        large_object = list(range(100_000))
+        self.file.save(large_object, 1_000_000)
+
+        actual = self.file.load()
+
+        self.assertEqual(large_object, actual)
+        self.assertEqual(0, self.writer.in_flight_bytes)
+
+    def test_dispose_after_save(self):
+        self.file.save(list(range(100_000)))
+        self.file.dispose()
+
+        self.assertFalse(os.path.exists(self.path))
+
+
 class TestObjectTempFileOther(unittest.TestCase):
     def test_creation_with_given_generator(self):
         gen = lambda: __file__ + '_generated_tmp_file'
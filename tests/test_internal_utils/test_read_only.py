@@ -0,0 +1,97 @@
+import unittest
+import unittest.mock as mock
+import types
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+import neads._internal_utils.read_only as read_only
+
+
+class TestGetReadOnlyView(unittest.TestCase):
+    def test_immutable_object(self):
+        for obj in [5, 1.5, 'abc', b'abc', None, frozenset({1})]:
+            with self.subTest(obj=obj):
+                actual = read_only.get_read_only_view(obj)
+
+                self.assertIs(obj, actual)
+
+    def test_mutable_object_is_copied(self):
+        obj = [1, [2]]
+
+        actual = read_only.get_read_only_view(obj)
+
+        self.assertEqual(obj, actual)
+        self.assertIsNot(obj, actual)
+        self.assertIsNot(obj[1], actual[1])
+
+    def test_tuple(self):
+        array = np.arange(10)
+        obj = (1, array)
+
+        actual = read_only.get_read_only_view(obj)
+
+        self.assertEqual(1, actual[0])
+        self.assertTrue(np.shares_memory(array, actual[1]))
+        self.assertFalse(actual[1].flags.writeable)
+
+    def test_ndarray(self):
+        obj = np.arange(10)
+
+        actual = read_only.get_read_only_view(obj)
+
+        self.assertTrue(np.shares_memory(obj, actual))
+        self.assertRaises(ValueError, actual.__setitem__, 0, 1)
+        self.assertTrue(obj.flags.writeable)
+
+    def test_ndarray_of_objects_is_copied(self):
+        obj = np.array([[1], [2]], dtype=object)
+
+        actual = read_only.get_read_only_view(obj)
+
+        self.assertIsNot(obj[0], actual[0])
+
+    def test_data_frame(self):
+        obj = pd.DataFrame({'a': range(10)})
+
+        actual = read_only.get_read_only_view(obj)
+        actual.loc[0, 'a'] = 100
+
+        self.assertEqual(0, obj.loc[0, 'a'])
+        self.assertEqual(100, actual.loc[0, 'a'])
+
+    def test_data_frame_without_copy_on_write(self):
+        obj = pd.DataFrame({'a': range(10)})
+        # The pandas older than 1.5 do not have the copy_on_write option
+        old_options = types.SimpleNamespace(mode=types.SimpleNamespace())
+
+        with mock.patch.object(pd, '__version__', '1.3.0'), \
+                mock.patch.object(pd, 'options', old_options):
+            actual = read_only.get_read_only_view(obj)
+
+        self.assertFalse(np.shares_memory(obj['a'].to_numpy(),
+                                          actual['a'].to_numpy()))
+        self.assertTrue(obj.equals(actual))
+
+    def test_graph(self):
+        obj = nx.path_graph(5)
+
+        actual = read_only.get_read_only_view(obj)
+
+        self.assertEqual(set(obj.edges), set(actual.edges))
+        self.assertRaises(nx.NetworkXError, actual.add_edge, 0, 4)
+        self.assertFalse(nx.is_frozen(obj))
+
+    def test_register_viewer(self):
+        class Viewed:
+            pass
+
+        view = object()
+        read_only.register_read_only_viewer(Viewed, lambda obj: view)
+
+        self.assertIs(view, read_only.get_read_only_view(Viewed()))
+
+
+if __name__ == '__main__':
+    unittest.main()
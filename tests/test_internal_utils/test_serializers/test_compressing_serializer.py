@@ -0,0 +1,93 @@
+import os
+
+from tests.test_internal_utils.test_serializers.test_serializer \
+    import BaseTestClassWrapper
+from neads._internal_utils.serializers.compressing_serializer import \
+    CompressingSerializer
+
+
+class TestCompressingSerializer(BaseTestClassWrapper.BaseTestSerializer):
+    """Tests serializer which compresses pickles."""
+
+    def get_serializer(self):
+        return CompressingSerializer()
+
+    def setUp(self):
+        super().setUp()
+        self.compressible_data = ['abc' * 10 + str(i) for i in range(1000)]
+        self.incompressible_data = os.urandom(100_000)
+
+    def tearDown(self) -> None:
+        if os.path.exists(self.filename):
+            super().tearDown()
+
+    def test_compressible_data_are_compressed(self):
+        self.serializer.save(self.compressible_data, self.filename)
+        actual = self.serializer.load(self.filename)
+
+        self.assertEqual(self.compressible_data, actual)
+        self.assertEqual(self._get_codec_id(), 1)
+        self.assertLess(os.path.getsize(self.filename), 10_000)
+
+    def test_incompressible_data_are_not_compressed(self):
+        self.serializer.save(self.incompressible_data, self.filename)
+        actual = self.serializer.load(self.filename)
+
+        self.assertEqual(self.incompressible_data, actual)
+        self.assertEqual(self._get_codec_id(), 0)
+
+    def test_incompressible_type_skipped(self):
+        self.serializer.save(self.incompressible_data, self.filename)
+
+        # The bytes are compressible now, but the type is skipped
+        self.serializer.save(b'a' * 100_000, self.filename)
+
+        self.assertEqual(self._get_codec_id(), 0)
+
+    def test_non_adaptive_compresses_always(self):
+        serializer = CompressingSerializer(adaptive=False)
+
+        serializer.save(self.incompressible_data, self.filename)
+        actual = serializer.load(self.filename)
+
+        self.assertEqual(self.incompressible_data, actual)
+        self.assertEqual(self._get_codec_id(), 1)
+
+    def test_codec_by_type(self):
+        serializer = CompressingSerializer(codecs_by_type={list: 'lzma'})
+
+        serializer.save(self.compressible_data, self.filename)
+        actual = serializer.load(self.filename)
+
+        self.assertEqual(self.compressible_data, actual)
+        self.assertEqual(self._get_codec_id(), 2)
+
+    def test_codec_by_type_name(self):
+        serializer = CompressingSerializer(
+            codecs_by_type={'builtins.list': 'none'}
+        )
+
+        serializer.save(self.compressible_data, self.filename)
+
+        self.assertEqual(self._get_codec_id(), 0)
+
+    def test_load_with_other_configuration(self):
+        CompressingSerializer('lzma').save(self.compressible_data,
+                                           self.filename)
+
+        actual = CompressingSerializer('zlib').load(self.filename)
+
+        self.assertEqual(self.compressible_data, actual)
+
+    def test_unknown_codec(self):
+        self.assertRaises(ValueError, CompressingSerializer, 'zip')
+
+    def test_load_foreign_file(self):
+        with open(self.filename, 'wb') as f:
+            f.write(b'not written by the serializer')
+
+        self.assertRaises(ValueError, self.serializer.load, self.filename)
+
+    def _get_codec_id(self):
+        with open(self.filename, 'rb') as f:
+            return f.read(5)[4]
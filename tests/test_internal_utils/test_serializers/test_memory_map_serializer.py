@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+
+from tests.test_internal_utils.test_serializers.test_serializer \
+    import BaseTestClassWrapper
+from neads._internal_utils.serializers.memory_map_serializer import \
+    MemoryMapSerializer
+
+
+class TestMemoryMapSerializer(BaseTestClassWrapper.BaseTestSerializer):
+    """Tests serializer with memory-mapped out-of-band buffers."""
+
+    def get_serializer(self):
+        return MemoryMapSerializer()
+
+    def test_save_load_ndarray(self):
+        data = np.arange(10_000.).reshape(100, 100)
+
+        self.serializer.save(data, self.filename)
+        actual = self.serializer.load(self.filename)
+
+        np.testing.assert_array_equal(data, actual)
+
+    def test_loaded_ndarray_is_read_only(self):
+        self.serializer.save(np.arange(10_000.), self.filename)
+
+        actual = self.serializer.load(self.filename)
+
+        self.assertFalse(actual.flags.writeable)
+        self.assertRaises(ValueError, actual.__setitem__, 0, 1.)
+
+    def test_small_ndarray_in_band(self):
+        data = np.arange(10.)
+
+        self.serializer.save(data, self.filename)
+        actual = self.serializer.load(self.filename)
+
+        np.testing.assert_array_equal(data, actual)
+
+    def test_non_contiguous_ndarray(self):
+        data = np.arange(10_000.).reshape(100, 100)[:, ::2]
+
+        self.serializer.save(data, self.filename)
+        actual = self.serializer.load(self.filename)
+
+        np.testing.assert_array_equal(data, actual)
+
+    def test_save_load_data_frame(self):
+        data = pd.DataFrame({'a': np.arange(10_000),
+                             'b': np.arange(10_000.),
+                             'c': [str(i) for i in range(10_000)]})
+
+        self.serializer.save(data, self.filename)
+        actual = self.serializer.load(self.filename)
+
+        pd.testing.assert_frame_equal(data, actual)
+
+    def test_overwrite_while_loaded(self):
+        data = np.arange(10_000.)
+        self.serializer.save(data, self.filename)
+        loaded = self.serializer.load(self.filename)
+
+        self.serializer.save(np.zeros(100_000), self.filename)
+        actual = self.serializer.load(self.filename)
+
+        np.testing.assert_array_equal(data, loaded)
+        np.testing.assert_array_equal(np.zeros(100_000), actual)
+
+    def test_load_foreign_file(self):
+        with open(self.filename, 'wb') as f:
+            f.write(b'not written by the serializer')
+
+        self.assertRaises(ValueError, self.serializer.load, self.filename)
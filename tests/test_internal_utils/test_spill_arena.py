@@ -0,0 +1,153 @@
+import gc
+import os
+import tempfile
+import unittest
+
+from neads._internal_utils.spill_arena import SpillArena
+from neads._internal_utils.background_writer import BackgroundWriter
+
+
+class TestArenaFile(unittest.TestCase):
+    def setUp(self) -> None:
+        self.arena = SpillArena()
+        self.file = self.arena.create_file()
+        self.object = [1, '10', {}]
+
+    def tearDown(self) -> None:
+        self.arena.close()
+
+    def test_save_load(self):
+        self.file.save(self.object)
+
+        actual = self.file.load()
+
+        self.assertEqual(self.object, actual)
+
+    def test_repeated_load(self):
+        self.file.save(self.object)
+
+        actual_1 = self.file.load()
+        actual_2 = self.file.load()
+
+        self.assertEqual(self.object, actual_1)
+        self.assertEqual(self.object, actual_2)
+
+    def test_repeated_save(self):
+        self.file.save(self.object)
+        self.file.save('new object')
+
+        actual = self.file.load()
+
+        self.assertEqual('new object', actual)
+        self.assertGreater(self.arena.dead_bytes, 0)
+
+    def test_multiple_files(self):
+        other_file = self.arena.create_file()
+
+        self.file.save(self.object)
+        other_file.save('other object')
+
+        self.assertEqual(self.object, self.file.load())
+        self.assertEqual('other object', other_file.load())
+
+    def test_load_before_save(self):
+        self.assertRaises(RuntimeError, self.file.load)
+
+    def test_save_after_dispose(self):
+        self.file.dispose()
+
+        self.assertRaises(RuntimeError, self.file.save, self.object)
+
+    def test_dispose_frees_region(self):
+        self.file.save(self.object)
+        self.file.load()  # The save is done
+        size = self.arena.size
+
+        self.file.dispose()
+
+        self.assertTrue(self.file.is_disposed)
+        self.assertEqual(size, self.arena.dead_bytes)
+
+    def test_implicit_dispose(self):
+        self.file.save(self.object)
+        self.file.load()  # The save is done
+        size = self.arena.size
+
+        self.file = None
+        gc.collect()
+
+        self.assertEqual(size, self.arena.dead_bytes)
+
+    def test_use_after_arena_close(self):
+        self.file.save(self.object)
+        self.file.load()  # The save is done
+
+        self.arena.close()
+
+        self.assertTrue(self.file.is_disposed)
+        self.assertRaises(RuntimeError, self.file.load)
+
+
+class TestArenaFileWithWriter(TestArenaFile):
+    def setUp(self) -> None:
+        super().setUp()
+        self.writer = BackgroundWriter()
+        self.file = self.arena.create_file(writer=self.writer)
+
+    def tearDown(self) -> None:
+        self.writer.close()
+        super().tearDown()
+
+    def test_implicit_dispose_without_wait(self):
+        self.file.save(self.object)
+        other_file = self.arena.create_file(writer=self.writer)
+        other_file.save(self.object)
+        other_file.load()  # The saves are done in order
+        size = self.arena.size - len(self.arena.read(other_file._id))
+
+        # The writer does not keep the file alive
+        self.file = None
+        gc.collect()
+
+        self.assertEqual(size, self.arena.dead_bytes)
+
+
+class TestSpillArena(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.arena = SpillArena(self.directory, min_compaction_size=0)
+
+    def tearDown(self) -> None:
+        self.arena.close()
+        os.rmdir(self.directory)
+
+    def test_arena_in_given_directory(self):
+        self.assertEqual(self.directory, os.path.dirname(self.arena.path))
+
+    def test_compaction(self):
+        files = [self.arena.create_file() for _ in range(10)]
+        for i, file in enumerate(files):
+            file.save(str(i) * 1000)
+        old_path = self.arena.path
+
+        for file in files[:8]:
+            file.dispose()
+
+        self.assertNotEqual(old_path, self.arena.path)
+        self.assertFalse(os.path.exists(old_path))
+        self.assertLess(self.arena.size, 5000)
+        self.assertLess(self.arena.size - self.arena.dead_bytes, 3000)
+        self.assertEqual('8' * 1000, files[8].load())
+        self.assertEqual('9' * 1000, files[9].load())
+
+    def test_close_removes_file(self):
+        path = self.arena.path
+
+        self.arena.close()
+
+        self.assertTrue(self.arena.is_closed)
+        self.assertFalse(os.path.exists(path))
+
+
+if __name__ == '__main__':
+    unittest.main()